@@ -22,6 +22,8 @@ from org_tools.brain.notion.data import (
     notion_user_id_type,
 )
 from org_tools.brain.notion.notion_functions import (
+    bulk_create_tasks,
+    bulk_update_tasks,
     create_task,
     get_active_projects,
     get_active_tasks,
@@ -119,6 +121,8 @@ class NotionCRUDEngineV3(Engine):
         await self._tool_manager.register_tool(get_active_tasks)
         await self._tool_manager.register_tool(create_task)
         await self._tool_manager.register_tool(update_task)
+        await self._tool_manager.register_tool(bulk_create_tasks)
+        await self._tool_manager.register_tool(bulk_update_tasks)
         await self._tool_manager.register_tool(get_all_users)
         await self._tool_manager.register_tool(store_fact)
         await self._tool_manager.register_tool(send_email)
@@ -275,6 +279,45 @@ class NotionCRUDEngineV3(Engine):
                             )
                             continue
 
+                    if tool_call_obj.name in ("bulk_update_tasks", "bulk_create_tasks"):
+                        # one confirmation for the whole batch, with names patched in like above
+                        temp = json.loads(tool_call.function.arguments)
+                        items = temp.get("updates") or temp.get("tasks") or []
+                        for item in items:
+                            if item.get("notion_task_id"):
+                                item["notion_task_id"] = self._temp_task_lookup.get(
+                                    item["notion_task_id"], {}
+                                ).get("name", item["notion_task_id"])
+                            if item.get("notion_project_id"):
+                                item["notion_project_id"] = self._temp_project_lookup.get(
+                                    item["notion_project_id"], item["notion_project_id"]
+                                )
+                            if item.get("user_id"):
+                                user_data = get_user_from_notion_id(
+                                    notion_user_id_type(item["user_id"])
+                                )
+                                item["user_id"] = (
+                                    user_data.name if user_data else "Unknown User"
+                                )
+                        action = (
+                            "Updating"
+                            if tool_call_obj.name == "bulk_update_tasks"
+                            else "Creating"
+                        )
+                        result = await self._message_bus.execute(
+                            NotionCRUDEngineConfirmationCommand(
+                                prompt=f"{action} {len(items)} tasks {items}",
+                                session_id=self._session_id,
+                            )
+                        )
+                        if not result.result:
+                            self._context_manager.store_tool_call_result(
+                                tool_call_id=tool_call_obj.id,
+                                name=tool_call_obj.name,
+                                content="User purposefully denied tool execution, it was not successful, use this informormation in final response.",
+                            )
+                            continue
+
                     # Execute the tool
                     await self._message_bus.publish(
                         NotionCRUDEngineStatusEvent(
@@ -284,7 +327,7 @@ class NotionCRUDEngineV3(Engine):
                     )
                     result = await self._tool_manager.execute_tool_call(tool_call_obj)
                     # Convert result to string if needed for history
-                    if isinstance(result, dict):
+                    if isinstance(result, (dict, list)):
                         result_str = json.dumps(result)
                     else:
                         result_str = str(result)
@@ -13,11 +13,12 @@ from typing import Optional
 import discord
 
 from llmgine.llm import SessionID
-from org_tools.general.functions import get_all_facts, get_user_info
+from org_tools.general.functions import get_author_context_async
 from org_tools.brain.notion.data import (
     UserData,
     discord_user_id_type,
     get_user_from_discord_id,
+    user_directory,
 )
 
 from .config import DiscordBotConfig
@@ -30,6 +31,9 @@ class MessageProcessor:
     def __init__(self, config: DiscordBotConfig, session_manager: SessionManager):
         self.config = config
         self.session_manager = session_manager
+        # Seed the user directory now and load it from Postgres in the background,
+        # so the first mention doesn't wait on the database inside the event loop
+        user_directory.start()
 
     async def process_mention(
         self, message: discord.Message
@@ -42,7 +46,7 @@ class MessageProcessor:
 
         # Process user mentions
         user_mentions = self._process_mentions(message)
-        author_payload = self._create_author_payload(message)
+        author_payload = await self._create_author_payload(message)
         chat_history = await self._get_chat_history(message)
         reply_payload = await self._process_reply(message)
 
@@ -69,15 +73,14 @@ class MessageProcessor:
                 mentions_payload.append({discord_id: "Unknown Notion ID"})
         return str(mentions_payload)
 
-    def _create_author_payload(self, message: discord.Message) -> str:
+    async def _create_author_payload(self, message: discord.Message) -> str:
         """Create payload for the message author."""
         author_discord_id = discord_user_id_type(str(message.author.id))
         author_data: UserData | None = get_user_from_discord_id(author_discord_id)
         author_notion_id = "Unknown Notion ID"
         if author_data:
             author_notion_id = author_data.notion_id
-        author_info = get_user_info(author_discord_id)
-        author_facts = get_all_facts(author_discord_id)
+        author_info, author_facts = await get_author_context_async(author_discord_id)
         return (
             "The Author of this message is:"
             + str({author_discord_id: author_notion_id})
@@ -0,0 +1,372 @@
+import json
+import multiprocessing
+import os
+import shutil
+import subprocess
+import threading
+import time
+import wave
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, BinaryIO, Deque, Dict, Optional
+
+# Discord voice is 48kHz, 16-bit stereo PCM
+SAMPLE_RATE = 48000
+CHANNELS = 2
+SAMPLE_WIDTH = 2
+FRAME_BYTES = CHANNELS * SAMPLE_WIDTH
+PCM_BYTES_PER_SECOND = SAMPLE_RATE * FRAME_BYTES
+# Audio held per speaker while the disk catches up; beyond this packets are dropped
+BUFFER_SECONDS = 10
+# The writer flushes every FLUSH_INTERVAL seconds, or sooner once a buffer passes FLUSH_BYTES
+FLUSH_INTERVAL = 1.0
+FLUSH_BYTES = PCM_BYTES_PER_SECOND // 2
+# Each speaker's audio is split into files covering this much of the meeting timeline
+SEGMENT_SECONDS = 300
+# A packet arriving this much later than the end of the previous one starts a new run;
+# the gap in between is silence and is recorded in the index rather than written out
+GAP_TOLERANCE_SECONDS = 0.1
+# Segments are re-encoded to Opus at this bitrate when ffmpeg is available
+OPUS_BITRATE = "32k"
+
+
+def encode_segment(pcm_path: str, codec: str = "opus") -> str:
+    """
+    Wrap a raw PCM segment in a WAV container and, for codec "opus", encode it with
+    ffmpeg. Runs in the encoder process pool; the source file is removed on success.
+
+    Returns:
+        Path of the encoded file
+    """
+    stem = os.path.splitext(pcm_path)[0]
+    wav_path = stem + ".wav"
+    with open(pcm_path, "rb") as src, wave.open(wav_path, "wb") as wav:
+        wav.setnchannels(CHANNELS)
+        wav.setsampwidth(SAMPLE_WIDTH)
+        wav.setframerate(SAMPLE_RATE)
+        while chunk := src.read(1 << 20):
+            wav.writeframes(chunk)
+    os.remove(pcm_path)
+
+    ffmpeg = shutil.which("ffmpeg")
+    if codec != "opus" or ffmpeg is None:
+        return wav_path
+    opus_path = stem + ".opus"
+    subprocess.run(
+        [ffmpeg, "-loglevel", "error", "-y", "-i", wav_path, "-c:a", "libopus", "-b:a", OPUS_BITRATE, opus_path],
+        check=True,
+    )
+    os.remove(wav_path)
+    return opus_path
+
+
+class RingBuffer:
+    """
+    Fixed-size byte ring shared by one producer (the event loop) and one consumer (the
+    writer thread). Writes that don't fit are refused rather than blocking the producer.
+    """
+
+    def __init__(self, capacity: int):
+        self._buffer = bytearray(capacity)
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def write(self, data: bytes) -> bool:
+        """Append data, or return False without writing anything if it doesn't fit"""
+        length = len(data)
+        with self._lock:
+            if self._size + length > self._capacity:
+                return False
+            end = (self._start + self._size) % self._capacity
+            first = min(length, self._capacity - end)
+            self._buffer[end:end + first] = data[:first]
+            self._buffer[:length - first] = data[first:]
+            self._size += length
+            return True
+
+    def drain(self) -> bytes:
+        """Remove and return everything buffered"""
+        with self._lock:
+            if not self._size:
+                return b""
+            end = self._start + self._size
+            view = memoryview(self._buffer)
+            if end <= self._capacity:
+                data = bytes(view[self._start:end])
+            else:
+                data = bytes(view[self._start:]) + bytes(view[:end - self._capacity])
+            self._start = end % self._capacity
+            self._size = 0
+            return data
+
+
+@dataclass
+class SpeakerStats:
+    packets_received: int = 0
+    packets_dropped: int = 0
+    bytes_dropped: int = 0
+    bytes_written: int = 0
+    writes: int = 0
+    runs: int = 0
+
+
+@dataclass
+class _Run:
+    # Position in the speaker's stream of accepted bytes where the run starts
+    stream_offset: int
+    # Where the run starts on the shared meeting timeline
+    start_sample: int
+
+
+@dataclass
+class _Speaker:
+    buffer: RingBuffer
+    stats: SpeakerStats = field(default_factory=SpeakerStats)
+    # Appended by submit() before the run's bytes reach the buffer, consumed by the writer
+    runs: Deque[_Run] = field(default_factory=deque)
+
+    # Event loop side
+    accepted_bytes: int = 0
+    # Timeline position just past the last accepted packet; runs never start before it
+    next_sample: int = 0
+    # Set after a drop so the next packet starts a new run instead of closing the hole
+    new_run: bool = True
+
+    # Writer thread side
+    consumed_bytes: int = 0
+    cursor: int = 0
+    segment_index: Optional[int] = None
+    segment_file: Optional[BinaryIO] = None
+    segment_path: str = ""
+    segment_samples: int = 0
+    # Index entry being extended while the run continues in the same segment
+    pending: Optional[Dict[str, int]] = None
+
+
+class AudioWriter:
+    """
+    Records each speaker to rotating, timeline-aligned segments from a dedicated thread.
+
+    submit() stamps each packet with its arrival time on the meeting timeline and copies it
+    into the speaker's ring buffer, so the event loop never touches the disk. When the disk
+    falls more than BUFFER_SECONDS behind, new packets are dropped and counted instead of
+    stalling the bot.
+
+    The writer thread drains the buffers in large chunks into one file per speaker per
+    SEGMENT_SECONDS of timeline. Only voiced audio is written: each contiguous run is logged
+    to timeline.jsonl with its offset in the segment and its start on the shared timeline,
+    which is enough to line speakers up. Closed segments are wrapped in WAV and encoded to
+    Opus by a process pool, off the bot process.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "recordings",
+        buffer_seconds: float = BUFFER_SECONDS,
+        segment_seconds: float = SEGMENT_SECONDS,
+        codec: Optional[str] = None,
+        encoder_workers: int = 2,
+    ):
+        self.started_at = datetime.now()
+        self.output_dir = os.path.join(output_dir, self.started_at.strftime("%Y%m%d-%H%M%S"))
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.buffer_bytes = int(PCM_BYTES_PER_SECOND * buffer_seconds)
+        self.segment_samples = int(SAMPLE_RATE * segment_seconds)
+        self.gap_tolerance = int(SAMPLE_RATE * GAP_TOLERANCE_SECONDS)
+        self.codec = codec or os.getenv("RECORDER_CODEC", "opus")
+        self._origin = time.monotonic()
+        self._speakers: Dict[int, _Speaker] = {}
+
+        self._index_lock = threading.Lock()
+        self._index = open(os.path.join(self.output_dir, "timeline.jsonl"), "a")
+        self._write_index({
+            "type": "recording",
+            "started_at": self.started_at.isoformat(),
+            "sample_rate": SAMPLE_RATE,
+            "channels": CHANNELS,
+            "sample_width": SAMPLE_WIDTH,
+            "segment_samples": self.segment_samples,
+        })
+
+        # forkserver rather than fork, which would copy locks held by the bot's other threads
+        self._encoders = ProcessPoolExecutor(
+            max_workers=encoder_workers, mp_context=multiprocessing.get_context("forkserver")
+        )
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="audio-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def stats(self) -> Dict[int, SpeakerStats]:
+        return {user_id: speaker.stats for user_id, speaker in list(self._speakers.items())}
+
+    def _write_index(self, entry: Dict[str, Any]) -> None:
+        # Encoder callbacks write from the pool's management thread
+        with self._index_lock:
+            self._index.write(json.dumps(entry) + "\n")
+            self._index.flush()
+
+    def submit(self, user_id: int, data: bytes, arrival: Optional[float] = None) -> bool:
+        """
+        Queue a packet for writing; returns False if it was dropped. Never blocks on I/O.
+
+        Args:
+            user_id: Speaker the packet belongs to
+            data: Decrypted PCM
+            arrival: time.monotonic() when the packet arrived, defaults to now
+        """
+        speaker = self._speakers.get(user_id)
+        if speaker is None:
+            speaker = self._speakers[user_id] = _Speaker(RingBuffer(self.buffer_bytes))
+        stats = speaker.stats
+        stats.packets_received += 1
+
+        arrival_sample = int(((arrival or time.monotonic()) - self._origin) * SAMPLE_RATE)
+        # Packets within the tolerance continue the run back to back, absorbing network jitter
+        if speaker.new_run or arrival_sample - speaker.next_sample > self.gap_tolerance:
+            # Jitter-packed runs can sit ahead of the wall clock, so never start behind them
+            start_sample = max(arrival_sample, speaker.next_sample)
+            speaker.runs.append(_Run(speaker.accepted_bytes, start_sample))
+            speaker.new_run = False
+        else:
+            start_sample = speaker.next_sample
+
+        if not speaker.buffer.write(data):
+            if not stats.packets_dropped:
+                print(f"Audio writer is behind, dropping packets for user {user_id}")
+            stats.packets_dropped += 1
+            stats.bytes_dropped += len(data)
+            # The hole means whatever comes next starts a new run
+            speaker.new_run = True
+            self._wake.set()
+            return False
+
+        speaker.accepted_bytes += len(data)
+        speaker.next_sample = start_sample + len(data) // FRAME_BYTES
+        if len(speaker.buffer) >= FLUSH_BYTES:
+            self._wake.set()
+        return True
+
+    def _emit_pending(self, user_id: int, speaker: _Speaker) -> None:
+        if speaker.pending:
+            self._write_index({"type": "run", "user_id": user_id, **speaker.pending})
+            speaker.stats.runs += 1
+            speaker.pending = None
+
+    def _close_segment(self, user_id: int, speaker: _Speaker) -> None:
+        self._emit_pending(user_id, speaker)
+        if speaker.segment_file is None:
+            return
+        speaker.segment_file.close()
+        speaker.segment_file = None
+        segment_index = speaker.segment_index
+        future = self._encoders.submit(encode_segment, speaker.segment_path, self.codec)
+
+        def record(future: Future) -> None:
+            try:
+                path = future.result()
+            except Exception as e:
+                # Whatever was left behind (PCM or WAV) can be re-encoded by hand
+                print(f"Failed to encode segment {segment_index} for user {user_id}: {e}")
+                return
+            self._write_index({
+                "type": "segment", "user_id": user_id, "segment": segment_index, "file": os.path.basename(path)
+            })
+
+        future.add_done_callback(record)
+
+    def _write_chunk(self, user_id: int, speaker: _Speaker, chunk: bytes) -> None:
+        segment_index = speaker.cursor // self.segment_samples
+        if speaker.segment_file is None or speaker.segment_index != segment_index:
+            self._close_segment(user_id, speaker)
+            speaker.segment_index = segment_index
+            speaker.segment_path = os.path.join(self.output_dir, f"user_{user_id}_{segment_index:04d}.pcm")
+            speaker.segment_file = open(speaker.segment_path, "ab")
+            speaker.segment_samples = 0
+
+        pending = speaker.pending
+        if pending is None or pending["start_sample"] + pending["samples"] != speaker.cursor:
+            self._emit_pending(user_id, speaker)
+            pending = speaker.pending = {
+                "segment": segment_index,
+                "segment_offset": speaker.segment_samples,
+                "start_sample": speaker.cursor,
+                "samples": 0,
+            }
+
+        speaker.segment_file.write(chunk)
+        samples = len(chunk) // FRAME_BYTES
+        pending["samples"] += samples
+        speaker.segment_samples += samples
+        speaker.cursor += samples
+        speaker.stats.bytes_written += len(chunk)
+        speaker.stats.writes += 1
+
+    def _flush_speaker(self, user_id: int, speaker: _Speaker) -> None:
+        data = speaker.buffer.drain()
+        start = speaker.consumed_bytes
+        position = 0
+        while position < len(data):
+            # Runs starting at or before this byte move the cursor to their timeline position
+            while speaker.runs and speaker.runs[0].stream_offset <= start + position:
+                # Never move back over written audio, which may be in an already closed segment
+                speaker.cursor = max(speaker.cursor, speaker.runs.popleft().start_sample)
+            end = len(data)
+            if speaker.runs:
+                end = min(end, speaker.runs[0].stream_offset - start)
+            # Don't let a chunk cross into the next segment
+            segment_end = (speaker.cursor // self.segment_samples + 1) * self.segment_samples
+            end = min(end, position + (segment_end - speaker.cursor) * FRAME_BYTES)
+            self._write_chunk(user_id, speaker, data[position:end])
+            position = end
+        speaker.consumed_bytes += len(data)
+
+    def _flush(self) -> bool:
+        """Write out every buffer; returns False if any write failed"""
+        ok = True
+        # Snapshot: submit() may add speakers while we iterate
+        for user_id, speaker in list(self._speakers.items()):
+            try:
+                self._flush_speaker(user_id, speaker)
+            except OSError as e:
+                print(f"Audio writer failed to write for user {user_id}: {e}")
+                ok = False
+        return ok
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(FLUSH_INTERVAL)
+            self._wake.clear()
+            if not self._flush():
+                # Back off: buffers fill up and drops are counted until the disk recovers
+                time.sleep(FLUSH_INTERVAL)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the writer thread, write out what's left and wait for the last segments to be
+        encoded. Blocks on I/O.
+        """
+        self._stopping = True
+        self._wake.set()
+        self._thread.join(timeout)
+        self._flush()
+        for user_id, speaker in self._speakers.items():
+            self._close_segment(user_id, speaker)
+        self._encoders.shutdown(wait=True)
+        self._index.close()
+
+    def summary(self) -> str:
+        return f"Recorded to {self.output_dir}\n" + "\n".join(
+            f"user {user_id}: {stats.packets_received} packets, {stats.bytes_written} bytes in "
+            f"{stats.writes} writes and {stats.runs} runs, "
+            f"{stats.packets_dropped} dropped ({stats.bytes_dropped} bytes)"
+            for user_id, stats in self.stats.items()
+        )
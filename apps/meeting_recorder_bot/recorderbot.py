@@ -3,6 +3,9 @@ import asyncio
 import discord 
 from discord.ext import commands
 import os
+import time
+
+from audio_writer import AudioWriter
 
 
 dotenv.load_dotenv()
@@ -20,22 +23,17 @@ bot = commands.Bot(command_prefix="!", intents=intents)
 class VoiceRecord(discord.VoiceClient):
     def __init__(self, bot, channel):
         super().__init__(bot, channel)
-        self.user_audio_files = {}
+        # Buffers packets in memory and writes them from its own thread, off the event loop
+        self.audio_writer = AudioWriter()
 
     async def packets_handler(self, packet):
-        user_id = packet.user_id
-        data = packet.decrypted_data
-        
-        if user_id not in self.user_audio_files:
-            f = open(f"user_{user_id}.pcm", "ab")
-            self.user_audio_files[user_id] = f
-        else:
-            f = self.user_audio_files[user_id]
-        f.write(data)
+        # Stamped on arrival so every speaker is placed on the same timeline
+        self.audio_writer.submit(packet.user_id, packet.decrypted_data, time.monotonic())
 
     async def disconnect(self):
-        for user_id, f in self.user_audio_files.items():
-            f.close()
+        # The final flush blocks on disk I/O, keep it off the event loop too
+        await asyncio.to_thread(self.audio_writer.close)
+        print(self.audio_writer.summary())
         await super().disconnect()
 
 @bot.event
@@ -45,4 +43,9 @@ async def on_ready():
     vc = await channel.connect(cls=VoiceRecord)
     print(f"Connected to {channel}")
 
-bot.run(TOKEN)
\ No newline at end of file
+def main():
+    bot.run(TOKEN)
+
+# Guarded so the audio encoder processes can import this module without starting the bot
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -17,6 +17,7 @@ from custom_tools.brain.notion.data import (
     UserData,
     discord_user_id_type,
     get_user_from_discord_id,
+    user_directory,
 )
 
 from config import DiscordBotConfig
@@ -29,6 +30,9 @@ class MessageProcessor:
     def __init__(self, config: DiscordBotConfig, session_manager: SessionManager):
         self.config = config
         self.session_manager = session_manager
+        # Seed the user directory now and load it from Postgres in the background,
+        # so the first mention doesn't wait on the database inside the event loop
+        user_directory.start()
 
     async def process_mention(
         self, message: discord.Message
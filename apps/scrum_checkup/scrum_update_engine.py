@@ -20,7 +20,7 @@ from llmgine.llm.providers.response import LLMResponse
 from custom_tools.brain.postgres.postgres import get_committee_member_by_discord_id
 from custom_types.discord import DiscordChannelID, DiscordUserID
 from custom_types.notion import NotionUserID
-from custom_tools.brain.notion.notion_functions import update_task, update_task_progress
+from custom_tools.brain.notion.notion_functions import bulk_update_tasks, update_task, update_task_progress
 from scrum_checkup_types import CheckUpEventContext
 
 
@@ -186,6 +186,7 @@ async def useScrumUpdateEngine(checkup_context: CheckUpEventContext):
     engine = ScrumUpdateEngine(
         system_prompt=f"""You will be given a conversation between {user_name} and a scrum master. You will then schedule the next scrum time based on the conversation. The current datetime is {datetime.now()}.
         For tasks mentioned in the conversation, you will need to update the task status when necessary. ie. if the user says "I have finished task 1", you will need to update the task status to "Done".
+        When several tasks need updating, update them all with a single bulk_update_tasks call instead of one update_task call per task.
         For every task mentioned in the conversation, you will need to update the task progress using the update_task_progress tool.
         """,
         session_id=SessionID(str(uuid.uuid4())),
@@ -193,6 +194,7 @@ async def useScrumUpdateEngine(checkup_context: CheckUpEventContext):
     )
     await engine.tool_manager.register_tool(engine.schedule_next_scrum)
     await engine.tool_manager.register_tool(update_task)
+    await engine.tool_manager.register_tool(bulk_update_tasks)
     await engine.tool_manager.register_tool(update_task_progress)
     await engine.handle_command(
         ScrumUpdateCommand(prompt=str(checkup_context.conversation))
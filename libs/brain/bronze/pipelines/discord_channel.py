@@ -2,7 +2,7 @@ import argparse
 import os
 import asyncio
 from dotenv import load_dotenv
-from bronze.extractors.discord_extractor import DiscordExtractor
+from bronze.src.extractor.discord_extractor import DiscordExtractor
 from bronze.utils.pipeline import Pipeline
 import sqlalchemy as sa
 
@@ -16,23 +16,24 @@ def main():
     
     # Load environment variables
     load_dotenv()
-    DARCY_KEY = os.getenv('DARCY_KEY') # Basically an authorised discord client
-    TEST_SERVER_ID = os.getenv('TEST_SERVER_ID') # The server id of the AI server
+    bot_key = os.getenv('BOT_KEY') # Basically an authorised discord client
+    server_id = os.getenv('TEST_SERVER_ID') # The server id of the AI server
 
-    if not DARCY_KEY or not TEST_SERVER_ID:
-        raise ValueError("DARCY_KEY and TEST_SERVER_ID must be set in .env file")
+    if not bot_key or not server_id:
+        raise ValueError("Bot Key and Server ID must be set in .env file")
     
     # DISCORD CHANNELS --------------------------------------------------------------------- */
-    discord_channels_extractor = DiscordExtractor(DARCY_KEY, TEST_SERVER_ID)
+    # The extractor reads BOT_KEY and TEST_SERVER_ID itself
+    discord_channels_extractor = DiscordExtractor()
     discord_channels_pipeline = Pipeline(
-        ddl_filepath = 'create_discord_channels_table.sql',
-        table_name = 'discord_channels',
+        ddl_filepath = 'discord_channel.sql',
+        table_name = 'discord_channel',
+        conflict_key = ['channel_id'],
     )
 
     # Follows an ETL process
     raw_data = asyncio.run(discord_channels_extractor.fetch_discord_channels()) # Extract
-    if discord_channels_extractor.recreate_table:
-        discord_channels_pipeline.create_table() # Transform
+    discord_channels_pipeline.create_table() # Idempotent, the DDL only creates missing objects
     discord_channels_pipeline.ingest_from_df(asyncio.run(discord_channels_extractor.parse_discord_data(raw_data))) # Load
     discord_channels_pipeline.test_run_status()
 
@@ -2,8 +2,10 @@ import argparse
 import os
 import asyncio
 from dotenv import load_dotenv
-from bronze.extractors.discord_extractor import DiscordExtractor
+from bronze.src.extractor.discord_extractor import DiscordExtractor, ExtractMode
+from bronze.src.extractor.discord_checkpoints import ChatCheckpointStore
 from bronze.utils.pipeline import Pipeline
+from bronze.utils.stream_loader import StreamingCopyLoader, DISCORD_CHAT_COLUMNS
 import sqlalchemy as sa
 
 
@@ -12,6 +14,10 @@ def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Discord data pipeline')
     parser.add_argument('--input-path', required=True, help='Path to input file')
+    parser.add_argument('--mode', choices=[m.value for m in ExtractMode], default=ExtractMode.INCREMENTAL.value,
+                        help='incremental: only messages after the stored checkpoints, backfill: full history (resumable)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Channels/threads fetched in parallel')
+    parser.add_argument('--batch-size', type=int, default=5000, help='Messages per COPY batch')
     args = parser.parse_args()
     
     # Load environment variables
@@ -23,16 +29,26 @@ def main():
         raise ValueError("Bot Key and Server ID must be set in .env file")
 
     # DISCORD CHAT --------------------------------------------------------------------- */
-    discord_chat_extractor = DiscordExtractor(bot_key, server_id)
+    discord_chat_extractor = DiscordExtractor(
+        checkpoint_store=ChatCheckpointStore(),
+        checkpoint_every=args.batch_size,
+        concurrency=args.concurrency,
+    )
     discord_chat_pipeline = Pipeline(
-        ddl_filepath = 'create_discord_chat_table.sql',
+        ddl_filepath = 'discord_chat.sql',
         table_name = 'discord_chat',
+        batch_size = args.batch_size,
     )
-
-    raw_data = asyncio.run(discord_chat_extractor.fetch_discord_chat()) # Extract
-    if discord_chat_extractor.recreate_table:
-        discord_chat_pipeline.create_table() # Transform                            
-    discord_chat_pipeline.ingest_from_df(asyncio.run(discord_chat_extractor.parse_discord_data(raw_data))) # Load
+    discord_chat_loader = StreamingCopyLoader(discord_chat_pipeline, DISCORD_CHAT_COLUMNS)
+
+    discord_chat_pipeline.create_table() # Idempotent, the DDL only creates missing objects
+    # Extract and load together: each source's messages are COPYed in batches as they are
+    # fetched, and its checkpoint only advances once the batch is stored
+    with discord_chat_pipeline.run():
+        asyncio.run(discord_chat_extractor.fetch_discord_chat(
+            ExtractMode(args.mode),
+            on_batch=discord_chat_loader.write_batch,
+        ))
     discord_chat_pipeline.test_run_status()
 
 if __name__ == "__main__":
@@ -0,0 +1,11 @@
+-- Create a table for storing per-channel / per-thread Discord chat extraction checkpoints
+CREATE TABLE IF NOT EXISTS bronze.discord_chat_checkpoint (
+    source_id BIGINT PRIMARY KEY,               -- channel_id for channels, thread_id for threads
+    channel_id BIGINT NOT NULL,
+    thread_id BIGINT,
+    last_message_id BIGINT,                     -- high-water mark used by incremental runs
+    backfill_message_id BIGINT,                 -- position of an in-progress full backfill (NULL when none)
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_discord_chat_checkpoint_channel_id ON bronze.discord_chat_checkpoint(channel_id);
@@ -0,0 +1,25 @@
+-- Create a table mirroring the Gmail mailbox, kept current from users.history.list
+CREATE TABLE IF NOT EXISTS bronze.gmail_message (
+    account TEXT NOT NULL,                      -- mailbox address from users.getProfile
+    message_id TEXT NOT NULL,
+    thread_id TEXT,
+    label_ids TEXT[] NOT NULL DEFAULT '{}',
+    sender TEXT,
+    subject TEXT,
+    snippet TEXT,
+    headers JSONB NOT NULL,                     -- non X- headers, as read_emails returns them
+    body TEXT,
+    received_at TIMESTAMP NOT NULL,             -- Gmail internalDate, UTC
+    ingestion_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (account, message_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_gmail_message_account_received_at ON bronze.gmail_message(account, received_at DESC);
+
+-- Mailbox position each account was last synced to
+CREATE TABLE IF NOT EXISTS bronze.gmail_sync_state (
+    account TEXT PRIMARY KEY,
+    history_id BIGINT NOT NULL,
+    last_sync_at TIMESTAMP NOT NULL,
+    last_full_sync_at TIMESTAMP
+);
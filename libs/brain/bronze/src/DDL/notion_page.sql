@@ -0,0 +1,20 @@
+-- Create a table mirroring raw Notion database pages (Tasks, Events/Projects, Teams, Documents)
+CREATE TABLE IF NOT EXISTS bronze.notion_page (
+    page_id TEXT PRIMARY KEY,
+    database_id TEXT NOT NULL,
+    page JSONB NOT NULL,                        -- page object exactly as returned by databases.query
+    created_time TIMESTAMPTZ NOT NULL,
+    last_edited_time TIMESTAMPTZ NOT NULL,
+    seen_at TIMESTAMPTZ NOT NULL,               -- start of the last sync that returned this page
+    ingestion_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_notion_page_database_id_last_edited_time ON bronze.notion_page(database_id, last_edited_time);
+
+-- Per-database sync progress
+CREATE TABLE IF NOT EXISTS bronze.notion_sync_state (
+    database_id TEXT PRIMARY KEY,
+    watermark TIMESTAMPTZ,                      -- latest last_edited_time mirrored
+    last_sync_at TIMESTAMPTZ,
+    last_full_sync_at TIMESTAMPTZ               -- last reconciliation that removed deleted/archived pages
+);
@@ -0,0 +1,10 @@
+-- Create a table mirroring the Notion workspace user directory (users.list)
+CREATE TABLE IF NOT EXISTS bronze.notion_user (
+    user_id TEXT PRIMARY KEY,
+    name TEXT,
+    user_type TEXT,                             -- person or bot
+    email TEXT,
+    avatar_url TEXT,
+    seen_at TIMESTAMP NOT NULL,                 -- last refresh that listed this user
+    ingestion_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
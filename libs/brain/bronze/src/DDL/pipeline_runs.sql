@@ -0,0 +1,16 @@
+-- Create a table for tracking bronze ingestion runs and their throughput
+CREATE TABLE IF NOT EXISTS bronze.pipeline_runs (
+    run_id SERIAL PRIMARY KEY,
+    table_name VARCHAR(255) NOT NULL,           -- schema-qualified target table
+    status VARCHAR(32) NOT NULL,                -- succeeded / failed
+    rows_read BIGINT NOT NULL DEFAULT 0,
+    rows_inserted BIGINT NOT NULL DEFAULT 0,
+    rows_updated BIGINT NOT NULL DEFAULT 0,
+    bytes_loaded BIGINT NOT NULL DEFAULT 0,     -- size of the COPY payload sent to Postgres
+    duration_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    error TEXT,
+    started_at TIMESTAMP NOT NULL,
+    finished_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_pipeline_runs_table_name_started_at ON bronze.pipeline_runs(table_name, started_at);
@@ -0,0 +1,68 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class ChatCheckpoint:
+    """Extraction progress for a single channel or thread."""
+    source_id: int
+    channel_id: int
+    thread_id: Optional[int] = None
+    last_message_id: Optional[int] = None
+    backfill_message_id: Optional[int] = None
+
+
+class ChatCheckpointStore:
+    """
+    Persists Discord chat extraction checkpoints in bronze.discord_chat_checkpoint.
+    """
+
+    def __init__(self, engine: Optional[Engine] = None):
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            engine (Engine): SQLAlchemy engine, created from DATABASE_URL if not provided
+        """
+        if engine is None:
+            load_dotenv()
+            database_url = os.getenv("DATABASE_URL")
+            if not database_url:
+                raise ValueError("DATABASE_URL must be set in .env file")
+            engine = create_engine(database_url)
+        self.engine = engine
+
+    def load(self) -> Dict[int, ChatCheckpoint]:
+        """Return all checkpoints keyed by source (channel or thread) ID."""
+        query = text("""
+            SELECT source_id, channel_id, thread_id, last_message_id, backfill_message_id
+            FROM bronze.discord_chat_checkpoint
+        """)
+        with self.engine.connect() as conn:
+            rows = conn.execute(query).mappings().all()
+        return {row["source_id"]: ChatCheckpoint(**row) for row in rows}
+
+    def save(self, checkpoints: Iterable[ChatCheckpoint]) -> None:
+        """Upsert checkpoints. The high-water mark never moves backwards."""
+        rows = [vars(checkpoint) for checkpoint in checkpoints]
+        if not rows:
+            return
+        query = text("""
+            INSERT INTO bronze.discord_chat_checkpoint
+                (source_id, channel_id, thread_id, last_message_id, backfill_message_id, updated_at)
+            VALUES
+                (:source_id, :channel_id, :thread_id, :last_message_id, :backfill_message_id, CURRENT_TIMESTAMP)
+            ON CONFLICT (source_id) DO UPDATE SET
+                last_message_id = GREATEST(
+                    bronze.discord_chat_checkpoint.last_message_id, EXCLUDED.last_message_id
+                ),
+                backfill_message_id = EXCLUDED.backfill_message_id,
+                updated_at = CURRENT_TIMESTAMP
+        """)
+        with self.engine.begin() as conn:
+            conn.execute(query, rows)
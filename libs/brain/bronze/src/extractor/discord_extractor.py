@@ -1,22 +1,45 @@
+import asyncio
 import os
 import ssl
-from typing import List, Dict, Any, Optional
+import time
+from enum import Enum
+from typing import List, Dict, Any, Optional, Callable, Awaitable
 from datetime import datetime
 
 import pandas as pd
-from discord import Client, Intents, TextChannel
+from discord import Client, Intents, Message, Object, TextChannel, Thread
 from dotenv import load_dotenv
 
+from .discord_checkpoints import ChatCheckpoint, ChatCheckpointStore
+
+
+class ExtractMode(Enum):
+    INCREMENTAL = "incremental"
+    BACKFILL = "backfill"
+
 class DiscordExtractor:
     """
     Discord data extractor that:
     - Fetches channel information
-    - Fetches all messages and threads
+    - Fetches all messages and threads, incrementally from stored checkpoints
     - Returns data as pandas DataFrames
     """
     
-    def __init__(self):
-        """Initialize the Discord extractor with configuration and environment variables."""
+    def __init__(
+        self,
+        checkpoint_store: Optional[ChatCheckpointStore] = None,
+        checkpoint_every: int = 1000,
+        concurrency: int = 4,
+    ):
+        """
+        Initialize the Discord extractor with configuration and environment variables.
+        
+        Args:
+            checkpoint_store (ChatCheckpointStore): Where per-channel/thread checkpoints are kept.
+                Without one, every run fetches the full history.
+            checkpoint_every (int): Messages buffered per source before flushing to on_batch and checkpointing
+            concurrency (int): Maximum number of channels/threads fetched in parallel
+        """
         # Disable SSL verification
         ssl._create_default_https_context = ssl._create_unverified_context
         
@@ -34,6 +57,14 @@ class DiscordExtractor:
         self.intents.message_content = True
         self.intents.guilds = True
         self.intents.guild_messages = True
+        
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_every = checkpoint_every
+        self.concurrency = concurrency
+        self.on_batch: Optional[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = None
+        self.messages_data: List[Dict[str, Any]] = []
+        self.pending_checkpoints: Dict[int, ChatCheckpoint] = {}
+        self.source_stats: Dict[int, Dict[str, Any]] = {}
     
     def create_client(self) -> Client:
         """Create and return a new Discord client with configured intents."""
@@ -71,61 +102,168 @@ class DiscordExtractor:
         await client.start(self.token)
         return channels_data
     
+    def _message_record(self, channel: TextChannel, thread: Optional[Thread], message: Message) -> Dict[str, Any]:
+        """Convert a Discord message into a bronze.discord_chat record."""
+        return {
+            "channel_id": channel.id,
+            "channel_name": channel.name,
+            "thread_name": thread.name if thread else None,
+            "thread_id": thread.id if thread else None,
+            "message_id": message.id,
+            "discord_username": str(message.author),        # The user's display name
+            "discord_user_id": message.author.id,           # The user's unique ID
+            "content": message.content,
+            "chat_created_at": message.created_at.isoformat(),
+            "chat_edited_at": message.edited_at.isoformat() if message.edited_at else None,
+            "is_thread": thread is not None
+        }
+    
+    async def _fetch_source_history(
+        self,
+        channel: TextChannel,
+        thread: Optional[Thread],
+        mode: ExtractMode,
+        checkpoint: Optional[ChatCheckpoint],
+    ) -> None:
+        """
+        Fetch one channel or thread oldest-first starting after its checkpoint,
+        flushing its messages and updated checkpoint when done.
+        """
+        source = thread or channel
+        checkpoint = checkpoint or ChatCheckpoint(
+            source_id=source.id,
+            channel_id=channel.id,
+            thread_id=thread.id if thread else None,
+        )
+        
+        if mode == ExtractMode.INCREMENTAL:
+            start_after = checkpoint.last_message_id
+            # Skip sources with nothing newer than the high-water mark
+            if start_after and source.last_message_id and source.last_message_id <= start_after:
+                return
+        else:
+            # Resume an interrupted backfill, otherwise start from the beginning
+            start_after = checkpoint.backfill_message_id
+        
+        after = Object(id=start_after) if start_after else None
+        last_message_id = start_after
+        buffer: List[Dict[str, Any]] = []
+        fetched = 0
+        started = time.perf_counter()
+        
+        # Requests for one source stay sequential; discord.py's HTTP client waits on the
+        # per-route (per-channel) rate-limit bucket and the global limit for us
+        async for message in source.history(limit=None, after=after, oldest_first=True):
+            buffer.append(self._message_record(channel, thread, message))
+            last_message_id = message.id
+            fetched += 1
+            
+            # Messages arrive oldest-first, so everything up to last_message_id is in the batch
+            if self.on_batch and fetched % self.checkpoint_every == 0:
+                if mode == ExtractMode.BACKFILL:
+                    checkpoint.backfill_message_id = last_message_id
+                checkpoint.last_message_id = max(checkpoint.last_message_id or 0, last_message_id)
+                await self._flush(buffer, checkpoint)
+        
+        self._record_throughput(source, fetched, time.perf_counter() - started)
+        
+        if fetched == 0 and mode == ExtractMode.INCREMENTAL:
+            return
+        
+        if last_message_id:
+            checkpoint.last_message_id = max(checkpoint.last_message_id or 0, last_message_id)
+        checkpoint.backfill_message_id = None
+        await self._flush(buffer, checkpoint)
+    
+    def _record_throughput(self, source: TextChannel | Thread, fetched: int, seconds: float) -> None:
+        rate = fetched / seconds if seconds > 0 else 0.0
+        self.source_stats[source.id] = {
+            "name": source.name,
+            "messages": fetched,
+            "seconds": seconds,
+            "messages_per_second": rate,
+        }
+        print(f"Fetched {fetched} messages from {source.name} in {seconds:.1f}s ({rate:.1f} msg/s)")
+    
+    async def _flush(self, buffer: List[Dict[str, Any]], checkpoint: ChatCheckpoint) -> None:
+        """
+        Hand buffered messages to on_batch and persist the checkpoint once they are stored,
+        so an interrupted backfill resumes from here.
+        """
+        if self.on_batch is None:
+            self.messages_data.extend(buffer)
+            buffer.clear()
+            self.pending_checkpoints[checkpoint.source_id] = checkpoint
+            return
+        # Sources run concurrently, so serialise writes to the sink
+        async with self._flush_lock:
+            await self.on_batch(list(buffer))
+            buffer.clear()
+            if self.checkpoint_store:
+                await asyncio.to_thread(self.checkpoint_store.save, [checkpoint])
+    
+    def commit_checkpoints(self) -> None:
+        """Persist checkpoints of the last fetch. Call after its messages have been loaded."""
+        if self.checkpoint_store and self.pending_checkpoints:
+            self.checkpoint_store.save(self.pending_checkpoints.values())
+        self.pending_checkpoints = {}
+    
     # Extract
-    async def fetch_discord_chat(self) -> List[Dict[str, Any]]:
-        """Fetch all messages and threads and return as list of dictionaries."""
+    async def fetch_discord_chat(
+        self,
+        mode: ExtractMode = ExtractMode.INCREMENTAL,
+        on_batch: Optional[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch messages from all channels and threads and return as list of dictionaries.
+        
+        Args:
+            mode: INCREMENTAL fetches only messages after each source's stored high-water mark.
+                BACKFILL re-fetches the full history, resuming an interrupted backfill from its
+                last checkpoint.
+            on_batch: Optional coroutine that stores a batch of messages. When given, messages are
+                flushed every checkpoint_every messages per source (keeping memory bounded) and
+                checkpoints are saved as soon as their batch is stored. Otherwise all messages are returned and checkpoints are saved by
+                commit_checkpoints() once the caller has loaded them.
+        """
         client = self.create_client()
-        messages_data = []
+        checkpoints = self.checkpoint_store.load() if self.checkpoint_store else {}
+        self.on_batch = on_batch
+        self.messages_data = []
+        self.pending_checkpoints = {}
+        self.source_stats = {}
+        self._flush_lock = asyncio.Lock()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def list_sources(channel: TextChannel) -> List[tuple[TextChannel, Optional[Thread]]]:
+            async with semaphore:
+                archived_threads = [t async for t in channel.archived_threads(limit=None)]
+            return [(channel, None), *((channel, t) for t in [*archived_threads, *channel.threads])]
+        
+        async def fetch_source(channel: TextChannel, thread: Optional[Thread]) -> None:
+            async with semaphore:
+                source_id = thread.id if thread else channel.id
+                await self._fetch_source_history(channel, thread, mode, checkpoints.get(source_id))
         
         @client.event
         async def on_ready():
             try:
-                print("Fetching chat history...")
+                print(f"Fetching chat history ({mode.value}, concurrency={self.concurrency})...")
                 guild = client.get_guild(self.guild_id)
                 if not guild:
                     raise ValueError(f"Guild with ID {self.guild_id} not found")
                 
-                for channel in guild.text_channels:
-                    print(f"Processing channel: {channel.name}")
-                    
-                    # Fetch channel messages
-                    async for message in channel.history(limit=None):
-                        messages_data.append({
-                            "channel_id": channel.id,
-                            "channel_name": channel.name,
-                            "thread_name": None,
-                            "thread_id": None,
-                            "message_id": message.id,
-                            "discord_username": str(message.author),        # The user's display name
-                            "discord_user_id": message.author.id,           # The user's unique ID
-                            "content": message.content,
-                            "chat_created_at": message.created_at.isoformat(),
-                            "chat_edited_at": message.edited_at.isoformat() if message.edited_at else None,
-                            "is_thread": False
-                        })
-                    
-                    # Fetch and process threads
-                    threads = [t async for t in channel.archived_threads(limit=None)]
-                    active_threads = channel.threads
-                    
-                    for thread in [*threads, *active_threads]:
-                        print(f"Processing thread: {thread.name}")
-                        async for message in thread.history(limit=None):
-                            messages_data.append({
-                                "channel_id": channel.id,
-                                "channel_name": channel.name,
-                                "thread_name": thread.name,
-                                "thread_id": thread.id,
-                                "message_id": message.id,
-                                "discord_username": str(message.author),        # The user's display name
-                                "discord_user_id": message.author.id,           # The user's unique ID
-                                "content": message.content,
-                                "chat_created_at": message.created_at.isoformat(),
-                                "chat_edited_at": message.edited_at.isoformat() if message.edited_at else None,
-                                "is_thread": True
-                            })
+                started = time.perf_counter()
+                
+                # Fetch channels and threads in parallel, at most `concurrency` at a time
+                source_groups = await asyncio.gather(*(list_sources(channel) for channel in guild.text_channels))
+                sources = [source for group in source_groups for source in group]
+                await asyncio.gather(*(fetch_source(channel, thread) for channel, thread in sources))
                 
-                print("Chat history fetch completed successfully")
+                elapsed = time.perf_counter() - started
+                total = sum(stats["messages"] for stats in self.source_stats.values())
+                print(f"Chat history fetch completed successfully: {total} messages from "
+                      f"{len(sources)} channels/threads in {elapsed:.1f}s")
                 
             except Exception as e:
                 print(f"Error fetching chat history: {str(e)}")
@@ -134,13 +272,15 @@ class DiscordExtractor:
                 await client.close()
         
         await client.start(self.token)
-        return messages_data
+        return self.messages_data
     
     # Transform
     async def parse_discord_data(self, raw_data: List[Dict[str, Any]]) -> pd.DataFrame:
         """Transform raw Discord data into a DataFrame."""
         try:
-            return pd.DataFrame(raw_data)
+            # object dtype keeps IDs as Python ints; with a missing value pandas would make the
+            # column float64 and round snowflakes like thread_id
+            return pd.DataFrame(raw_data, dtype=object)
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error transforming Discord data: {str(e)}")
@@ -5,6 +5,8 @@ import pandas as pd
 from notion_client import Client
 from dotenv import load_dotenv
 
+from .notion_relations import RelationResolver
+
 class NotionExtractor:
     """
     Notion data extractor that:
@@ -12,14 +14,26 @@ class NotionExtractor:
     - Transforms the data into a pandas DataFrame
     - Returns the processed data
     """
+
+    # Relation properties fetch_user_data reads, the only ones worth resolving
+    RELATION_PROPERTIES = ["Team"]
     
-    def __init__(self, api_key: str, database_id: str):
+    def __init__(
+        self,
+        api_key: str,
+        database_id: str,
+        relation_resolver: Optional[RelationResolver] = None,
+        relation_database_ids: Optional[List[str]] = None,
+    ):
         """
         Initialize NotionExtractor with API key and database ID.
         
         Args:
             api_key (str): Notion API key
             database_id (str): Notion database ID
+            relation_resolver (RelationResolver): Resolves relation IDs to titles, a disk-cached one by default
+            relation_database_ids (List[str]): Databases that relations point at (e.g. Teams). When given,
+                each is revalidated with a single query per run instead of per-page retrieves.
         """
         if not api_key:
             raise ValueError("A Notion API Key must be provided in .env file")
@@ -31,13 +45,15 @@ class NotionExtractor:
         self.database_id = database_id
         # Initialize Notion client
         self.client = Client(auth=self.token)
+        self.relation_resolver = relation_resolver or RelationResolver(self.client)
+        self.relation_database_ids = relation_database_ids or []
         self.logger = None
     
     def fetch_user_data(self) -> List[Dict[str, Any]]:
         """
         Fetch raw pages from the Notion Committee database with pagination.
         """
-        results: List[Dict[str, Any]] = []
+        pages: List[Dict[str, Any]] = []
         has_more = True
         start_cursor: Optional[str] = None
 
@@ -47,32 +63,58 @@ class NotionExtractor:
                 page_size=77,
                 start_cursor=start_cursor
             )
-
-            for page in response.get("results", []):
-                props = page.get("properties", {})
-                record = {
-                    "name": self._get_property_value(props.get("Name"), "title"),
-                    "role": self._get_property_value(props.get("Role"), "multi_select"),
-                    "status": self._get_property_value(props.get("Status"), "rich_text"),
-                    "team": self._get_property_value(props.get("Team"), "relation"),
-                    "joined": self._get_property_value(props.get("Joined"), "select"),
-                    "bio": self._get_property_value(props.get("Bio"), "rich_text"),
-                    "email": self._get_property_value(props.get("Email (dscubed)"), "email"),
-                    "discord_tag": self._get_property_value(props.get("Discord Tag"), "rich_text"),
-                    "facebook": self._get_property_value(props.get("Facebook"), "url"),
-                    "instagram": self._get_property_value(props.get("Instagram"), "url"),
-                    "linkedin": self._get_property_value(props.get("LinkedIn"), "url"),
-                    "working_on": self._get_property_value(props.get("I'm Working On"), "rich_text"),
-                    "workload": self._get_property_value(props.get("My Workload Is"), "select"),
-                    "last_edited_at": page.get("last_edited_time")
-                }
-                results.append(record)
-
+            pages.extend(response.get("results", []))
             has_more = response.get("has_more", False)
             start_cursor = response.get("next_cursor")
 
+        # Resolve every related page across the whole result set up front, so each
+        # unique page is fetched at most once instead of once per row
+        self.prefetch_relations(pages, self.RELATION_PROPERTIES)
+
+        results: List[Dict[str, Any]] = []
+        for page in pages:
+            props = page.get("properties", {})
+            record = {
+                "name": self._get_property_value(props.get("Name"), "title"),
+                "role": self._get_property_value(props.get("Role"), "multi_select"),
+                "status": self._get_property_value(props.get("Status"), "rich_text"),
+                "team": self._get_property_value(props.get("Team"), "relation"),
+                "joined": self._get_property_value(props.get("Joined"), "select"),
+                "bio": self._get_property_value(props.get("Bio"), "rich_text"),
+                "email": self._get_property_value(props.get("Email (dscubed)"), "email"),
+                "discord_tag": self._get_property_value(props.get("Discord Tag"), "rich_text"),
+                "facebook": self._get_property_value(props.get("Facebook"), "url"),
+                "instagram": self._get_property_value(props.get("Instagram"), "url"),
+                "linkedin": self._get_property_value(props.get("LinkedIn"), "url"),
+                "working_on": self._get_property_value(props.get("I'm Working On"), "rich_text"),
+                "workload": self._get_property_value(props.get("My Workload Is"), "select"),
+                "last_edited_at": page.get("last_edited_time")
+            }
+            results.append(record)
+
+        self.relation_resolver.save()
         return results
     
+    def prefetch_relations(self, pages: List[Dict[str, Any]], property_names: List[str]) -> None:
+        """
+        Collect the IDs in the given relation properties of every page and resolve the
+        unique ones in one pass.
+        """
+        for database_id in self.relation_database_ids:
+            try:
+                self.relation_resolver.refresh_from_database(database_id)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Failed to refresh related database {database_id}: {e}")
+        page_ids = [
+            rel.get("id")
+            for page in pages
+            for name in property_names
+            for rel in (page.get("properties", {}).get(name) or {}).get("relation", [])
+            if rel.get("id")
+        ]
+        self.relation_resolver.resolve(page_ids)
+    
     def _get_property_value(self, prop: Dict[str, Any], prop_type: str) -> Any:
         """
         Extract the plain value from a Notion property.
@@ -103,20 +145,10 @@ class NotionExtractor:
                 return prop.get("email", "")
 
             if prop_type == "relation":
-                names: List[str] = []
-                for rel in prop.get("relation", []):
-                    page_id = rel.get("id")
-                    if not page_id:
-                        continue
-                    try:
-                        page = self.client.pages.retrieve(page_id=page_id)
-                        title_prop = page.get("properties", {}).get("Name", {})
-                        if title_prop.get("title"):
-                            names.append(title_prop["title"][0].get("plain_text", ""))
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.error(f"Failed to retrieve related page {page_id}: {e}")
-                return ", ".join(names)
+                page_ids = [rel.get("id") for rel in prop.get("relation", []) if rel.get("id")]
+                # Already prefetched pages are served from the resolver's cache
+                self.relation_resolver.resolve(page_ids)
+                return ", ".join(self.relation_resolver.titles(page_ids))
 
         except Exception as e:
             if self.logger:
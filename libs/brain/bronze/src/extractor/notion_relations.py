@@ -0,0 +1,144 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from notion_client import Client
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "brain" / "notion_relation_titles.json"
+
+
+def page_title(page: Dict[str, Any]) -> str:
+    """Return the plain text of a page's title property."""
+    for prop in page.get("properties", {}).values():
+        if prop.get("type") == "title":
+            return "".join(part.get("plain_text", "") for part in prop.get("title", []))
+    return ""
+
+
+class RelationResolver:
+    """
+    Resolves Notion relation page IDs to page titles.
+
+    Unique IDs are fetched once each with bounded concurrency, and titles are
+    memoised in a small on-disk JSON cache keyed by page ID and the page's
+    last_edited_time, so repeated runs only hit the API for new or changed pages.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        cache_path: Path = DEFAULT_CACHE_PATH,
+        concurrency: int = 4,
+        max_age_seconds: float = 24 * 60 * 60,
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            client (Client): Notion client
+            cache_path (Path): JSON file the titles are memoised in
+            concurrency (int): Maximum number of pages.retrieve calls in flight
+            max_age_seconds (float): How long a cached title is trusted without being revalidated
+        """
+        self.client = client
+        self.cache_path = cache_path
+        self.concurrency = concurrency
+        self.max_age_seconds = max_age_seconds
+        self.api_calls = 0
+        self._cache: Dict[str, Dict[str, Any]] = self._load_cache()
+        self._dirty = False
+        # Pages that failed to load this run, not retried for every row that references them
+        self._failed: set[str] = set()
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self) -> None:
+        """Write the cache back to disk if it changed."""
+        if not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._cache, f)
+        tmp_path.replace(self.cache_path)
+        self._dirty = False
+
+    def remember(self, page: Dict[str, Any]) -> None:
+        """Record a page's title, replacing the cached one only if the page was edited since."""
+        page_id = page.get("id")
+        if not page_id:
+            return
+        cached = self._cache.get(page_id)
+        last_edited_time = page.get("last_edited_time")
+        if cached and cached.get("last_edited_time") == last_edited_time:
+            cached["checked_at"] = time.time()
+        else:
+            self._cache[page_id] = {
+                "title": page_title(page),
+                "last_edited_time": last_edited_time,
+                "checked_at": time.time(),
+            }
+        self._dirty = True
+
+    def refresh_from_database(self, database_id: str) -> None:
+        """
+        Revalidate every cached page of a related database with one paginated query,
+        instead of one pages.retrieve per page.
+        """
+        start_cursor: Optional[str] = None
+        while True:
+            kwargs: Dict[str, Any] = {"database_id": database_id, "page_size": 100}
+            if start_cursor:
+                kwargs["start_cursor"] = start_cursor
+            response = self.client.databases.query(**kwargs)
+            self.api_calls += 1
+            for page in response.get("results", []):
+                self.remember(page)
+            if not response.get("has_more"):
+                break
+            start_cursor = response.get("next_cursor")
+
+    def _is_fresh(self, page_id: str) -> bool:
+        cached = self._cache.get(page_id)
+        return bool(cached) and time.time() - cached.get("checked_at", 0) < self.max_age_seconds
+
+    def _retrieve(self, page_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self.client.pages.retrieve(page_id=page_id)
+        except Exception as e:
+            print(f"Failed to retrieve related page {page_id}: {e}")
+            return None
+
+    def resolve(self, page_ids: Iterable[str]) -> Dict[str, str]:
+        """Return {page_id: title}, fetching each unique stale or unknown page once."""
+        unique_ids = list(dict.fromkeys(page_id for page_id in page_ids if page_id))
+        missing = [
+            page_id for page_id in unique_ids
+            if not self._is_fresh(page_id) and page_id not in self._failed
+        ]
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                pages = list(pool.map(self._retrieve, missing))
+            self.api_calls += len(missing)
+            for page_id, page in zip(missing, pages):
+                if page:
+                    self.remember(page)
+                else:
+                    self._failed.add(page_id)
+        return {
+            page_id: self._cache[page_id]["title"]
+            for page_id in unique_ids
+            if page_id in self._cache
+        }
+
+    def titles(self, page_ids: List[str]) -> List[str]:
+        """Return the cached titles of page_ids in order, skipping unresolved ones."""
+        return [self._cache[page_id]["title"] for page_id in page_ids if page_id in self._cache]
@@ -0,0 +1,276 @@
+import io
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+
+DDL_DIR = Path(__file__).parent.parent / "src" / "DDL"
+PIPELINE_RUNS_DDL = "pipeline_runs.sql"
+# Integers above this can't all be represented exactly in float64
+FLOAT_EXACT_INTEGER_LIMIT = 2 ** 53
+
+
+@dataclass
+class PipelineRun:
+    """Counters for one ingestion run, written to bronze.pipeline_runs when it finishes."""
+    table_name: str
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    rows_read: int = 0
+    rows_inserted: int = 0
+    rows_updated: int = 0
+    bytes_loaded: int = 0
+    duration_seconds: float = 0.0
+    status: str = "running"
+    error: Optional[str] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+
+class Pipeline:
+    """
+    Bronze loading pipeline that:
+    - Creates the target table from its DDL file in bronze/src/DDL
+    - Bulk-loads DataFrames or record iterators with COPY into a temporary staging table
+    - Merges the staged rows into the target, upserting on conflict_key
+    - Records each run's row counts, bytes and duration in bronze.pipeline_runs
+    """
+
+    def __init__(
+        self,
+        ddl_filepath: str,
+        table_name: str,
+        schema: str = "bronze",
+        conflict_key: Optional[List[str]] = None,
+        batch_size: int = 5000,
+        engine: Optional[Engine] = None,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            ddl_filepath (str): DDL file for the target table, relative to bronze/src/DDL
+            table_name (str): Target table, e.g. "discord_chat"
+            schema (str): Schema of the target table
+            conflict_key (List[str]): Columns of a unique constraint to upsert on. Without one,
+                rows conflicting with any unique index are skipped (ON CONFLICT DO NOTHING).
+            batch_size (int): Records per COPY batch
+            engine (Engine): SQLAlchemy engine, created from DATABASE_URL if not provided
+        """
+        if engine is None:
+            load_dotenv()
+            database_url = os.getenv("DATABASE_URL")
+            if not database_url:
+                raise ValueError("DATABASE_URL must be set in .env file")
+            engine = create_engine(database_url)
+        self.engine = engine
+        self.ddl_path = DDL_DIR / ddl_filepath
+        self.table_name = table_name
+        self.schema = schema
+        self.conflict_key = conflict_key
+        self.batch_size = batch_size
+        self.current_run: Optional[PipelineRun] = None
+        self.last_run: Optional[PipelineRun] = None
+        self._runs_table_ready = False
+
+    @property
+    def target(self) -> str:
+        return f"{self.schema}.{self.table_name}"
+
+    def _execute_ddl(self, path: Path) -> None:
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(path.read_text())
+
+    def create_table(self) -> None:
+        """Run the target table's DDL (and the run-tracking table's)."""
+        if not self.ddl_path.exists():
+            raise FileNotFoundError(f"DDL file not found: {self.ddl_path}")
+        self._ensure_runs_table()
+        self._execute_ddl(self.ddl_path)
+        print(f"Created table {self.target}")
+
+    def _ensure_runs_table(self) -> None:
+        if not self._runs_table_ready:
+            self._execute_ddl(DDL_DIR / PIPELINE_RUNS_DDL)
+            self._runs_table_ready = True
+
+    # Load
+    @staticmethod
+    def _csv_field(value: Any) -> str:
+        # NULL is an empty, unquoted field; strings are always quoted so "" stays an empty string
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return '"' + value.replace('"', '""') + '"'
+        if isinstance(value, float) and value.is_integer():
+            # str() gives "1.23e+18" for large whole floats, which an integer column rejects
+            return str(int(value))
+        return str(value)
+
+    def _to_csv(self, records: Iterable[Dict[str, Any]], columns: List[str]) -> io.BytesIO:
+        buffer = io.StringIO()
+        for record in records:
+            buffer.write(",".join(self._csv_field(record.get(column)) for column in columns))
+            buffer.write("\n")
+        return io.BytesIO(buffer.getvalue().encode("utf-8"))
+
+    def _merge_sql(self, staging: str, columns: List[str]) -> str:
+        column_list = ", ".join(columns)
+        sql = f"INSERT INTO {self.target} ({column_list}) SELECT {column_list} FROM {staging} "
+        if not self.conflict_key:
+            return sql + "ON CONFLICT DO NOTHING RETURNING TRUE"
+        updates = [column for column in columns if column not in self.conflict_key]
+        if updates:
+            action = "DO UPDATE SET " + ", ".join(f"{column} = EXCLUDED.{column}" for column in updates)
+        else:
+            action = "DO NOTHING"
+        # xmax is 0 for freshly inserted rows and set for rows updated by the upsert
+        return sql + f"ON CONFLICT ({', '.join(self.conflict_key)}) {action} RETURNING (xmax = 0)"
+
+    def load_batch(self, records: List[Dict[str, Any]], columns: Optional[List[str]] = None) -> PipelineRun:
+        """
+        COPY one batch into a staging table and merge it into the target in a single transaction.
+        Counters are added to the current run (a one-off run is recorded when none is active).
+        """
+        if self.current_run is None:
+            with self.run():
+                return self.load_batch(records, columns)
+        run = self.current_run
+        if not records:
+            return run
+
+        started = time.perf_counter()
+        columns = columns or list(records[0].keys())
+        staging = f"staging_{self.table_name}"
+        payload = self._to_csv(records, columns)
+
+        raw_conn = self.engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cur:
+                # Only the COPY columns, without the target's defaults or NOT NULLs: a SERIAL
+                # default would draw a sequence value for every staged row
+                cur.execute(
+                    f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+                    f"SELECT {', '.join(columns)} FROM {self.target} WITH NO DATA"
+                )
+                cur.copy_expert(
+                    f"COPY {staging} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                    payload,
+                )
+                cur.execute(self._merge_sql(staging, columns))
+                merged = [row[0] for row in cur.fetchall()]
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+
+        inserted = sum(1 for is_insert in merged if is_insert)
+        run.rows_read += len(records)
+        run.rows_inserted += inserted
+        run.rows_updated += len(merged) - inserted
+        run.bytes_loaded += payload.getbuffer().nbytes
+        print(f"Loaded {len(records)} rows into {self.target} "
+              f"({inserted} inserted, {len(merged) - inserted} updated) in {time.perf_counter() - started:.2f}s")
+        return run
+
+    @contextmanager
+    def run(self) -> Iterator[PipelineRun]:
+        """Group loads into one run, recorded in bronze.pipeline_runs when the block exits."""
+        if self.current_run is not None:
+            yield self.current_run
+            return
+        run = self.current_run = PipelineRun(table_name=self.target)
+        started = time.perf_counter()
+        try:
+            yield run
+            run.status = "succeeded"
+        except Exception as e:
+            run.status = "failed"
+            run.error = str(e)
+            raise
+        finally:
+            run.duration_seconds = time.perf_counter() - started
+            self.current_run = None
+            self.last_run = run
+            self._record_run(run)
+
+    def _record_run(self, run: PipelineRun) -> None:
+        query = text("""
+            INSERT INTO bronze.pipeline_runs
+                (table_name, status, rows_read, rows_inserted, rows_updated, bytes_loaded,
+                 duration_seconds, error, started_at)
+            VALUES
+                (:table_name, :status, :rows_read, :rows_inserted, :rows_updated, :bytes_loaded,
+                 :duration_seconds, :error, :started_at)
+        """)
+        try:
+            self._ensure_runs_table()
+            with self.engine.begin() as conn:
+                conn.execute(query, vars(run))
+        except Exception as e:
+            # Never let run bookkeeping mask the load's own outcome
+            print(f"Failed to record pipeline run for {self.target}: {e}")
+
+    def ingest_records(self, records: Iterable[Dict[str, Any]], columns: Optional[List[str]] = None) -> PipelineRun:
+        """Load an iterable of records in batch_size batches, holding one batch in memory at a time."""
+        with self.run() as run:
+            batch: List[Dict[str, Any]] = []
+            for record in records:
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    self.load_batch(batch, columns)
+                    batch = []
+            if batch:
+                self.load_batch(batch, columns)
+        return run
+
+    def ingest_from_df(self, df: pd.DataFrame) -> PipelineRun:
+        """
+        Load a DataFrame, converting NaN/NaT to NULL.
+
+        Integer columns with missing values must arrive as Int64 or object dtype: pandas
+        otherwise stores them as float64, which can't hold IDs such as Discord snowflakes
+        exactly. Such columns are refused rather than loaded rounded.
+        """
+        columns = [str(column) for column in df.columns]
+        for column, values in df.items():
+            # float64 values this large are whole numbers that may already have been rounded
+            if values.dtype.kind == "f" and (values.abs() > FLOAT_EXACT_INTEGER_LIMIT).any():
+                raise ValueError(
+                    f"Column {column} holds integers too large for float64; pass it as Int64 or object dtype"
+                )
+
+        def records() -> Iterator[Dict[str, Any]]:
+            for start in range(0, len(df), self.batch_size):
+                chunk = df.iloc[start:start + self.batch_size]
+                chunk = chunk.astype(object).where(chunk.notna(), None)
+                yield from chunk.to_dict("records")
+
+        return self.ingest_records(records(), columns)
+
+    def test_run_status(self) -> bool:
+        """Print the outcome of the last run and the target's row count. Returns True if it succeeded."""
+        run = self.last_run
+        if run is None:
+            print(f"No run recorded for {self.target}")
+            return False
+        with self.engine.connect() as conn:
+            total = conn.execute(text(f"SELECT COUNT(*) FROM {self.target}")).scalar()
+        print(
+            f"Run {run.status} for {self.target}: {run.rows_read} read, {run.rows_inserted} inserted, "
+            f"{run.rows_updated} updated, {run.bytes_loaded} bytes in {run.duration_seconds:.1f}s "
+            f"({run.rows_per_second:.1f} rows/s); table now has {total} rows"
+        )
+        return run.status == "succeeded"
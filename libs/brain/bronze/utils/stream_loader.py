@@ -0,0 +1,69 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List
+
+from .pipeline import Pipeline
+
+
+# Columns of bronze.discord_chat written by the Discord extractor (chat_id and
+# ingestion_timestamp are filled in by their column defaults)
+DISCORD_CHAT_COLUMNS = [
+    "channel_id",
+    "channel_name",
+    "thread_name",
+    "thread_id",
+    "message_id",
+    "discord_username",
+    "discord_user_id",
+    "content",
+    "chat_created_at",
+    "chat_edited_at",
+    "is_thread",
+]
+
+
+class StreamingCopyLoader:
+    """
+    Streams records into a pipeline's target table in fixed-size COPY batches.
+
+    Batches are loaded through Pipeline.load_batch (staging table + merge), off the
+    event loop, so at most batch_size records are held in memory at a time. Wrap the
+    stream in `with pipeline.run():` to record it as a single pipeline run.
+    """
+
+    def __init__(self, pipeline: Pipeline, columns: List[str]):
+        """
+        Initialize the loader.
+
+        Args:
+            pipeline (Pipeline): Pipeline for the target table; its batch_size sets the COPY batch size
+            columns (List[str]): Record keys to load, in COPY column order
+        """
+        self.pipeline = pipeline
+        self.columns = columns
+
+    @property
+    def batch_size(self) -> int:
+        return self.pipeline.batch_size
+
+    async def load(self, records: AsyncIterator[Dict[str, Any]]) -> None:
+        """Consume an async stream of records, flushing every batch_size records."""
+        batch: List[Dict[str, Any]] = []
+        async for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+        if batch:
+            await self._flush(batch)
+
+    async def write_batch(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Load an already-buffered list of records, split into batch_size chunks.
+        Usable as the DiscordExtractor on_batch callback.
+        """
+        for start in range(0, len(records), self.batch_size):
+            await self._flush(records[start:start + self.batch_size])
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        # COPY is blocking, keep it off the event loop so the Discord client stays responsive
+        await asyncio.to_thread(self.pipeline.load_batch, batch, self.columns)
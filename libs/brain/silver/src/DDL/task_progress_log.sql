@@ -0,0 +1,20 @@
+-- Create an append-only log of task progress updates reported during scrum checkups
+CREATE TABLE IF NOT EXISTS silver.task_progress_log (
+    progress_id BIGSERIAL PRIMARY KEY,
+    notion_task_id TEXT NOT NULL,
+    user_name TEXT,
+    progress_text TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_task_progress_log_notion_task_id_progress_id ON silver.task_progress_log(notion_task_id, progress_id);
+
+-- Last log entry included in the summary pushed to the task's Task Progress property in Notion
+CREATE TABLE IF NOT EXISTS silver.task_progress_sync (
+    notion_task_id TEXT PRIMARY KEY,
+    last_progress_id BIGINT NOT NULL,
+    legacy_progress TEXT,                       -- Task Progress text written before the log existed, kept ahead of the summary
+    pushed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE silver.task_progress_sync ADD COLUMN IF NOT EXISTS legacy_progress TEXT;
@@ -0,0 +1,183 @@
+"""
+Micro-benchmark for the compiled page parsers.
+
+Generates synthetic Tasks and Events/Projects pages and times the hand-written per-field
+parser the CRUD modules used before against the compiled PageParser, checking both produce
+the same rows. Needs no Notion token:
+
+    uv run python libs/org_tools/benchmarks/bench_parser.py --pages 10000
+"""
+import argparse
+import gc
+import random
+import time
+import uuid
+from typing import Dict, Any, List, Callable
+
+from org_tools.notion.raw.types import (
+    EventProject, Task, EventProjectID, TaskID, TeamID, DocumentID,
+    EventProjectType, EventProjectProgress, EventProjectPriority, TaskStatus, TaskPriority,
+    EventProjectProperties, TaskProperties
+)
+from org_tools.notion.raw.client import (
+    parse_date_from_notion, parse_rich_text_from_notion, parse_people_from_notion, parse_relation_from_notion
+)
+from org_tools.notion.raw.parser import get_task_parser, get_event_project_parser
+
+def _linear_enum_value(enum_class, notion_id: str):
+    for enum_value in enum_class:
+        if enum_value.value == notion_id:
+            return enum_value
+    return None
+
+def legacy_parse_task_page(page: Dict[str, Any]) -> Task:
+    """The per-field Task parser tasks.py used before PageParser"""
+    props = page["properties"]
+
+    return Task(
+        id=TaskID(page["id"]),
+        name=props.get(TaskProperties.NAME, {}).get("title", [{}])[0].get("text", {}).get("content", ""),
+        status=_linear_enum_value(TaskStatus, props.get(TaskProperties.STATUS, {}).get("status", {}).get("id", "")),
+        priority=_linear_enum_value(TaskPriority, props.get(TaskProperties.PRIORITY, {}).get("select", {}).get("id", "")),
+        description=parse_rich_text_from_notion(props.get(TaskProperties.DESCRIPTION, {}).get("rich_text", [])),
+        task_progress=parse_rich_text_from_notion(props.get(TaskProperties.TASK_PROGRESS, {}).get("rich_text", [])),
+        due_dates=parse_date_from_notion(props.get(TaskProperties.DUE_DATES, {}).get("date")),
+        in_charge=parse_people_from_notion(props.get(TaskProperties.IN_CHARGE, {}).get("people", [])),
+        event_project=[EventProjectID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.EVENT_PROJECT, {}).get("relation", []))],
+        team=[TeamID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.TEAM, {}).get("relation", []))],
+        parent_task=[TaskID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.PARENT_TASK, {}).get("relation", []))],
+        sub_task=[TaskID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.SUB_TASK, {}).get("relation", []))],
+        blocking=[TaskID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.BLOCKING, {}).get("relation", []))],
+        blocked_by=[TaskID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.BLOCKED_BY, {}).get("relation", []))]
+    )
+
+def legacy_parse_event_project_page(page: Dict[str, Any]) -> EventProject:
+    """The per-field EventProject parser events_projects.py used before PageParser"""
+    props = page["properties"]
+
+    return EventProject(
+        id=EventProjectID(page["id"]),
+        name=props.get(EventProjectProperties.NAME, {}).get("title", [{}])[0].get("text", {}).get("content", ""),
+        type=_linear_enum_value(EventProjectType, props.get(EventProjectProperties.TYPE, {}).get("select", {}).get("id", "")),
+        progress=_linear_enum_value(EventProjectProgress, props.get(EventProjectProperties.PROGRESS, {}).get("select", {}).get("id", "")),
+        priority=_linear_enum_value(EventProjectPriority, props.get(EventProjectProperties.PRIORITY, {}).get("select", {}).get("id", "")),
+        description=parse_rich_text_from_notion(props.get(EventProjectProperties.DESCRIPTION, {}).get("rich_text", [])),
+        text=parse_rich_text_from_notion(props.get(EventProjectProperties.TEXT, {}).get("rich_text", [])),
+        location=parse_rich_text_from_notion(props.get(EventProjectProperties.LOCATION, {}).get("rich_text", [])),
+        due_dates=parse_date_from_notion(props.get(EventProjectProperties.DUE_DATES, {}).get("date")),
+        owner=parse_people_from_notion(props.get(EventProjectProperties.OWNER, {}).get("people", [])),
+        allocated=parse_people_from_notion(props.get(EventProjectProperties.ALLOCATED, {}).get("people", [])),
+        parent_item=[EventProjectID(id_) for id_ in parse_relation_from_notion(props.get(EventProjectProperties.PARENT_ITEM, {}).get("relation", []))],
+        sub_item=[EventProjectID(id_) for id_ in parse_relation_from_notion(props.get(EventProjectProperties.SUB_ITEM, {}).get("relation", []))],
+        team=[TeamID(id_) for id_ in parse_relation_from_notion(props.get(EventProjectProperties.TEAM, {}).get("relation", []))],
+        documents=[DocumentID(id_) for id_ in parse_relation_from_notion(props.get(EventProjectProperties.DOCUMENTS, {}).get("relation", []))],
+        tasks=[TaskID(id_) for id_ in parse_relation_from_notion(props.get(EventProjectProperties.TASKS, {}).get("relation", []))]
+    )
+
+def _rich_text(rng: random.Random) -> Dict[str, Any]:
+    words = " ".join(rng.choice(["sync", "notion", "agent", "review", "sprint", "docs"]) for _ in range(rng.randint(1, 12)))
+    return {"rich_text": [{"type": "text", "text": {"content": words, "link": None}, "plain_text": words}]}
+
+def _people(rng: random.Random) -> Dict[str, Any]:
+    return {"people": [
+        {"object": "user", "id": str(uuid.UUID(int=rng.getrandbits(128))), "name": "Member", "avatar_url": None, "person": {"email": "member@example.com"}}
+        for _ in range(rng.randint(0, 3))
+    ]}
+
+def _relation(rng: random.Random) -> Dict[str, Any]:
+    return {"relation": [{"id": str(uuid.UUID(int=rng.getrandbits(128)))} for _ in range(rng.randint(0, 4))], "has_more": False}
+
+def _option(key: str, enum_class, rng: random.Random) -> Dict[str, Any]:
+    member = rng.choice(list(enum_class))
+    return {key: {"id": member.value, "name": member.name, "color": "default"}}
+
+def synthetic_task_page(rng: random.Random) -> Dict[str, Any]:
+    name = f"Task {rng.randint(0, 10**6)}"
+    props = {
+        TaskProperties.NAME: {"title": [{"type": "text", "text": {"content": name, "link": None}, "plain_text": name}]},
+        TaskProperties.STATUS: _option("status", TaskStatus, rng),
+        TaskProperties.PRIORITY: _option("select", TaskPriority, rng),
+        TaskProperties.DESCRIPTION: _rich_text(rng),
+        TaskProperties.TASK_PROGRESS: _rich_text(rng),
+        TaskProperties.DUE_DATES: {"date": {"start": "2025-03-01", "end": "2025-03-14T09:00:00.000Z", "time_zone": None}},
+        TaskProperties.IN_CHARGE: _people(rng),
+        TaskProperties.EVENT_PROJECT: _relation(rng),
+        TaskProperties.TEAM: _relation(rng),
+        TaskProperties.PARENT_TASK: _relation(rng),
+        TaskProperties.SUB_TASK: _relation(rng),
+        TaskProperties.BLOCKING: _relation(rng),
+        TaskProperties.BLOCKED_BY: _relation(rng),
+        TaskProperties.IS_DUE: {"formula": {"type": "boolean", "boolean": False}},
+        TaskProperties.LAST_EDITED_TIME: {"last_edited_time": "2025-03-01T09:00:00.000Z"}
+    }
+    # Keyed by property ID, which is what the old parser looks up
+    return {"object": "page", "id": str(uuid.UUID(int=rng.getrandbits(128))), "properties": {
+        key: {"id": key, "type": next(iter(value)), **value} for key, value in props.items()
+    }}
+
+def synthetic_event_project_page(rng: random.Random) -> Dict[str, Any]:
+    name = f"Project {rng.randint(0, 10**6)}"
+    props = {
+        EventProjectProperties.NAME: {"title": [{"type": "text", "text": {"content": name, "link": None}, "plain_text": name}]},
+        EventProjectProperties.TYPE: _option("select", EventProjectType, rng),
+        EventProjectProperties.PROGRESS: _option("select", EventProjectProgress, rng),
+        EventProjectProperties.PRIORITY: _option("select", EventProjectPriority, rng),
+        EventProjectProperties.DESCRIPTION: _rich_text(rng),
+        EventProjectProperties.TEXT: _rich_text(rng),
+        EventProjectProperties.LOCATION: _rich_text(rng),
+        EventProjectProperties.DUE_DATES: {"date": {"start": "2025-03-01", "end": None, "time_zone": None}},
+        EventProjectProperties.OWNER: _people(rng),
+        EventProjectProperties.ALLOCATED: _people(rng),
+        EventProjectProperties.PARENT_ITEM: _relation(rng),
+        EventProjectProperties.SUB_ITEM: _relation(rng),
+        EventProjectProperties.TEAM: _relation(rng),
+        EventProjectProperties.DOCUMENTS: _relation(rng),
+        EventProjectProperties.TASKS: _relation(rng)
+    }
+    return {"object": "page", "id": str(uuid.UUID(int=rng.getrandbits(128))), "properties": {
+        key: {"id": key, "type": next(iter(value)), **value} for key, value in props.items()
+    }}
+
+def _best_of(parsers: List[Callable[[], List[Any]]], repeat: int) -> List[float]:
+    best = [float("inf")] * len(parsers)
+    # Like timeit, keep collector pauses over the live page set out of the measurement
+    gc.collect()
+    gc.disable()
+    try:
+        # Alternate the parsers within each run so load on the machine hits them alike
+        for _ in range(repeat):
+            for index, parse_all in enumerate(parsers):
+                start = time.perf_counter()
+                parse_all()
+                best[index] = min(best[index], time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+def run_benchmark(page_count: int = 10_000, repeat: int = 5, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    cases = [
+        ("tasks", [synthetic_task_page(rng) for _ in range(page_count)], legacy_parse_task_page, get_task_parser()),
+        ("events_projects", [synthetic_event_project_page(rng) for _ in range(page_count)], legacy_parse_event_project_page, get_event_project_parser())
+    ]
+
+    for label, pages, legacy_parse, parser in cases:
+        if [legacy_parse(page) for page in pages] != parser.parse_many(pages):
+            raise AssertionError(f"Compiled {label} parser disagrees with the old parser")
+
+        before, after = _best_of([lambda: [legacy_parse(page) for page in pages], lambda: parser.parse_many(pages)], repeat)
+        print(
+            f"{label:<16} {page_count} pages | "
+            f"before {page_count / before:>9,.0f} pages/s ({before * 1000:.1f} ms) | "
+            f"after {page_count / after:>9,.0f} pages/s ({after * 1000:.1f} ms) | "
+            f"{before / after:.2f}x"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Notion page parsing")
+    parser.add_argument("--pages", type=int, default=10_000, help="Synthetic pages per database")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per parser, best is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    run_benchmark(args.pages, args.repeat, args.seed)
\ No newline at end of file
@@ -1,5 +1,9 @@
+import csv
+import os
+import threading
 from dataclasses import dataclass
-from typing import NewType
+from pathlib import Path
+from typing import NewType, Optional
 
 #
 
@@ -7,8 +11,16 @@ from typing import NewType
 notion_user_id_type = NewType("notion_user_id_type", str)
 discord_user_id_type = NewType("discord_user_id_type", str)
 
-
-# TODO need to write functions to automatically keep this up to date
+# Snapshot of the directory shipped with the package, used until the database has been
+# read and whenever it is unavailable. Only rewritten by running this module.
+USER_SNAPSHOT_PATH = Path(__file__).parent / "user_list.csv"
+# Where each successful database load is cached, so restarts without the database
+# still see the latest directory. Outside the package, which may be read-only.
+USER_CACHE_PATH = (
+    Path(os.getenv("ORG_TOOLS_CACHE_DIR", Path.home() / ".cache" / "org_tools"))
+    / "user_list.csv"
+)
+USER_SNAPSHOT_FIELDS = ["name", "role", "notion_id", "discord_id"]
 
 
 @dataclass
@@ -19,477 +31,168 @@ class UserData:
     discord_id: discord_user_id_type
 
 
-USER_LIST: list[UserData] = [
-    UserData(
-        name="Danielle Tran",
-        role="External Vice President",
-        notion_id=notion_user_id_type("8b352898-aa01-40c8-b813-1d674666ebe5"),
-        discord_id=discord_user_id_type("1209415347585945661"),
-    ),
-    UserData(
-        name="Nathan Luo",
-        role="AI Director",
-        notion_id=notion_user_id_type("f746733c-66cc-4cbc-b553-c5d3f03ed240"),
-        discord_id=discord_user_id_type("241085495398891521"),
-    ),
-    UserData(
-        name="Anton Huynh",
-        role="Industry Officer",
-        notion_id=notion_user_id_type("72af2773-0463-4d0e-bb5d-c6da6d595358"),
-        discord_id=discord_user_id_type("238180946174672898"),
-    ),
-    UserData(
-        name="Simon Nguyen",
-        role="IT Officer",
-        notion_id=notion_user_id_type("cb1ca5d0-944a-462a-b18a-e7686dfa1a08"),
-        discord_id=discord_user_id_type("528906746337558528"),
-    ),
-    UserData(
-        name="Teresa Guo",
-        role="Marketing Director",
-        notion_id=notion_user_id_type("f79ec109-12fa-4ae0-8a6f-f57d78e015d3"),
-        discord_id=discord_user_id_type("693294943367856139"),
-    ),
-    UserData(
-        name="Soaham",
-        role="Events Officer",
-        notion_id=notion_user_id_type("fffb7e1b-36c2-479a-9571-27a24079fde2"),
-        discord_id=discord_user_id_type("759645006914256926"),
-    ),
-    UserData(
-        name="RANIA",
-        role="Secretary",
-        notion_id=notion_user_id_type("b8ce8d09-0dfd-4560-8a05-883249cce948"),
-        discord_id=discord_user_id_type("1209833336474833010"),
-    ),
-    UserData(
-        name="Michael Ren",
-        role="President",
-        notion_id=notion_user_id_type("314ad6eb-dc2e-49b5-8801-4afa0360f39b"),
-        discord_id=discord_user_id_type("1138969490432991232"),
-    ),
-    UserData(
-        name="Hannah",
-        role="Internal Vice President",
-        notion_id=notion_user_id_type("84fa5ffe-2848-48f5-b3d7-21269c644d5c"),
-        discord_id=discord_user_id_type("415077608011726868"),
-    ),
-    UserData(
-        name="Dhruv Ajay",
-        role="Project Lead",
-        notion_id=notion_user_id_type("302a361d-511f-44ba-a728-6cae0661e899"),
-        discord_id=discord_user_id_type("577829083866464296"),
-    ),
-    UserData(
-        name="Angus Chan",
-        role="Events Officer",
-        notion_id=notion_user_id_type("ce23a115-7514-474e-9b12-7a99a7699dfe"),
-        discord_id=discord_user_id_type("722032358257197087"),
-    ),
-    UserData(
-        name="Ameya Mahesh",
-        role="Project Officer",
-        notion_id=notion_user_id_type("9f52eb8c-690a-44cf-9562-6701fe5b70ab"),
-        discord_id=discord_user_id_type("597270043935637505"),
-    ),
-    UserData(
-        name="Elyse Lee",
-        role="HR Director",
-        notion_id=notion_user_id_type("0cd789b6-1545-459a-bc05-1ec885b14ee1"),
-        discord_id=discord_user_id_type("426419121362829322"),
-    ),
-    UserData(
-        name="Brian King",
-        role="IT Officer",
-        notion_id=notion_user_id_type("26ea303a-2f37-49f9-8a5b-42c5ca635cf9"),
-        discord_id=discord_user_id_type("729929681834344508"),
-    ),
-    UserData(
-        name="Charmaine",
-        role="Events Officer",
-        notion_id=notion_user_id_type("eefee9b7-e2e1-43aa-95ee-8b224510114a"),
-        discord_id=discord_user_id_type("1215511112515326005"),
-    ),
-    UserData(
-        name="Hayden Ma",
-        role="Events Officer",
-        notion_id=notion_user_id_type("74c1fb03-539a-4de4-8eb1-38492cbeb143"),
-        discord_id=discord_user_id_type("741230223214903387"),
-    ),
-    UserData(
-        name="Jamie Marks",
-        role="IT Officer",
-        notion_id=notion_user_id_type("0e36fbe3-66f3-484b-922c-ac8c0bca47b6"),
-        discord_id=discord_user_id_type("503260447705661440"),
-    ),
-    UserData(
-        name="Nick Muir",
-        role="Education Officer",
-        notion_id=notion_user_id_type("d9e67f1e-b37c-4bf8-9ab9-81e4a78ecfbc"),
-        discord_id=discord_user_id_type("657156788180746260"),
-    ),
-    UserData(
-        name="Paul Su",
-        role="IT Officer",
-        notion_id=notion_user_id_type("eddb1224-a77e-4aeb-8ca5-6e5be6e5ef8f"),
-        discord_id=discord_user_id_type("247593577465511937"),
-    ),
-    UserData(
-        name="Geoffrey Chen",
-        role="IT Officer",
-        notion_id=notion_user_id_type("a45d963f-32e6-47e1-b7ba-caf40ee8280d"),
-        discord_id=discord_user_id_type("963627649748594689"),
-    ),
-    UserData(
-        name="Noah Say",
-        role="IT Director",
-        notion_id=notion_user_id_type("7e1e7da1-3a93-4e48-8a2a-92fb7703cbe5"),
-        discord_id=discord_user_id_type("348017694655643648"),
-    ),
-    UserData(
-        name="Chris Gee",
-        role="Industry Officer",
-        notion_id=notion_user_id_type("95fb5ae3-5126-4c48-a286-000638821d18"),
-        discord_id=discord_user_id_type("890262654034259988"),
-    ),
-    UserData(
-        name="Jesselyn Lim",
-        role="Industry Officer",
-        notion_id=notion_user_id_type("8b706d61-108c-4468-b058-a9727c852643"),
-        discord_id=discord_user_id_type("399205935924510720"),
-    ),
-    UserData(
-        name="Jess Zhao",
-        role="HR Director",
-        notion_id=notion_user_id_type("31b1c4ca-662e-4bcc-a631-772566865139"),
-        discord_id=discord_user_id_type("816184594444451903"),
-    ),
-    UserData(
-        name="Kaylyn Phan",
-        role="IT Officer",
-        notion_id=notion_user_id_type("c8f6b4d6-f7fc-4d04-8a67-706be192b80d"),
-        discord_id=discord_user_id_type("437985276892282880"),
-    ),
-    UserData(
-        name="Ethan Cheng",
-        role="Industry Officer",
-        notion_id=notion_user_id_type("ea42ea13-1dc2-4f2d-9f7d-f547269a7266"),
-        discord_id=discord_user_id_type("324364692547960842"),
-    ),
-    UserData(
-        name="Jordan",
-        role="Education Director",
-        notion_id=notion_user_id_type("f8516599-8b82-43b5-a0a0-e7df94384912"),
-        discord_id=discord_user_id_type("1254032275021238337"),
-    ),
-    UserData(
-        name="Mark Sesuraj",
-        role="Education Officer",
-        notion_id=notion_user_id_type("c36b1a8d-9980-4c9c-8bf0-fd158c6144ab"),
-        discord_id=discord_user_id_type("695893808595992626"),
-    ),
-    UserData(
-        name="Prathiksha Ashok",
-        role="HR Officer",
-        notion_id=notion_user_id_type("0ac8066e-1874-4ef7-aac6-46ec64ab5416"),
-        discord_id=discord_user_id_type("524406524567748657"),
-    ),
-    UserData(
-        name="Sarah Abusah",
-        role="Industry Director",
-        notion_id=notion_user_id_type("f2103615-a0b5-46bb-b167-3ffefebb93e1"),
-        discord_id=discord_user_id_type("1269646744690495638"),
-    ),
-    UserData(
-        name="Wan Azlan",
-        role="Marketing Officer",
-        notion_id=notion_user_id_type("0dcaab49-891e-4e62-bc14-23ddf68c4baa"),
-        discord_id=discord_user_id_type("225290307732897792"),
-    ),
-    UserData(
-        name="Ojas",
-        role="HR Officer",
-        notion_id=notion_user_id_type("1d575660-d4db-48dc-bbc8-87cc8bd4ec3d"),
-        discord_id=discord_user_id_type("226677092530651153"),
-    ),
-    UserData(
-        name="Stephanie Doan",
-        role="Marketing Officer",
-        notion_id=notion_user_id_type("dcb83ab0-e798-4a07-93c3-550f00dc8f1a"),
-        discord_id=discord_user_id_type("713786043584872459"),
-    ),
-    UserData(
-        name="Jiacheng Zheng",
-        role="Events Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-8172-9c64-0002867fd2c9"),
-        discord_id=discord_user_id_type("528328814632370188"),
-    ),
-    UserData(
-        name="Harshit Badam",
-        role="Industry Officer",
-        notion_id=notion_user_id_type("dc00fced-7146-4c0e-aefe-c74d939bc7b8"),
-        discord_id=discord_user_id_type("432456147358842881"),
-    ),
-    UserData(
-        name="Shawn Kim",
-        role="Treasurer",
-        notion_id=notion_user_id_type("1a2f8f56-d93a-4174-9ae3-426cb5614630"),
-        discord_id=discord_user_id_type("1257175546039767153"),
-    ),
-    UserData(
-        name="Divyansh ",
-        role="Projects Officer",
-        notion_id=notion_user_id_type("0c79bde0-3dee-4bf6-b6da-e6080c59cd8e"),
-        discord_id=discord_user_id_type("708340274933268501"),
-    ),
-    UserData(
-        name="Paige Nguyen",
-        role="Industry Officer",
-        notion_id=notion_user_id_type("117d872b-594c-81ee-b390-00027f46882c"),
-        discord_id=discord_user_id_type("1292544598362816552"),
-    ),
-    UserData(
-        name="Gurshan Nanda",
-        role="Industry Officer",
-        notion_id=notion_user_id_type("117d872b-594c-8100-8d62-0002223c005d"),
-        discord_id=discord_user_id_type("1008827617283153940"),
-    ),
-    UserData(
-        name="Dharani Baskaran",
-        role="Industry Officer",
-        notion_id=notion_user_id_type("117d872b-594c-81cc-95db-00029eda628a"),
-        discord_id=discord_user_id_type("803068997930057768"),
-    ),
-    UserData(
-        name="Andy Li",
-        role="Industry Officer",
-        notion_id=notion_user_id_type("117d872b-594c-814b-8bcd-0002bec43618"),
-        discord_id=discord_user_id_type("1263063218977505283"),
-    ),
-    UserData(
-        name="Terry Yu",
-        role="Marketing Officer",
-        notion_id=notion_user_id_type("51518819-39c6-49b8-b9f9-fb56b4e916d7"),
-        discord_id=discord_user_id_type("583948585352298497"),
-    ),
-    UserData(
-        name="Eric",
-        role="Marketing Officer",
-        notion_id=notion_user_id_type("bcb8ffb2-be38-4d92-8a68-43f21b12c209"),
-        discord_id=discord_user_id_type("583630629531418684"),
-    ),
-    UserData(
-        name="bike pham",
-        role="Education Officer",
-        notion_id=notion_user_id_type("fbc90953-4abf-4d56-80db-0c9df043bebe"),
-        discord_id=discord_user_id_type("741125117333209288"),
-    ),
-    UserData(
-        name="jake paul",
-        role="Events Director",
-        notion_id=notion_user_id_type("91fbb869-72b6-4e39-8905-bd626af0597e"),
-        discord_id=discord_user_id_type("435734883462283264"),
-    ),
-    UserData(
-        name="Aditya Yadav",
-        role="Education Officer",
-        notion_id=notion_user_id_type("47a28de2-00dd-4822-b73e-b19506df9bd8"),
-        discord_id=discord_user_id_type("545364033008566278"),
-    ),
-    UserData(
-        name="Mohand Mender",
-        role="Undergraduate Rep",
-        notion_id=notion_user_id_type("7bb29edc-bfcd-4ecd-bb2e-dab992a9ae81"),
-        discord_id=discord_user_id_type("556696989048504350"),
-    ),
-    UserData(
-        name="Irene",
-        role="IT Officer",
-        notion_id=notion_user_id_type("144d872b-594c-819d-a5ac-0002b701ee00"),
-        discord_id=discord_user_id_type("569831538078777354"),
-    ),
-    UserData(
-        name="Abhin Rustagi",
-        role="IT Officer",
-        notion_id=notion_user_id_type("144d872b-594c-81c7-b610-00029b02bba9"),
-        discord_id=discord_user_id_type("974714458779832320"),
-    ),
-    UserData(
-        name="Animesh",
-        role="IT Officer",
-        notion_id=notion_user_id_type("144d872b-594c-813b-a24b-000246c48adb"),
-        discord_id=discord_user_id_type("449806786791211008"),
-    ),
-    UserData(
-        name="Ishan Deshpande",
-        role="IT Officer",
-        notion_id=notion_user_id_type("144d872b-594c-812d-8589-0002838bda39"),
-        discord_id=discord_user_id_type("572691462085541908"),
-    ),
-    UserData(
-        name="Tanat Chanwangsa",
-        role="IT Officer",
-        notion_id=notion_user_id_type("147d872b-594c-81ae-9f01-0002a25dc7c7"),
-        discord_id=discord_user_id_type("262140744796602368"),
-    ),
-    UserData(
-        name="Henry Routson",
-        role="AI Officer",
-        notion_id=notion_user_id_type("149d872b-594c-8184-ba71-00021997dcb9"),
-        discord_id=discord_user_id_type("872718183692402688"),
-    ),
-    UserData(
-        name="Pranav Jayanty",
-        role="AI Officer",
-        notion_id=notion_user_id_type("c005948c-9115-4a4d-b3c2-78286fa75fdb"),
-        discord_id=discord_user_id_type("373796704450772992"),
-    ),
-    UserData(
-        name="Pavan Dev",
-        role="Events Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-8100-aead-00026f26d36d"),
-        discord_id=discord_user_id_type("489420534019391488"),
-    ),
-    UserData(
-        name="Lachlan Chue",
-        role="IT Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-81a3-b7d2-0002e41f8537"),
-        discord_id=discord_user_id_type("313177325879558145"),
-    ),
-    UserData(
-        name="Addie Nguyen",
-        role="Marketing Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-813f-88ba-00022d2ea8d8"),
-        discord_id=discord_user_id_type("810545230632976385"),
-    ),
-    UserData(
-        name="Anthea Lee",
-        role="Events Officer",
-        notion_id=notion_user_id_type("1bad872b-594c-81bb-95f1-00025ff97f57"),
-        discord_id=discord_user_id_type("768799326141939764"),
-    ),
-    UserData(
-        name="Dhruv Verma",
-        role="IT Officer",
-        notion_id=notion_user_id_type("1bad872b-594c-8110-91e2-0002c091f384"),
-        discord_id=discord_user_id_type("808488202163322881"),
-    ),
-    UserData(
-        name="Frank Ngo",
-        role="Education Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-815a-a001-000245072ba6"),
-        discord_id=discord_user_id_type("447293645981351946"),
-    ),
-    UserData(
-        name="Carmen Wong",
-        role="Marketing Officer",
-        notion_id=notion_user_id_type("1bad872b-594c-817c-aa7b-000212ba08a1"),
-        discord_id=discord_user_id_type("1350954484913799211"),
-    ),
-    UserData(
-        name="Zim",
-        role="IT Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-8159-9858-000210dbca44"),
-        discord_id=discord_user_id_type("655681641834086431"),
-    ),
-    UserData(
-        name="Eric He",
-        role="Events Officer",
-        notion_id=notion_user_id_type("1bad872b-594c-8129-89c2-0002ee1ba61e"),
-        discord_id=discord_user_id_type("994501536250069013"),
-    ),
-    UserData(
-        name="Damien Trinh",
-        role="Events Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-81b7-bb3d-00020c61fc37"),
-        discord_id=discord_user_id_type("386352490150363136"),
-    ),
-    UserData(
-        name="Keith Howen",
-        role="Education Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-815b-b5f2-0002f50ecfe5"),
-        discord_id=discord_user_id_type("688543302429311087"),
-    ),
-    UserData(
-        name="Chi Nguyen",
-        role="Marketing Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-81c6-9711-00027493224c"),
-        discord_id=discord_user_id_type("1053356459565514863"),
-    ),
-    UserData(
-        name="Eddie Li",
-        role="IT Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-818b-8142-00022dae03c4"),
-        discord_id=discord_user_id_type("1340308441645842553"),
-    ),
-    UserData(
-        name="Rudra Tiwari",
-        role="Marketing Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-8167-b7bb-000231b0eaa5"),
-        discord_id=discord_user_id_type("1038316180991131728"),
-    ),
-    UserData(
-        name="Stanley",
-        role="Education Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-8198-b16d-00029b7b516a"),
-        discord_id=discord_user_id_type("424310464839942174"),
-    ),
-    UserData(
-        name="Yiwen Zhang",
-        role="AI Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-8123-a9c8-0002e6ee833b"),
-        discord_id=discord_user_id_type("774065995508744232"),
-    ),
-    UserData(
-        name="Shayomi",
-        role="AI Officer",  # TODO
-        notion_id=notion_user_id_type("1bbd872b-594c-816b-b37d-000274bbfbe2"),
-        discord_id=discord_user_id_type("744518516350386298"),
-    ),
-    UserData(
-        name="Antoine",
-        role="AI Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-81f5-bc03-0002a7229ca6"),
-        discord_id=discord_user_id_type("1195065884713156728"),
-    ),
-    UserData(
-        name="lorraine sanares",
-        role="AI Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-816f-b62c-000253e00baa"),
-        discord_id=discord_user_id_type("1215094966846758952"),
-    ),
-    UserData(
-        name="Alina",
-        role="AI Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-81e9-a745-000238c87ef8"),
-        discord_id=discord_user_id_type("1283302616759275581"),
-    ),
-    UserData(
-        name="Liao Ziang",
-        role="AI Officer",
-        notion_id=notion_user_id_type("1bbd872b-594c-8160-8126-00029d7b0a08"),
-        discord_id=discord_user_id_type("946858733756117094"),
-    ),
-]
-
-
-DISCORD_TO_NOTION_USER_MAP: dict[discord_user_id_type, UserData] = {
-    user.discord_id: user for user in USER_LIST
-}
-NOTION_TO_DISCORD_USER_MAP: dict[notion_user_id_type, UserData] = {
-    user.notion_id: user for user in USER_LIST
-}
+class UserDirectory:
+    """
+    Discord <-> Notion user directory backed by silver.committee.
+
+    start() (or the first lookup) seeds the directory from the cached or bundled CSV
+    snapshot, which is a file read and never blocks on the database. A daemon thread
+    then loads silver.committee straight away and every refresh_interval seconds,
+    writing each successful load to the cache. Lookups are served from whatever was
+    loaded last.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path = USER_SNAPSHOT_PATH,
+        cache_path: Path = USER_CACHE_PATH,
+        refresh_interval: float = 600.0,
+    ) -> None:
+        self.snapshot_path = snapshot_path
+        self.cache_path = cache_path
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop_refresh = threading.Event()
+        self._by_discord_id: dict[discord_user_id_type, UserData] = {}
+        self._by_notion_id: dict[notion_user_id_type, UserData] = {}
+
+    def _load_from_database(self) -> list[UserData]:
+        # Imported lazily so the directory still works from the snapshot when the
+        # database dependencies or DATABASE_URL are unavailable
+        from org_tools.brain.postgres.postgres import get_committee_members
+
+        # silver.committee has no role column, so keep roles we already know
+        known_roles = {user.notion_id: user.role for user in self._by_notion_id.values()}
+        return [
+            UserData(
+                name=member["name"] or "",
+                role=known_roles.get(member["notion_id"], ""),
+                notion_id=notion_user_id_type(member["notion_id"]),
+                discord_id=discord_user_id_type(str(member["discord_id"])),
+            )
+            for member in get_committee_members()
+            if member["notion_id"] and member["discord_id"]
+        ]
+
+    def _load_from_snapshot(self) -> list[UserData]:
+        path = self.cache_path if self.cache_path.exists() else self.snapshot_path
+        if not path.exists():
+            return []
+        with open(path, newline="", encoding="utf-8") as f:
+            return [
+                UserData(
+                    name=row["name"],
+                    role=row["role"],
+                    notion_id=notion_user_id_type(row["notion_id"]),
+                    discord_id=discord_user_id_type(row["discord_id"]),
+                )
+                for row in csv.DictReader(f)
+            ]
+
+    def write_snapshot(self, path: Path, users: Optional[list[UserData]] = None) -> None:
+        """Write users (by default the loaded directory) to a CSV snapshot at path."""
+        if users is None:
+            users = list(self._by_notion_id.values())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=USER_SNAPSHOT_FIELDS)
+            writer.writeheader()
+            for user in users:
+                writer.writerow(
+                    {
+                        "name": user.name,
+                        "role": user.role,
+                        "notion_id": user.notion_id,
+                        "discord_id": user.discord_id,
+                    }
+                )
+        tmp_path.replace(path)
+
+    def _set_users(self, users: list[UserData]) -> None:
+        by_discord_id = {user.discord_id: user for user in users}
+        by_notion_id = {user.notion_id: user for user in users}
+        # Swap both indexes in together so readers never see a half-built directory
+        self._by_discord_id, self._by_notion_id = by_discord_id, by_notion_id
+
+    def refresh(self) -> bool:
+        """
+        Reload the directory from Postgres, keeping the current one on failure.
+        Blocks on the database, so call it from a thread rather than an event loop.
+
+        Returns:
+            True if the directory was reloaded
+        """
+        if not self._by_notion_id:
+            # Roles only live in the snapshot, seed them before the database load
+            self._set_users(self._load_from_snapshot())
+        try:
+            users = self._load_from_database()
+        except Exception as e:
+            print(f"Failed to load user directory from database, using snapshot: {e}")
+            return False
+        if not users:
+            return False
+        self._set_users(users)
+        try:
+            self.write_snapshot(self.cache_path, users)
+        except OSError as e:
+            print(f"Failed to cache user directory snapshot: {e}")
+        return True
+
+    def start(self) -> None:
+        """
+        Seed the directory from the snapshot and start refreshing it from Postgres in
+        the background. Call at startup to warm the directory; lookups call it too.
+        """
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._set_users(self._load_from_snapshot())
+            self._loaded = True
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop, name="user-directory-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _refresh_loop(self) -> None:
+        self.refresh()
+        while not self._stop_refresh.wait(self.refresh_interval):
+            self.refresh()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop_refresh.set()
+
+    def get_by_discord_id(self, discord_id: discord_user_id_type) -> UserData | None:
+        self.start()
+        return self._by_discord_id.get(discord_id)
+
+    def get_by_notion_id(self, notion_id: notion_user_id_type) -> UserData | None:
+        self.start()
+        return self._by_notion_id.get(notion_id)
+
+    def all_users(self) -> list[UserData]:
+        self.start()
+        return list(self._by_notion_id.values())
+
+
+user_directory = UserDirectory()
 
 
 # wrappers for type safety
 
 
 def get_user_from_discord_id(discord_id: discord_user_id_type) -> UserData | None:
-    return DISCORD_TO_NOTION_USER_MAP.get(discord_id)
+    return user_directory.get_by_discord_id(discord_id)
 
 
 def get_user_from_notion_id(notion_id: notion_user_id_type) -> UserData | None:
-    return NOTION_TO_DISCORD_USER_MAP.get(notion_id)
+    return user_directory.get_by_notion_id(notion_id)
 
 
 def notion_to_discord_user_map(
@@ -510,11 +213,9 @@ def discord_to_notion_user_map(
     return user_data.notion_id
 
 
-# testing
-
-for user in USER_LIST:
-    assert notion_to_discord_user_map(user.notion_id) == user.discord_id
-    assert discord_to_notion_user_map(user.discord_id) == user.notion_id
-
-
-print("Done testing")
+if __name__ == "__main__":
+    # Regenerate the bundled snapshot from silver.committee
+    if not user_directory.refresh():
+        raise SystemExit("Could not load the user directory from the database")
+    user_directory.write_snapshot(USER_SNAPSHOT_PATH)
+    print(f"Wrote {len(user_directory.all_users())} users to {USER_SNAPSHOT_PATH}")
@@ -1,4 +1,4 @@
-from custom_tools.brain.notion.notion_functions import get_active_tasks, get_active_projects
+from custom_tools.brain.notion.notion_functions import get_active_tasks, get_projects_by_id
 
 """
 INPUT: notion_user_id
@@ -22,18 +22,10 @@ project dictionary:
 
 def get_task_and_project_info(notion_user_id: str) -> tuple[list[dict[str, str]], list[dict[str, str]]]:
     user_tasks = get_active_tasks(notion_user_id=notion_user_id)
-    all_projects = get_active_projects()
-
-    # get projects that the user is currently working on
-    user_projects = {}
-    # for every project, check if the user has any tasks in it
-    for project_id, project_name in all_projects.items():
-        # for every user task, check if it is in this project
-        for task_id, task_data in user_tasks.items():
-            # if the task is in this project, add it to the user_projects dict
-            if task_data.get("project") == project_id:
-                user_projects[project_id] = project_name
-                break
+
+    # look up only the projects the user's tasks point at (each task carries its project ID)
+    project_ids = [task_data.get("project") for task_data in user_tasks.values()]
+    user_projects = get_projects_by_id(project_id for project_id in project_ids if project_id)
 
     # formatting to dict, appending to list
     task_list = []
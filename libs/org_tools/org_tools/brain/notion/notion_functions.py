@@ -1,16 +1,44 @@
+import asyncio
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
-from typing import Any, Literal, NewType, Optional
+from typing import Any, Callable, Iterable, Iterator, Literal, NewType, Optional
 
 from dotenv import load_dotenv
 from notion_client import Client
 
+from org_tools.brain.notion.workspace_users import workspace_user_index
+from org_tools.brain.postgres.postgres import add_task_progress
+from org_tools.notion.raw.client import get_notion_client, iter_database_pages
+from org_tools.notion.raw.types import (
+    EVENTS_PROJECTS_DB_ID,
+    TASKS_DB_ID,
+    EventProjectProperties,
+    TaskProperties,
+)
+
 load_dotenv()
 
 NOTION_PRODUCTION_DATABASE_ID_TASKS: str = "ed8ba37a719a47d7a796c2d373c794b9"
 NOTION_PRODUCTION_DATABASE_ID_PROJECTS: str = "918affd4ce0d4b8eb7604d972fd24826"
 
+# Properties get_active_tasks reads; the rest of each page isn't transferred
+ACTIVE_TASK_PROPERTIES: list[str] = [
+    TaskProperties.NAME,
+    TaskProperties.STATUS,
+    TaskProperties.DUE_DATES,
+    TaskProperties.EVENT_PROJECT,
+    TaskProperties.IN_CHARGE,
+    TaskProperties.DESCRIPTION,
+    TaskProperties.TASK_PROGRESS,
+]
+
+# Notion requests the bulk tools keep in flight; the shared rate limiter still paces them
+BULK_MAX_CONCURRENCY: int = 4
+
 
 class TASK_STATUS(Enum):
     # AI: Using str as base class to maintain string values while having enum functionality
@@ -30,35 +58,31 @@ class NotionClient:
         Create or return the singleton instance of the Notion client
 
         Returns:
-            Client: The Notion client instance
+            Client: The process-wide rate-limited Notion client, shared with org_tools.notion.raw
+                so both draw from the same token bucket
         """
         if cls._instance is None:
-            notion_token = os.getenv("NOTION_TOKEN")
-            if not notion_token:
-                raise ValueError("NOTION_TOKEN environment variable is not set")
-            cls._instance = Client(auth=notion_token)
+            cls._instance = get_notion_client()
         return cls._instance
 
 
-def get_all_users() -> list[dict[str, str]]:
+def get_all_users(name: Optional[str] = None, limit: int = 10) -> list[dict[str, str]]:
     """
-    Get all users from the users database
-    """
-    notion_client: Client = NotionClient()
-    response: Any = notion_client.users.list()
+    Get users in the Notion workspace, optionally only those matching a name. Search by name whenever you know who you are looking for
 
-    notion_users: list[dict[str, Any]] = response.get("results", [])
+    Args:
+        name: The person's name or the start of it; approximate spellings also match. Leave empty to list everyone
+        limit: The maximum number of users to return when searching by name
 
-    user_list: list[dict[str, str]] = []
+    Returns:
+        A list of users with their notion id and name, best match first
+    """
+    if name:
+        users = workspace_user_index.search(name, limit)
+    else:
+        users = workspace_user_index.all_users()
 
-    for user in notion_users:
-        user_list.append(
-            {
-                "id": user.get("id", ""),
-                "name": user.get("name", ""),
-            }
-        )
-    return user_list
+    return [{"id": user.id, "name": user.name} for user in users]
 
 
 def get_active_tasks(
@@ -75,7 +99,6 @@ def get_active_tasks(
     Returns:
         A list of tasks
     """
-    notion_client: Client = NotionClient()
     # filter by Project AND UserID
     filter_obj = {
         "and": [
@@ -104,13 +127,12 @@ def get_active_tasks(
             }
         )
 
-    # quering Task database
-    response: Any = notion_client.databases.query(
-        database_id=NOTION_PRODUCTION_DATABASE_ID_TASKS,
-        filter=filter_obj,  # should database id be notion_project_id?
+    # quering Task database, following every page of results
+    tasks: Iterator[dict[str, Any]] = iter_database_pages(
+        TASKS_DB_ID,
+        filter=filter_obj,
+        filter_properties=ACTIVE_TASK_PROPERTIES,
     )
-
-    tasks: list[dict[str, Any]] = response.get("results", [])
     parsed_tasks: dict[Any, dict[str, Any]] = {}
     for task in tasks:
         # Get properties safely
@@ -185,41 +207,140 @@ def get_active_tasks(
 project_id_type = NewType("project_id_type", str)
 project_map_type = dict[project_id_type, Any]
 
+# a project is active unless its Progress is one of these
+INACTIVE_PROJECT_PROGRESS = ("Archive", "Cancelled", "Finished")
+
 
 def get_active_projects() -> project_map_type:
     """
     Get all projects from the projects database
     """
-    notion_client: Client = NotionClient()
-    response: Any = notion_client.databases.query(
-        database_id=NOTION_PRODUCTION_DATABASE_ID_PROJECTS,
-        # TODO filter based on active
+    projects: Iterator[dict[str, Any]] = iter_database_pages(
+        EVENTS_PROJECTS_DB_ID,
         filter={
-            "or": [
-                {"property": "Progress", "select": {"does_not_equal": "Archive"}},
-                {"property": "Progress", "select": {"does_not_equal": "Cancelled"}},
-                {"property": "Progress", "select": {"does_not_equal": "Finished"}},
+            "and": [
+                {"property": "Progress", "select": {"does_not_equal": progress}}
+                for progress in INACTIVE_PROJECT_PROGRESS
             ]
         },
+        filter_properties=[EventProjectProperties.NAME],
     )
-
-    projects: list[dict[str, Any]] = response.get("results", [])
     parsed_projects: project_map_type = {}
     for project in projects:
-        name: Optional[Any] = None
-        name_prop: Any = project.get("properties", {}).get("Name", {})
-        title_list: list[Any] = name_prop.get("title", [])
-        if title_list and len(title_list) > 0:
-            text_obj = title_list[0].get("text", {})
-            name = text_obj.get("content")
-
         project_id: Optional[project_id_type] = project_id_type(project.get("id", None))
         assert project_id is not None
-        parsed_projects[project_id] = name
+        parsed_projects[project_id] = _parse_project_name(project)
 
+    project_cache.put_many(parsed_projects)
     return parsed_projects
 
 
+def _parse_project_name(project: dict[str, Any]) -> Optional[str]:
+    title_list: list[Any] = project.get("properties", {}).get("Name", {}).get("title", [])
+    if title_list:
+        return title_list[0].get("text", {}).get("content")
+    return None
+
+
+def _is_active_project(project: dict[str, Any]) -> bool:
+    if project.get("archived") or project.get("in_trash"):
+        return False
+    progress = project.get("properties", {}).get("Progress", {}).get("select") or {}
+    return progress.get("name") not in INACTIVE_PROJECT_PROGRESS
+
+
+# Cached in place of a name for projects that are inactive or couldn't be read
+_INACTIVE = object()
+
+
+class ProjectCache:
+    """
+    In-process TTL cache of project ID -> project name.
+
+    Checkup context only needs the projects a user's tasks point at, so entries are
+    loaded per ID on demand instead of pulling the whole projects database. Inactive
+    and unreadable projects are remembered too, so they aren't retrieved every time.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[project_id_type, tuple[Any, float]] = {}
+
+    def get_many(
+        self, project_ids: Iterable[project_id_type]
+    ) -> tuple[project_map_type, list[project_id_type]]:
+        """Return the fresh cached names among project_ids, and the IDs that need fetching.
+
+        IDs cached as inactive are in neither.
+        """
+        now = time.monotonic()
+        found: project_map_type = {}
+        missing: list[project_id_type] = []
+        with self._lock:
+            for project_id in project_ids:
+                entry = self._entries.get(project_id)
+                if entry and now - entry[1] <= self.ttl_seconds:
+                    if entry[0] is not _INACTIVE:
+                        found[project_id] = entry[0]
+                else:
+                    missing.append(project_id)
+        return found, missing
+
+    def put_many(
+        self, projects: project_map_type, inactive: Iterable[project_id_type] = ()
+    ) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for project_id, name in projects.items():
+                self._entries[project_id] = (name, now)
+            for project_id in inactive:
+                self._entries[project_id] = (_INACTIVE, now)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+project_cache = ProjectCache(
+    ttl_seconds=float(os.getenv("NOTION_PROJECT_CACHE_TTL_SECONDS", "600"))
+)
+
+
+def _retrieve_project(project_id: project_id_type) -> Optional[dict[str, Any]]:
+    notion_client: Client = NotionClient()
+    try:
+        return notion_client.pages.retrieve(page_id=project_id)
+    except Exception as e:
+        print(f"Failed to retrieve project {project_id}: {e}")
+        return None
+
+
+def get_projects_by_id(project_ids: Iterable[str]) -> project_map_type:
+    """
+    Get the names of the given projects, from the cache where fresh
+
+    databases.query can't filter on page ID, so uncached projects are retrieved
+    individually, BULK_MAX_CONCURRENCY at a time under the shared rate limiter.
+    Archived, finished, cancelled or unreadable projects are left out.
+    """
+    unique_ids = list(dict.fromkeys(project_id_type(project_id) for project_id in project_ids if project_id))
+    projects, missing = project_cache.get_many(unique_ids)
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(BULK_MAX_CONCURRENCY, len(missing))) as pool:
+            pages = list(pool.map(_retrieve_project, missing))
+        fetched: project_map_type = {
+            project_id: _parse_project_name(page)
+            for project_id, page in zip(missing, pages)
+            if page and _is_active_project(page)
+        }
+        project_cache.put_many(
+            fetched, inactive=[project_id for project_id in missing if project_id not in fetched]
+        )
+        projects.update(fetched)
+    return {project_id: projects[project_id] for project_id in unique_ids if project_id in projects}
+
+
 def create_task(
     task_name: str,
     user_id: str,  # TODO change to a list
@@ -313,6 +434,56 @@ def update_task(
 
     return response
 
+
+async def _run_bulk(
+    operation: Callable[..., Any], items: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """
+    Run a blocking Notion write once per item with bounded concurrency
+
+    Returns:
+        One {index, success, id, error} result per item, in input order
+    """
+    semaphore = asyncio.Semaphore(BULK_MAX_CONCURRENCY)
+
+    async def run(index: int, item: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                response: Any = await asyncio.to_thread(operation, **item)
+                return {"index": index, "success": True, "id": response.get("id"), "error": None}
+            except Exception as e:
+                # Bad arguments from the LLM fail their own item only, the same way as API errors
+                return {"index": index, "success": False, "id": item.get("notion_task_id"), "error": str(e)}
+
+    return list(await asyncio.gather(*(run(index, item) for index, item in enumerate(items))))
+
+
+async def bulk_create_tasks(tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Create several tasks in the tasks database in one call. Use this instead of calling create_task repeatedly
+
+    Args:
+        tasks: A list of tasks to create, each an object with the create_task arguments: task_name, user_id, and optionally due_date and notion_project_id
+
+    Returns:
+        One result per task in the same order, with success, the new task id and the error if it failed
+    """
+    return await _run_bulk(create_task, tasks)
+
+
+async def bulk_update_tasks(updates: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Update several tasks in the tasks database in one call, e.g. to mark all of a user's tasks as Done. Use this instead of calling update_task repeatedly
+
+    Args:
+        updates: A list of task updates, each an object with the update_task arguments: notion_task_id, and optionally task_name, task_status, task_description, task_due_date, task_in_charge and task_event_project
+
+    Returns:
+        One result per update in the same order, with success, the task id and the error if it failed
+    """
+    return await _run_bulk(update_task, updates)
+
+
 def update_task_progress(
     notion_task_id: str,
     user_name: str,
@@ -329,34 +500,11 @@ def update_task_progress(
     Returns:
         Success or failure of the update
     """
+    # Appended to silver.task_progress_log; task_progress.compact_task_progress pushes a
+    # bounded summary to the Task Progress property in Notion
+    progress_id = add_task_progress(notion_task_id, user_name, task_progress)
 
-    # Get the old task progress
-    notion_client: Client = NotionClient()
-    response: Any = notion_client.pages.retrieve(
-        page_id=notion_task_id,
-    )
-    properties = response.get("properties", {})
-
-    # Parse old task progress
-    old_task_progress = ""
-    task_progress_prop = properties.get("Task Progress", {})
-    task_progress_list = task_progress_prop.get("rich_text", [])
-    if task_progress_list and len(task_progress_list) > 0:
-        old_task_progress = task_progress_list[0].get("text", {}).get("content")
-
-    new_properties = {}
-    # Format progress
-    formatted_task_progress = f"{user_name} (Updated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}): {task_progress}"
-    new_properties["Task Progress"] = {"rich_text": [{"text": {"content": old_task_progress + '\n' + formatted_task_progress}}]}
-
-    
-    notion_client: Client = NotionClient()
-    response: Any = notion_client.pages.update(
-        page_id=notion_task_id,
-        properties=new_properties,
-    )
-
-    return response
+    return f"Recorded progress for task {notion_task_id} (entry {progress_id})"
 
 # if __name__ == "__main__":
     # import time
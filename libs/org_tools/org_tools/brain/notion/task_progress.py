@@ -0,0 +1,145 @@
+import os
+import time
+from typing import Any, Optional
+
+from notion_client import Client
+
+from org_tools.brain.notion.notion_functions import NotionClient
+from org_tools.brain.postgres.postgres import (
+    get_task_progress,
+    get_task_progress_sync,
+    get_tasks_with_unpushed_progress,
+    seed_task_progress_sync,
+    set_task_progress_pushed,
+)
+
+# Notion rejects rich_text content longer than this
+NOTION_RICH_TEXT_LIMIT: int = 2000
+# Log entries considered for each summary; older ones can't fit anyway
+SUMMARY_MAX_ENTRIES: int = 50
+OMITTED_MARKER: str = "(earlier updates omitted)"
+
+
+def format_progress_entry(entry: dict[str, Any]) -> str:
+    """Format a silver.task_progress_log row the way update_task_progress used to write it"""
+    created_at = entry["created_at"].strftime("%Y-%m-%d %H:%M:%S")
+    return f"{entry['user_name']} (Updated at {created_at}): {entry['progress_text']}"
+
+
+def summarize_task_progress(
+    entries: list[dict[str, Any]],
+    max_chars: int = NOTION_RICH_TEXT_LIMIT,
+    legacy_progress: str = "",
+) -> str:
+    """
+    Build a rolling summary of progress entries that fits in max_chars
+
+    Args:
+        entries: Progress log rows, oldest first
+        max_chars: Maximum length of the summary
+        legacy_progress: Task Progress text from before the log, kept ahead of the entries
+
+    Returns:
+        The newest lines that fit, oldest first, preceded by a marker if older ones were dropped
+    """
+    budget = max_chars - len(OMITTED_MARKER) - 1
+    # The legacy text was appended to line by line, so it is oldest first like the log
+    lines = legacy_progress.splitlines() + [format_progress_entry(entry) for entry in entries]
+    kept: list[str] = []
+    used = 0
+    for line in reversed(lines):
+        if used + len(line) + 1 > budget:
+            if not kept:
+                # A single oversized update is cut rather than dropped
+                kept.append(line[: budget - 1] + "…")
+            break
+        kept.append(line)
+        used += len(line) + 1
+
+    summary = "\n".join(reversed(kept))
+    if len(kept) < len(lines) or len(entries) >= SUMMARY_MAX_ENTRIES:
+        summary = f"{OMITTED_MARKER}\n{summary}"
+    return summary
+
+
+def _read_task_progress(notion_client: Client, notion_task_id: str) -> Optional[str]:
+    page = notion_client.pages.retrieve(page_id=notion_task_id)
+    rich_text = page.get("properties", {}).get("Task Progress", {}).get("rich_text", [])
+    return "".join(item.get("plain_text", "") for item in rich_text) or None
+
+
+def push_task_progress(notion_task_id: str) -> bool:
+    """
+    Overwrite a task's Task Progress property with the summary of its progress log
+
+    Before a task's first push, the text already in Task Progress is saved to its sync
+    row, and every summary keeps it ahead of the logged entries.
+
+    Returns:
+        True if a summary was pushed, False if the task has no logged progress
+    """
+    entries = get_task_progress(notion_task_id, limit=SUMMARY_MAX_ENTRIES)
+    if not entries:
+        return False
+
+    notion_client: Client = NotionClient()
+    sync = get_task_progress_sync(notion_task_id)
+    if sync is None:
+        # Saved before the first write, so a failed push can't read back its own summary
+        seed_task_progress_sync(notion_task_id, _read_task_progress(notion_client, notion_task_id))
+        sync = get_task_progress_sync(notion_task_id)
+    legacy_progress = (sync or {}).get("legacy_progress") or ""
+
+    summary = summarize_task_progress(entries, legacy_progress=legacy_progress)
+    notion_client.pages.update(
+        page_id=notion_task_id,
+        properties={"Task Progress": {"rich_text": [{"text": {"content": summary}}]}},
+    )
+    # Only what was summarised counts as pushed; entries logged meanwhile go out next run
+    set_task_progress_pushed(notion_task_id, entries[-1]["progress_id"])
+    return True
+
+
+def compact_task_progress() -> int:
+    """
+    Push a fresh summary to Notion for every task with progress logged since its last push
+
+    Returns:
+        Number of tasks updated
+    """
+    pushed = 0
+    for notion_task_id in get_tasks_with_unpushed_progress():
+        try:
+            if push_task_progress(notion_task_id):
+                pushed += 1
+        except Exception as e:
+            # Left unpushed, so it's retried on the next run
+            print(f"Failed to push progress for task {notion_task_id}: {e}")
+    return pushed
+
+
+def run_forever(interval: float) -> None:
+    """Compact task progress every interval seconds"""
+    while True:
+        print(f"Pushed progress summaries for {compact_task_progress()} tasks")
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Push task progress summaries from silver.task_progress_log to Notion"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=float(os.getenv("TASK_PROGRESS_COMPACTION_INTERVAL_SECONDS", "0")),
+        help="Keep compacting every INTERVAL seconds",
+    )
+    args = parser.parse_args()
+
+    if args.interval:
+        run_forever(args.interval)
+    else:
+        print(f"Pushed progress summaries for {compact_task_progress()} tasks")
@@ -0,0 +1,200 @@
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from difflib import SequenceMatcher
+from typing import Any, Optional
+
+from notion_client import Client
+
+from org_tools.notion.raw.client import get_notion_client
+
+# Minimum fuzzy score for a name to count as a match
+FUZZY_MATCH_THRESHOLD: float = 0.6
+
+
+@dataclass
+class WorkspaceUser:
+    id: str
+    name: str
+    type: str
+    email: Optional[str] = None
+    avatar_url: Optional[str] = None
+
+
+def _match_score(query: str, name: str) -> float:
+    """Score how well a casefolded query matches a casefolded name, from 0 to 1."""
+    if name == query:
+        return 1.0
+    if name.startswith(query):
+        return 0.9
+    words = name.split()
+    if any(word.startswith(query) for word in words):
+        return 0.8
+    return max(
+        SequenceMatcher(None, query, candidate).ratio() for candidate in [name, *words]
+    )
+
+
+class WorkspaceUserIndex:
+    """
+    Index of every user in the Notion workspace, searchable by name.
+
+    users.list is paginated to completion and written through to bronze.notion_user.
+    A fresh process starts from that table instead of the API, and a daemon thread
+    re-lists the workspace every refresh_interval seconds.
+    """
+
+    def __init__(self, refresh_interval: float = 3600.0) -> None:
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop_refresh = threading.Event()
+        self._users: list[WorkspaceUser] = []
+        self._by_id: dict[str, WorkspaceUser] = {}
+        # Casefolded names, built once per load rather than on every search
+        self._search_keys: list[tuple[str, WorkspaceUser]] = []
+
+    def _list_from_notion(self) -> list[WorkspaceUser]:
+        notion_client: Client = get_notion_client()
+        users: list[WorkspaceUser] = []
+        start_cursor: Optional[str] = None
+        while True:
+            kwargs: dict[str, Any] = {"page_size": 100}
+            if start_cursor:
+                kwargs["start_cursor"] = start_cursor
+            response: Any = notion_client.users.list(**kwargs)
+            for user in response.get("results", []):
+                users.append(
+                    WorkspaceUser(
+                        id=user.get("id", ""),
+                        name=user.get("name") or "",
+                        type=user.get("type", ""),
+                        email=(user.get("person") or {}).get("email"),
+                        avatar_url=user.get("avatar_url"),
+                    )
+                )
+            if not response.get("has_more") or not response.get("next_cursor"):
+                return users
+            start_cursor = response["next_cursor"]
+
+    def _load_from_database(self) -> Optional[list[WorkspaceUser]]:
+        """Return the stored directory if it was listed within refresh_interval."""
+        # Imported lazily so the index still works from the API alone when the
+        # database dependencies or DATABASE_URL are unavailable
+        from org_tools.brain.postgres.postgres import get_notion_users
+
+        rows = get_notion_users()
+        if not rows:
+            return None
+        if datetime.now() - max(row["seen_at"] for row in rows) > timedelta(
+            seconds=self.refresh_interval
+        ):
+            return None
+        return [
+            WorkspaceUser(
+                id=row["user_id"],
+                name=row["name"] or "",
+                type=row["user_type"] or "",
+                email=row["email"],
+                avatar_url=row["avatar_url"],
+            )
+            for row in rows
+        ]
+
+    def _set_users(self, users: list[WorkspaceUser]) -> None:
+        by_id = {user.id: user for user in users}
+        search_keys = [(user.name.casefold(), user) for user in users if user.name]
+        # Swap everything in together so readers never see a half-built index
+        self._users, self._by_id, self._search_keys = users, by_id, search_keys
+
+    def refresh(self) -> None:
+        """Re-list the workspace from Notion and store it in Postgres."""
+        try:
+            users = self._list_from_notion()
+        except Exception as e:
+            print(f"Failed to list Notion users, keeping the cached index: {e}")
+            return
+        if not users:
+            return
+        self._set_users(users)
+        try:
+            from org_tools.brain.postgres.postgres import set_notion_users
+
+            set_notion_users(
+                [
+                    {
+                        "user_id": user.id,
+                        "name": user.name,
+                        "user_type": user.type,
+                        "email": user.email,
+                        "avatar_url": user.avatar_url,
+                    }
+                    for user in users
+                ]
+            )
+        except Exception as e:
+            print(f"Failed to store Notion users in the database: {e}")
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                users = self._load_from_database()
+            except Exception as e:
+                print(f"Failed to load Notion users from database, listing from Notion: {e}")
+                users = None
+            if users:
+                self._set_users(users)
+            else:
+                self.refresh()
+            self._loaded = True
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop, name="workspace-user-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _refresh_loop(self) -> None:
+        while not self._stop_refresh.wait(self.refresh_interval):
+            self.refresh()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop_refresh.set()
+
+    def get(self, user_id: str) -> Optional[WorkspaceUser]:
+        self._ensure_loaded()
+        return self._by_id.get(user_id)
+
+    def all_users(self, include_bots: bool = False) -> list[WorkspaceUser]:
+        self._ensure_loaded()
+        return [user for user in self._users if include_bots or user.type != "bot"]
+
+    def search(
+        self, query: str, limit: int = 10, include_bots: bool = False
+    ) -> list[WorkspaceUser]:
+        """Return users whose name matches query by prefix or fuzzily, best first."""
+        self._ensure_loaded()
+        query = query.strip().casefold()
+        if not query:
+            return self.all_users(include_bots)[:limit]
+
+        scored: list[tuple[float, str, WorkspaceUser]] = []
+        for name, user in self._search_keys:
+            if user.type == "bot" and not include_bots:
+                continue
+            score = _match_score(query, name)
+            if score >= FUZZY_MATCH_THRESHOLD:
+                scored.append((score, name, user))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [user for _, _, user in scored[:limit]]
+
+
+workspace_user_index = WorkspaceUserIndex(
+    refresh_interval=float(os.getenv("NOTION_USER_REFRESH_SECONDS", "3600"))
+)
+
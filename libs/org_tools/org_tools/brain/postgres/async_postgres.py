@@ -0,0 +1,151 @@
+"""
+Async reads for org_tools.brain.postgres.postgres.
+
+The helpers here run the sync module's statements (and row mapping) on an
+AsyncEngine, so the reads the Discord bots make per message don't block the
+event loop. They take the same arguments and return the same shapes as the
+sync helpers of the same name. Writes and other infrequent calls should use the
+sync helpers through asyncio.to_thread rather than being duplicated here.
+"""
+
+import time
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from org_tools.brain.postgres.metrics import query_metrics
+from org_tools.brain.postgres.postgres import (
+    AUTHOR_CONTEXT_QUERY,
+    COMMITTEE_DIRECTORY_QUERY,
+    COMMITTEE_MEMBER_QUERIES,
+    CommitteeDirectory,
+    PoolConfig,
+    _author_context_from_row,
+    _facts_params,
+    _instrument_engine,
+    _load_database_url,
+    committee_directory,
+)
+
+
+class AsyncDatabaseEngine:
+    _engine: Optional[AsyncEngine] = None
+
+    @classmethod
+    def get_engine(cls, pool_config: Optional[PoolConfig] = None) -> AsyncEngine:
+        if cls._engine is None:
+            # Same DATABASE_URL as the sync engine, driven through async psycopg
+            database_url = make_url(_load_database_url()).set(
+                drivername="postgresql+psycopg"
+            )
+            config = pool_config or PoolConfig.from_env()
+            cls._engine = create_async_engine(
+                database_url,
+                pool_size=config.pool_size,
+                max_overflow=config.max_overflow,
+                pool_timeout=config.pool_timeout,
+                pool_recycle=config.pool_recycle,
+                pool_pre_ping=config.pool_pre_ping,
+                connect_args={
+                    "options": f"-c statement_timeout={config.statement_timeout_ms}"
+                },
+            )
+            _instrument_engine(cls._engine.sync_engine)
+        return cls._engine
+
+    @classmethod
+    @asynccontextmanager
+    async def _checkout(
+        cls, label: str, transactional: bool
+    ) -> AsyncIterator[AsyncConnection]:
+        engine = cls.get_engine()
+        start = time.perf_counter()
+        async with engine.begin() if transactional else engine.connect() as conn:
+            query_metrics.observe_pool_wait(label, time.perf_counter() - start)
+            conn.info["query_label"] = label
+            try:
+                yield conn
+            finally:
+                conn.info.pop("query_label", None)
+
+    @classmethod
+    def connect(cls, label: str) -> AbstractAsyncContextManager[AsyncConnection]:
+        """Check out a pooled connection whose statements are recorded under label."""
+        return cls._checkout(label, transactional=False)
+
+    @classmethod
+    def begin(cls, label: str) -> AbstractAsyncContextManager[AsyncConnection]:
+        """Check out a pooled connection in a transaction, recorded under label."""
+        return cls._checkout(label, transactional=True)
+
+    @classmethod
+    async def dispose(cls) -> None:
+        """Close all pooled connections, e.g. on bot shutdown."""
+        if cls._engine is not None:
+            await cls._engine.dispose()
+            cls._engine = None
+
+
+async def get_author_context(
+    discord_id: str, days_back: int = 30
+) -> dict[str, Any]:
+    """
+    Fetch a user's gold.users_base row and their facts from the last days_back days
+    in a single round trip.
+
+    Args:
+        discord_id: Discord ID of the user
+        days_back: How many days of facts to include
+
+    Returns:
+        Dictionary with "user" (the user row, or None if not found) and "facts"
+        (list of fact rows, newest first)
+    """
+    async with AsyncDatabaseEngine.connect("get_author_context") as conn:
+        result = await conn.execute(AUTHOR_CONTEXT_QUERY, _facts_params(discord_id, days_back))
+        return _author_context_from_row(result.mappings().first())
+
+
+async def get_committee_directory() -> CommitteeDirectory:
+    """Return the shared committee directory, reloading it from silver.committee if stale."""
+    if committee_directory.is_stale():
+        async with AsyncDatabaseEngine.connect("load_committee_directory") as conn:
+            members = (await conn.execute(COMMITTEE_DIRECTORY_QUERY)).mappings().all()
+        committee_directory.load([dict(member) for member in members])
+    return committee_directory
+
+
+async def _get_committee_member(
+    column: str, value: Any, bypass_cache: bool
+) -> Optional[dict[str, Any]]:
+    if not bypass_cache:
+        return (await get_committee_directory()).get(column, value)
+    async with AsyncDatabaseEngine.connect(f"get_committee_member_by_{column}") as conn:
+        result = await conn.execute(COMMITTEE_MEMBER_QUERIES[column], {column: value})
+        member = result.mappings().first()
+        return dict(member) if member else None
+
+
+async def get_committee_member_by_notion_id(
+    notion_id: str, bypass_cache: bool = False
+) -> Optional[dict[str, Any]]:
+    """Async counterpart of postgres.get_committee_member_by_notion_id"""
+    return await _get_committee_member("notion_id", notion_id, bypass_cache)
+
+
+async def get_committee_member_by_discord_id(
+    discord_id: str, bypass_cache: bool = False
+) -> Optional[dict[str, Any]]:
+    """Async counterpart of postgres.get_committee_member_by_discord_id"""
+    return await _get_committee_member("discord_id", discord_id, bypass_cache)
+
+
+async def get_committee_member_by_discord_dm_channel_id(
+    discord_dm_channel_id: int, bypass_cache: bool = False
+) -> Optional[dict[str, Any]]:
+    """Async counterpart of postgres.get_committee_member_by_discord_dm_channel_id"""
+    return await _get_committee_member(
+        "discord_dm_channel_id", discord_dm_channel_id, bypass_cache
+    )
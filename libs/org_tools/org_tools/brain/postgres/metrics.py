@@ -0,0 +1,153 @@
+"""
+In-process query metrics for the brain postgres layer.
+
+Records per-statement latency, rows returned and pool wait time into fixed-bucket
+histograms keyed by a query label (usually the helper function name). The
+collected metrics can be dumped as a dictionary or rendered in the Prometheus
+text exposition format for scraping.
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds (in seconds) of the latency histogram buckets
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Upper bounds of the rows-returned histogram buckets
+ROW_BUCKETS: tuple[float, ...] = (0, 1, 10, 100, 1000, 10000)
+
+
+@dataclass
+class Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            # One extra slot for the +Inf bucket
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return (upper bound, cumulative count) pairs including +Inf."""
+        result: list[tuple[str, int]] = []
+        running = 0
+        for bound, bucket_count in zip(self.buckets, self.counts):
+            running += bucket_count
+            result.append((repr(float(bound)), running))
+        result.append(("+Inf", running + self.counts[-1]))
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "buckets": dict(self.cumulative()),
+        }
+
+
+@dataclass
+class QueryStats:
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    rows: Histogram = field(default_factory=lambda: Histogram(ROW_BUCKETS))
+    pool_wait: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    errors: int = 0
+
+
+class QueryMetrics:
+    """Thread-safe registry of query histograms keyed by label."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, QueryStats] = {}
+
+    def _get(self, label: str) -> QueryStats:
+        stats = self._stats.get(label)
+        if stats is None:
+            stats = self._stats[label] = QueryStats()
+        return stats
+
+    def observe_query(self, label: str, latency: float, rows: int) -> None:
+        with self._lock:
+            stats = self._get(label)
+            stats.latency.observe(latency)
+            # DBAPI reports -1 when the row count is unknown
+            if rows >= 0:
+                stats.rows.observe(rows)
+
+    def observe_pool_wait(self, label: str, wait: float) -> None:
+        with self._lock:
+            self._get(label).pool_wait.observe(wait)
+
+    def observe_error(self, label: str) -> None:
+        with self._lock:
+            self._get(label).errors += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a plain-dict copy of all collected metrics."""
+        with self._lock:
+            return {
+                label: {
+                    "latency_seconds": stats.latency.to_dict(),
+                    "rows": stats.rows.to_dict(),
+                    "pool_wait_seconds": stats.pool_wait.to_dict(),
+                    "errors": stats.errors,
+                }
+                for label, stats in self._stats.items()
+            }
+
+    def render_prometheus(self, prefix: str = "brain_postgres") -> str:
+        """Render all collected metrics in the Prometheus text format."""
+        lines: list[str] = []
+        with self._lock:
+            items = list(self._stats.items())
+            for metric, attr in (
+                ("query_latency_seconds", "latency"),
+                ("query_rows", "rows"),
+                ("pool_wait_seconds", "pool_wait"),
+            ):
+                name = f"{prefix}_{metric}"
+                lines.append(f"# TYPE {name} histogram")
+                for label, stats in items:
+                    histogram: Histogram = getattr(stats, attr)
+                    for bound, count in histogram.cumulative():
+                        lines.append(
+                            f'{name}_bucket{{query="{label}",le="{bound}"}} {count}'
+                        )
+                    lines.append(f'{name}_sum{{query="{label}"}} {histogram.total}')
+                    lines.append(f'{name}_count{{query="{label}"}} {histogram.count}')
+            name = f"{prefix}_query_errors_total"
+            lines.append(f"# TYPE {name} counter")
+            for label, stats in items:
+                lines.append(f'{name}{{query="{label}"}} {stats.errors}')
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry used by DatabaseEngine
+query_metrics = QueryMetrics()
@@ -1,70 +1,254 @@
 import os
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from pathlib import Path
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Connection, Engine
+
+from org_tools.brain.postgres.metrics import query_metrics
+
+
+@dataclass
+class PoolConfig:
+    """Connection pool settings for the shared engine."""
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_timeout_ms: int = 30000
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        """Build a pool config from DATABASE_POOL_* environment variables."""
+        defaults = cls()
+        return cls(
+            pool_size=int(os.getenv("DATABASE_POOL_SIZE", defaults.pool_size)),
+            max_overflow=int(
+                os.getenv("DATABASE_POOL_MAX_OVERFLOW", defaults.max_overflow)
+            ),
+            pool_timeout=float(
+                os.getenv("DATABASE_POOL_TIMEOUT", defaults.pool_timeout)
+            ),
+            pool_recycle=int(
+                os.getenv("DATABASE_POOL_RECYCLE", defaults.pool_recycle)
+            ),
+            pool_pre_ping=os.getenv(
+                "DATABASE_POOL_PRE_PING", str(defaults.pool_pre_ping)
+            ).lower()
+            in ("1", "true", "yes"),
+            statement_timeout_ms=int(
+                os.getenv(
+                    "DATABASE_STATEMENT_TIMEOUT_MS", defaults.statement_timeout_ms
+                )
+            ),
+        )
+
+
+def _load_database_url() -> str:
+    project_root = Path(__file__).parent.parent.parent
+    env_path = project_root / ".env"
+    load_dotenv(dotenv_path=env_path, override=True)
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL is not set.")
+    return database_url
+
+
+def _instrument_engine(engine: Engine) -> None:
+    """Record per-statement latency and row counts into query_metrics."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(  # type: ignore[no-untyped-def]
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(  # type: ignore[no-untyped-def]
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        start = conn.info["query_start_time"].pop()
+        query_metrics.observe_query(
+            conn.info.get("query_label", "unlabelled"),
+            time.perf_counter() - start,
+            cursor.rowcount,
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):  # type: ignore[no-untyped-def]
+        conn = exception_context.connection
+        label = conn.info.get("query_label", "unlabelled") if conn else "unlabelled"
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
+        query_metrics.observe_error(label)
 
 
 class DatabaseEngine:
     _engine: Optional[Engine] = None
+    _pool_config: Optional[PoolConfig] = None
 
     @classmethod
-    def get_engine(cls) -> Engine:
+    def get_engine(cls, pool_config: Optional[PoolConfig] = None) -> Engine:
         if cls._engine is None:
-            # Load environment and create engine
-            project_root = Path(__file__).parent.parent.parent
-            env_path = project_root / ".env"
-            load_dotenv(dotenv_path=env_path, override=True)
-            database_url = os.getenv("DATABASE_URL")
-            if not database_url:
-                raise ValueError("DATABASE_URL is not set.")
-            cls._engine = create_engine(database_url)
+            # Load environment and create a pooled, instrumented engine
+            database_url = _load_database_url()
+            config = pool_config or PoolConfig.from_env()
+            cls._engine = create_engine(
+                database_url,
+                pool_size=config.pool_size,
+                max_overflow=config.max_overflow,
+                pool_timeout=config.pool_timeout,
+                pool_recycle=config.pool_recycle,
+                pool_pre_ping=config.pool_pre_ping,
+                connect_args={
+                    "options": f"-c statement_timeout={config.statement_timeout_ms}"
+                },
+            )
+            _instrument_engine(cls._engine)
+            cls._pool_config = config
         return cls._engine
 
+    @classmethod
+    @contextmanager
+    def _checkout(cls, label: str, transactional: bool) -> Iterator[Connection]:
+        engine = cls.get_engine()
+        start = time.perf_counter()
+        with engine.begin() if transactional else engine.connect() as conn:
+            query_metrics.observe_pool_wait(label, time.perf_counter() - start)
+            conn.info["query_label"] = label
+            try:
+                yield conn
+            finally:
+                conn.info.pop("query_label", None)
+
+    @classmethod
+    def connect(cls, label: str) -> AbstractContextManager[Connection]:
+        """Check out a pooled connection whose statements are recorded under label."""
+        return cls._checkout(label, transactional=False)
+
+    @classmethod
+    def begin(cls, label: str) -> AbstractContextManager[Connection]:
+        """Check out a pooled connection in a transaction, recorded under label."""
+        return cls._checkout(label, transactional=True)
+
+    @classmethod
+    def pool_status(cls) -> dict[str, Any]:
+        """Return the current checkout state of the connection pool."""
+        pool: Any = cls.get_engine().pool
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+
+
+def get_query_metrics() -> dict[str, Any]:
+    """Dump the in-process query histograms and current pool status."""
+    return {
+        "pool": DatabaseEngine.pool_status(),
+        "queries": query_metrics.snapshot(),
+    }
+
+
+# Statements and row mapping shared with async_postgres, which runs the same reads on
+# an AsyncEngine for callers inside an event loop
+
+USER_QUERY = text("""
+    SELECT *
+    FROM gold.users_base
+    WHERE discord_id = :discord_id
+    LIMIT 1
+""")
+
+USER_FACTS_QUERY = text("""
+    SELECT f.*
+    FROM gold.all_facts f
+    JOIN gold.users_base u ON f.user_name = u.name
+    WHERE u.discord_id = :discord_id
+      AND f.created_at >= :days_ago
+    ORDER BY f.created_at DESC
+""")
+
+AUTHOR_CONTEXT_QUERY = text("""
+    SELECT to_jsonb(u) AS user, COALESCE(f.facts, '[]'::jsonb) AS facts
+    FROM gold.users_base u
+    LEFT JOIN LATERAL (
+        SELECT jsonb_agg(to_jsonb(af) ORDER BY af.created_at DESC) AS facts
+        FROM gold.all_facts af
+        WHERE af.user_name = u.name
+          AND af.created_at >= :days_ago
+    ) f ON TRUE
+    WHERE u.discord_id = :discord_id
+    LIMIT 1
+""")
+
+
+def _facts_params(discord_id: str, days_back: int) -> dict[str, Any]:
+    """Bind parameters for USER_FACTS_QUERY and AUTHOR_CONTEXT_QUERY."""
+    return {
+        "discord_id": discord_id,
+        "days_ago": datetime.now() - timedelta(days=days_back),
+    }
+
+
+def _author_context_from_row(row: Optional[Any]) -> dict[str, Any]:
+    """Map an AUTHOR_CONTEXT_QUERY row (or no row) to get_author_context's result."""
+    if not row:
+        return {"user": None, "facts": []}
+    return {"user": row["user"], "facts": row["facts"]}
+
 
 def get_user(discord_id: str) -> Optional[dict[str, Any]]:
-    engine = DatabaseEngine.get_engine()
-    query = text("""
-        SELECT *
-        FROM gold.users_base
-        WHERE discord_id = :discord_id
-        LIMIT 1
-    """)
-    with engine.connect() as conn:
-        result = conn.execute(query, {"discord_id": discord_id})
+    with DatabaseEngine.connect("get_user") as conn:
+        result = conn.execute(USER_QUERY, {"discord_id": discord_id})
         user = result.mappings().first()
         return dict(user) if user else None
 
 
 def get_user_fact(discord_id: str, days_back: int = 30) -> list[dict[str, Any]]:
-    engine = DatabaseEngine.get_engine()
-    days_ago = datetime.now() - timedelta(days=days_back)
-    query = text("""
-        SELECT f.*
-        FROM gold.all_facts f
-        JOIN gold.users_base u ON f.user_name = u.name
-        WHERE u.discord_id = :discord_id
-          AND f.created_at >= :days_ago
-        ORDER BY f.created_at DESC
-    """)
-    with engine.connect() as conn:
-        result = conn.execute(query, {"discord_id": discord_id, "days_ago": days_ago})
+    with DatabaseEngine.connect("get_user_fact") as conn:
+        result = conn.execute(USER_FACTS_QUERY, _facts_params(discord_id, days_back))
         facts = result.mappings().all()
         return [dict(fact) for fact in facts]
 
 
+def get_author_context(
+    discord_id: str, days_back: int = 30
+) -> dict[str, Any]:
+    """
+    Fetch a user's gold.users_base row and their facts from the last days_back days
+    in a single round trip.
+
+    Args:
+        discord_id: Discord ID of the user
+        days_back: How many days of facts to include
+
+    Returns:
+        Dictionary with "user" (the user row, or None if not found) and "facts"
+        (list of fact rows, newest first)
+    """
+    with DatabaseEngine.connect("get_author_context") as conn:
+        result = conn.execute(AUTHOR_CONTEXT_QUERY, _facts_params(discord_id, days_back))
+        return _author_context_from_row(result.mappings().first())
+
+
 def set_user_fact(discord_id: str, fact_text: str) -> None:
-    engine = DatabaseEngine.get_engine()
     user_query = text("""
         SELECT id
         FROM silver.user
         WHERE discord_id = :discord_id
         LIMIT 1
     """)
-    with engine.begin() as conn:
+    with DatabaseEngine.begin("set_user_fact") as conn:
         user_result = conn.execute(user_query, {"discord_id": discord_id})
         user = user_result.fetchone()
         if not user:
@@ -81,7 +265,6 @@ def set_user_fact(discord_id: str, fact_text: str) -> None:
 def get_user_facts_with_keywords(
     discord_id: str, keywords: list[str]
 ) -> list[dict[str, Any]]:
-    engine = DatabaseEngine.get_engine()
     processed_keywords = [f"%{keyword}%" for keyword in keywords]
     query = text("""
         SELECT f.*
@@ -90,7 +273,7 @@ def get_user_facts_with_keywords(
         WHERE u.discord_id = :discord_id AND f.fact_text LIKE ANY(:keywords)
         ORDER BY f.created_at DESC
     """)
-    with engine.connect() as conn:
+    with DatabaseEngine.connect("get_user_facts_with_keywords") as conn:
         result = conn.execute(
             query, {"discord_id": discord_id, "keywords": processed_keywords}
         )
@@ -99,14 +282,13 @@ def get_user_facts_with_keywords(
 
 
 def delete_fact(discord_id: str, fact_id: str) -> None:
-    engine = DatabaseEngine.get_engine()
     user_query = text("""
         SELECT id
         FROM silver.user
         WHERE discord_id = :discord_id
         LIMIT 1
     """)
-    with engine.begin() as conn:
+    with DatabaseEngine.begin("delete_fact") as conn:
         user_result = conn.execute(user_query, {"discord_id": discord_id})
         user = user_result.fetchone()
         if not user:
@@ -126,7 +308,6 @@ def set_initial_committee_personal_checkup() -> None:
     Only inserts rows for members who don't already have an active checkup record.
     This function is designed to test the SCD2 design without truncating existing data.
     """
-    engine = DatabaseEngine.get_engine()
 
     # Query to find committee members who don't have active checkup records
     query = text("""
@@ -149,7 +330,7 @@ def set_initial_committee_personal_checkup() -> None:
         )
     """)
 
-    with engine.begin() as conn:
+    with DatabaseEngine.begin("set_initial_committee_personal_checkup") as conn:
         result = conn.execute(query)
         inserted_count = result.rowcount
         print(f"✅ Initialized {inserted_count} committee personal checkup records")
@@ -170,7 +351,6 @@ def set_committee_personal_checkup(
         checkup_text: The checkup text to add
         start_date: Start date for the new checkup record
     """
-    engine = DatabaseEngine.get_engine()
 
     # First, find the member_id for the given discord_id
     committee_query = text("""
@@ -180,7 +360,7 @@ def set_committee_personal_checkup(
         LIMIT 1
     """)
 
-    with engine.begin() as conn:
+    with DatabaseEngine.begin("set_committee_personal_checkup") as conn:
         # Get committee info
         committee_result = conn.execute(committee_query, {"discord_id": discord_id})
         committee = committee_result.fetchone()
@@ -251,14 +431,13 @@ def get_latest_personal_checkup(discord_id: str) -> str:
     Fetch the most recent personal checkup row for a given discord_id.
     Returns a formatted string with the personal description and latest checkup for LLM consumption.
     """
-    engine = DatabaseEngine.get_engine()
     committee_query = text("""
         SELECT member_id, name
         FROM silver.committee
         WHERE discord_id = :discord_id
         LIMIT 1
     """)
-    with engine.connect() as conn:
+    with DatabaseEngine.connect("get_latest_personal_checkup") as conn:
         committee_result = conn.execute(committee_query, {"discord_id": discord_id})
         committee = committee_result.fetchone()
         if not committee:
@@ -297,14 +476,13 @@ def get_checkups_for_discord_id(
     Fetch all checkups for a discord_id, or as of a particular datetime if provided.
     Returns a dictionary with the latest personal description and all relevant checkups with their dates.
     """
-    engine = DatabaseEngine.get_engine()
     committee_query = text("""
         SELECT member_id, name
         FROM silver.committee
         WHERE discord_id = :discord_id
         LIMIT 1
     """)
-    with engine.connect() as conn:
+    with DatabaseEngine.connect("get_checkups_for_discord_id") as conn:
         committee_result = conn.execute(committee_query, {"discord_id": discord_id})
         committee = committee_result.fetchone()
         if not committee:
@@ -365,14 +543,13 @@ def get_current_personal_description(discord_id: str) -> str:
     Fetch the current personal description for a given discord_id.
     Returns the personal description from the most recent checkup record.
     """
-    engine = DatabaseEngine.get_engine()
     committee_query = text("""
         SELECT member_id, name
         FROM silver.committee
         WHERE discord_id = :discord_id
         LIMIT 1
     """)
-    with engine.connect() as conn:
+    with DatabaseEngine.connect("get_current_personal_description") as conn:
         committee_result = conn.execute(committee_query, {"discord_id": discord_id})
         committee = committee_result.fetchone()
         if not committee:
@@ -404,7 +581,6 @@ def set_personal_description(discord_id: str, personal_description: str) -> None
         discord_id: Discord ID of the committee member
         personal_description: The new personal description to set
     """
-    engine = DatabaseEngine.get_engine()
 
     # First, find the member_id for the given discord_id
     committee_query = text("""
@@ -414,7 +590,7 @@ def set_personal_description(discord_id: str, personal_description: str) -> None
         LIMIT 1
     """)
 
-    with engine.begin() as conn:
+    with DatabaseEngine.begin("set_personal_description") as conn:
         # Get committee info
         committee_result = conn.execute(committee_query, {"discord_id": discord_id})
         committee = committee_result.fetchone()
@@ -449,77 +625,322 @@ def set_personal_description(discord_id: str, personal_description: str) -> None
         print(f"   New description: {personal_description}")
 
 
-def get_committee_member_by_notion_id(notion_id: str) -> Optional[dict[str, Any]]:
+class CommitteeDirectory:
+    """
+    In-process read-through cache of silver.committee.
+
+    The whole table is loaded with a single SELECT and indexed on discord_id,
+    notion_id and discord_dm_channel_id, so lookups are dict hits until the TTL
+    expires or the directory is explicitly invalidated.
+    """
+
+    KEYS = ("discord_id", "notion_id", "discord_dm_channel_id")
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self._members: list[dict[str, Any]] = []
+        self._indexes: dict[str, dict[str, dict[str, Any]]] = {
+            key: {} for key in self.KEYS
+        }
+
+    def is_stale(self) -> bool:
+        with self._lock:
+            return (
+                self._loaded_at is None
+                or time.monotonic() - self._loaded_at > self.ttl_seconds
+            )
+
+    def load(self, members: list[dict[str, Any]]) -> None:
+        """Replace the cached directory with the given committee rows."""
+        indexes: dict[str, dict[str, dict[str, Any]]] = {key: {} for key in self.KEYS}
+        for member in members:
+            for key in self.KEYS:
+                # Keys are normalised to str since callers pass both str and int IDs
+                if member.get(key) is not None:
+                    indexes[key].setdefault(str(member[key]), member)
+        with self._lock:
+            self._members = members
+            self._indexes = indexes
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def get(self, key: str, value: Any) -> Optional[dict[str, Any]]:
+        with self._lock:
+            member = self._indexes[key].get(str(value))
+        return dict(member) if member else None
+
+    def members(self) -> list[dict[str, Any]]:
+        with self._lock:
+            members = self._members
+        return [dict(member) for member in members]
+
+
+COMMITTEE_DIRECTORY_QUERY = text("""
+    SELECT member_id, name, notion_id, discord_id, discord_dm_channel_id, ingestion_timestamp
+    FROM silver.committee
+    ORDER BY member_id
+""")
+
+# Uncached single-member lookups, keyed by the column matched (also the bind parameter)
+COMMITTEE_MEMBER_QUERIES = {
+    column: text(f"""
+        SELECT member_id, name, notion_id, discord_id, discord_dm_channel_id, ingestion_timestamp
+        FROM silver.committee
+        WHERE {column} = :{column}
+        LIMIT 1
+    """)
+    for column in ("notion_id", "discord_id", "discord_dm_channel_id")
+}
+
+committee_directory = CommitteeDirectory(
+    ttl_seconds=float(os.getenv("COMMITTEE_CACHE_TTL_SECONDS", "600"))
+)
+
+
+def get_committee_directory() -> CommitteeDirectory:
+    """Return the committee directory, reloading it from silver.committee if stale."""
+    if committee_directory.is_stale():
+        with DatabaseEngine.connect("load_committee_directory") as conn:
+            members = conn.execute(COMMITTEE_DIRECTORY_QUERY).mappings().all()
+        committee_directory.load([dict(member) for member in members])
+    return committee_directory
+
+
+def get_committee_members() -> list[dict[str, Any]]:
+    """Return every row of silver.committee from the cached directory."""
+    return get_committee_directory().members()
+
+
+def invalidate_committee_directory() -> None:
+    """Force the next committee lookup to reload silver.committee."""
+    committee_directory.invalidate()
+
+
+def get_committee_member_by_notion_id(
+    notion_id: str, bypass_cache: bool = False
+) -> Optional[dict[str, Any]]:
     """
     Retrieve a committee member by their Notion ID.
 
     Args:
         notion_id: The Notion ID of the committee member
+        bypass_cache: Query silver.committee directly instead of the cached directory
+            (use after writing to the table)
 
     Returns:
         Dictionary containing member data or None if not found
     """
-    engine = DatabaseEngine.get_engine()
-    query = text("""
-        SELECT member_id, name, notion_id, discord_id, discord_dm_channel_id, ingestion_timestamp
-        FROM silver.committee
-        WHERE notion_id = :notion_id
-        LIMIT 1
-    """)
-    with engine.connect() as conn:
-        result = conn.execute(query, {"notion_id": notion_id})
+    if not bypass_cache:
+        return get_committee_directory().get("notion_id", notion_id)
+
+    with DatabaseEngine.connect("get_committee_member_by_notion_id") as conn:
+        result = conn.execute(COMMITTEE_MEMBER_QUERIES["notion_id"], {"notion_id": notion_id})
         member = result.mappings().first()
         return dict(member) if member else None
 
 
-def get_committee_member_by_discord_id(discord_id: str) -> Optional[dict[str, Any]]:
+def get_committee_member_by_discord_id(
+    discord_id: str, bypass_cache: bool = False
+) -> Optional[dict[str, Any]]:
     """
     Retrieve a committee member by their Discord ID.
 
     Args:
         discord_id: The Discord ID of the committee member
+        bypass_cache: Query silver.committee directly instead of the cached directory
+            (use after writing to the table)
 
     Returns:
         Dictionary containing member data or None if not found
     """
-    engine = DatabaseEngine.get_engine()
-    query = text("""
-        SELECT member_id, name, notion_id, discord_id, discord_dm_channel_id, ingestion_timestamp
-        FROM silver.committee
-        WHERE discord_id = :discord_id
-        LIMIT 1
-    """)
-    with engine.connect() as conn:
-        result = conn.execute(query, {"discord_id": discord_id})
+    if not bypass_cache:
+        return get_committee_directory().get("discord_id", discord_id)
+
+    with DatabaseEngine.connect("get_committee_member_by_discord_id") as conn:
+        result = conn.execute(COMMITTEE_MEMBER_QUERIES["discord_id"], {"discord_id": discord_id})
         member = result.mappings().first()
         return dict(member) if member else None
 
 
 def get_committee_member_by_discord_dm_channel_id(
-    discord_dm_channel_id: int,
+    discord_dm_channel_id: int, bypass_cache: bool = False
 ) -> Optional[dict[str, Any]]:
     """
     Retrieve a committee member by their Discord DM channel ID.
 
     Args:
         discord_dm_channel_id: The Discord DM channel ID of the committee member
+        bypass_cache: Query silver.committee directly instead of the cached directory
+            (use after writing to the table)
 
     Returns:
         Dictionary containing member data or None if not found
     """
-    engine = DatabaseEngine.get_engine()
-    query = text("""
-        SELECT member_id, name, notion_id, discord_id, discord_dm_channel_id, ingestion_timestamp
-        FROM silver.committee
-        WHERE discord_dm_channel_id = :discord_dm_channel_id
-        LIMIT 1
-    """)
-    with engine.connect() as conn:
-        result = conn.execute(query, {"discord_dm_channel_id": discord_dm_channel_id})
+    if not bypass_cache:
+        return get_committee_directory().get("discord_dm_channel_id", discord_dm_channel_id)
+
+    with DatabaseEngine.connect("get_committee_member_by_discord_dm_channel_id") as conn:
+        result = conn.execute(COMMITTEE_MEMBER_QUERIES["discord_dm_channel_id"], {"discord_dm_channel_id": discord_dm_channel_id})
         member = result.mappings().first()
         return dict(member) if member else None
 
 
+def add_task_progress(notion_task_id: str, user_name: str, progress_text: str) -> int:
+    """
+    Append a progress update for a Notion task to silver.task_progress_log.
+
+    Args:
+        notion_task_id: The Notion ID of the task
+        user_name: Name of the person reporting the progress
+        progress_text: The progress update
+
+    Returns:
+        The progress_id of the new log entry
+    """
+    query = text("""
+        INSERT INTO silver.task_progress_log (notion_task_id, user_name, progress_text)
+        VALUES (:notion_task_id, :user_name, :progress_text)
+        RETURNING progress_id
+    """)
+    with DatabaseEngine.begin("add_task_progress") as conn:
+        result = conn.execute(
+            query,
+            {
+                "notion_task_id": notion_task_id,
+                "user_name": user_name,
+                "progress_text": progress_text,
+            },
+        )
+        return result.scalar_one()
+
+
+def get_task_progress(notion_task_id: str, limit: int = 50) -> list[dict[str, Any]]:
+    """Return the latest progress log entries of a task, oldest first."""
+    query = text("""
+        SELECT *
+        FROM (
+            SELECT progress_id, notion_task_id, user_name, progress_text, created_at
+            FROM silver.task_progress_log
+            WHERE notion_task_id = :notion_task_id
+            ORDER BY progress_id DESC
+            LIMIT :limit
+        ) latest
+        ORDER BY progress_id
+    """)
+    with DatabaseEngine.connect("get_task_progress") as conn:
+        result = conn.execute(query, {"notion_task_id": notion_task_id, "limit": limit})
+        return [dict(row) for row in result.mappings().all()]
+
+
+def get_tasks_with_unpushed_progress() -> list[str]:
+    """Return the Notion IDs of tasks with progress logged since their last push to Notion."""
+    query = text("""
+        SELECT l.notion_task_id
+        FROM silver.task_progress_log l
+        LEFT JOIN silver.task_progress_sync s ON s.notion_task_id = l.notion_task_id
+        GROUP BY l.notion_task_id, s.last_progress_id
+        HAVING MAX(l.progress_id) > COALESCE(s.last_progress_id, 0)
+    """)
+    with DatabaseEngine.connect("get_tasks_with_unpushed_progress") as conn:
+        return list(conn.execute(query).scalars().all())
+
+
+def get_task_progress_sync(notion_task_id: str) -> Optional[dict[str, Any]]:
+    """Return a task's silver.task_progress_sync row, or None if it was never pushed."""
+    query = text("""
+        SELECT notion_task_id, last_progress_id, legacy_progress, pushed_at
+        FROM silver.task_progress_sync
+        WHERE notion_task_id = :notion_task_id
+    """)
+    with DatabaseEngine.connect("get_task_progress_sync") as conn:
+        row = conn.execute(query, {"notion_task_id": notion_task_id}).mappings().fetchone()
+        return dict(row) if row else None
+
+
+def seed_task_progress_sync(notion_task_id: str, legacy_progress: Optional[str]) -> None:
+    """
+    Create a task's sync row before its first push, keeping the Task Progress text
+    written before the log existed. An existing row is left alone.
+
+    Args:
+        notion_task_id: The Notion ID of the task
+        legacy_progress: The task's Task Progress text as read from Notion
+    """
+    query = text("""
+        INSERT INTO silver.task_progress_sync (notion_task_id, last_progress_id, legacy_progress)
+        VALUES (:notion_task_id, 0, :legacy_progress)
+        ON CONFLICT (notion_task_id) DO NOTHING
+    """)
+    with DatabaseEngine.begin("seed_task_progress_sync") as conn:
+        conn.execute(
+            query,
+            {"notion_task_id": notion_task_id, "legacy_progress": legacy_progress},
+        )
+
+
+def set_task_progress_pushed(notion_task_id: str, last_progress_id: int) -> None:
+    """Record that a task's progress up to last_progress_id has been pushed to Notion."""
+    query = text("""
+        INSERT INTO silver.task_progress_sync (notion_task_id, last_progress_id, pushed_at)
+        VALUES (:notion_task_id, :last_progress_id, CURRENT_TIMESTAMP)
+        ON CONFLICT (notion_task_id) DO UPDATE
+        SET last_progress_id = GREATEST(silver.task_progress_sync.last_progress_id, EXCLUDED.last_progress_id),
+            pushed_at = EXCLUDED.pushed_at
+    """)
+    with DatabaseEngine.begin("set_task_progress_pushed") as conn:
+        conn.execute(
+            query,
+            {"notion_task_id": notion_task_id, "last_progress_id": last_progress_id},
+        )
+
+
+def get_notion_users() -> list[dict[str, Any]]:
+    """Return the mirrored Notion workspace users from bronze.notion_user."""
+    query = text("""
+        SELECT user_id, name, user_type, email, avatar_url, seen_at
+        FROM bronze.notion_user
+        ORDER BY name
+    """)
+    with DatabaseEngine.connect("get_notion_users") as conn:
+        return [dict(row) for row in conn.execute(query).mappings().all()]
+
+
+def set_notion_users(users: list[dict[str, Any]]) -> None:
+    """
+    Replace bronze.notion_user with a complete users.list listing.
+
+    Args:
+        users: Rows with user_id, name, user_type, email and avatar_url
+    """
+    if not users:
+        # An empty listing is a failed fetch, not an empty workspace
+        return
+    seen_at = datetime.now()
+    upsert_query = text("""
+        INSERT INTO bronze.notion_user (user_id, name, user_type, email, avatar_url, seen_at)
+        VALUES (:user_id, :name, :user_type, :email, :avatar_url, :seen_at)
+        ON CONFLICT (user_id) DO UPDATE
+        SET name = EXCLUDED.name,
+            user_type = EXCLUDED.user_type,
+            email = EXCLUDED.email,
+            avatar_url = EXCLUDED.avatar_url,
+            seen_at = EXCLUDED.seen_at
+    """)
+    # Users missing from the listing have left the workspace
+    delete_query = text("""
+        DELETE FROM bronze.notion_user
+        WHERE seen_at < :seen_at
+    """)
+    with DatabaseEngine.begin("set_notion_users") as conn:
+        conn.execute(upsert_query, [{**user, "seen_at": seen_at} for user in users])
+        conn.execute(delete_query, {"seen_at": seen_at})
+
+
 def main():
     print(get_committee_member_by_discord_id("241085495398891521"))
 
@@ -6,6 +6,7 @@ from org_tools.brain.postgres.postgres import (
     get_user_fact,
     get_user,
 )
+from org_tools.brain.postgres import async_postgres
 
 # TODO maybe fact type
 
@@ -55,3 +56,15 @@ def get_user_info(discord_id: str) -> str:
     """
     user_info: Optional[dict[str, Any]] = get_user(discord_id)
     return str(user_info)
+
+
+async def get_author_context_async(discord_id: str) -> tuple[str, str]:
+    """
+    Retrieves a user's information and recent facts in a single query.
+    Args:
+        discord_id: The Discord ID of the user to retrieve context for.
+    Returns:
+        A tuple of (user information, facts about the user) as strings.
+    """
+    context: dict[str, Any] = await async_postgres.get_author_context(discord_id)
+    return str(context["user"]), str(context["facts"])
@@ -1,8 +1,14 @@
 import base64
+import codecs
 import os
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from email.message import Message
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any, Optional
+from html.parser import HTMLParser
+from typing import Any, Iterator, Optional
 
 
 # there are no types for googleapis bruh
@@ -22,33 +28,119 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CLIENT_SECRET_PATH = os.path.join(SCRIPT_DIR, "secrets/client_secret.json")
 TOKEN_PATH = os.path.join(SCRIPT_DIR, "secrets/token.json")
 
+email_dict_type = dict[Any, Any]
 
-def __authenticate() -> Any:
-    
-    """Authenticate with Gmail API using OAuth2."""
-    # Check if token.json exists
+
+# Refresh the access token this long before it expires, so no request is sent with a stale one
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+# Gmail accepts up to 100 requests per batch but throttles large batches, 50 is the recommended size
+BATCH_SIZE = 50
+
+# Body text returned per email; newsletters would otherwise flood the LLM context
+MAX_BODY_CHARS = int(os.getenv("GMAIL_MAX_BODY_CHARS", "4000"))
+# Most bytes decoded from a single MIME part, bounding memory for huge HTML parts
+MAX_PART_BYTES = 256 * 1024
+TRUNCATED_MARKER = "\n[truncated]"
+
+_creds: Optional[Credentials] = None
+_creds_lock = threading.Lock()
+# httplib2 connections aren't thread-safe, so each thread builds its own service on the shared credentials
+_local = threading.local()
+
+
+def __load_credentials() -> Credentials:
+    """Load credentials from token.json, running the OAuth flow if there are none."""
+    creds: Optional[Credentials] = None
     if os.path.exists(TOKEN_PATH):
-        creds : Credentials = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)  # type: ignore
-
-        # If credentials are not valid or don't exist, get new ones
-        if not creds or not creds.valid:
-            
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    CLIENT_SECRET_PATH, SCOPES, redirect_uri="http://localhost:8080/"
-                )
-                creds = flow.run_local_server(port=8080)
-
-            # Save credentials for future use
-            with open(TOKEN_PATH, "w") as token:
-                token.write(creds.to_json())
-
-    service: Any = build("gmail", "v1", credentials=creds)  # type: ignore
+        creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)  # type: ignore
+
+    if not creds or not (creds.valid or creds.refresh_token):
+        flow = InstalledAppFlow.from_client_secrets_file(
+            CLIENT_SECRET_PATH, SCOPES, redirect_uri="http://localhost:8080/"
+        )
+        creds = flow.run_local_server(port=8080)
+        __save_credentials(creds)
+    return creds  # type: ignore
+
+
+def __save_credentials(creds: Credentials) -> None:
+    with open(TOKEN_PATH, "w") as token:
+        token.write(creds.to_json())
+
+
+def __authenticate() -> Any:
+    """
+    Get the Gmail API service for this thread.
+
+    Credentials are read from disk once per process and refreshed shortly before they
+    expire; the service is built once per thread from the bundled discovery document.
+    """
+    global _creds
+    with _creds_lock:
+        if _creds is None:
+            _creds = __load_credentials()
+
+        # creds.expiry is a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        expires_soon = _creds.expiry is not None and _creds.expiry - now < TOKEN_REFRESH_MARGIN
+        if (not _creds.valid or expires_soon) and _creds.refresh_token:
+            _creds.refresh(Request())
+            __save_credentials(_creds)
+        creds = _creds
+
+    service: Any = getattr(_local, "service", None)
+    if service is None or getattr(_local, "creds", None) is not creds:
+        service = build("gmail", "v1", credentials=creds, cache_discovery=False)  # type: ignore
+        _local.service = service
+        _local.creds = creds
     return service
 
 
+def __batch_get_messages(
+    service: Any,
+    message_ids: list[str],
+    message_format: str = "full",
+    missing: Optional[set[str]] = None,
+    failed: Optional[set[str]] = None,
+) -> list[email_dict_type]:
+    """
+    Fetch messages through the Gmail batch endpoint, BATCH_SIZE per HTTP request.
+
+    Args:
+        service: Gmail API service
+        message_ids: IDs of the messages to fetch
+        message_format: "full" for headers and body, "metadata" for headers only
+        missing: If given, collects the IDs Gmail reports as not found
+        failed: If given, collects the IDs that couldn't be fetched for any other reason
+
+    Returns:
+        The messages that were fetched, in the order of message_ids
+    """
+    fetched: dict[str, email_dict_type] = {}
+
+    def collect(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+        if exception is not None:
+            if missing is not None and getattr(getattr(exception, "resp", None), "status", None) == 404:
+                missing.add(request_id)
+                return
+            print(f"Error fetching email {request_id}: {exception!s}")
+            if failed is not None:
+                failed.add(request_id)
+            return
+        fetched[request_id] = response
+
+    for start in range(0, len(message_ids), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=collect)
+        for message_id in message_ids[start : start + BATCH_SIZE]:
+            batch.add(
+                service.users().messages().get(userId="me", id=message_id, format=message_format),
+                request_id=message_id,
+            )
+        batch.execute()
+
+    return [fetched[message_id] for message_id in message_ids if message_id in fetched]
+
+
 def send_email(to: str, subject: str, body: str, is_html: bool = False) -> bool:
     """
     Send an email using Gmail API.
@@ -78,34 +170,83 @@ def send_email(to: str, subject: str, body: str, is_html: bool = False) -> bool:
 
 
 
-email_dict_type = dict[Any, Any]
+def __use_mailbox_by_default() -> bool:
+    return os.getenv("GMAIL_READ_FROM_MAILBOX", "").lower() in ("1", "true", "yes")
 
 
-def read_emails(max_results: int = 10) -> list[email_dict_type]:
+def read_emails(
+    max_results: int = 10,
+    include_body: bool = True,
+    sender: Optional[str] = None,
+    subject: Optional[str] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    max_body_chars: int = MAX_BODY_CHARS,
+) -> list[email_dict_type]:
     """
-    Read recent emails from the inbox.
+    Read recent emails from the inbox, optionally searching by sender, subject and date.
+
+    With GMAIL_READ_FROM_MAILBOX set, emails are served from the synced Postgres mailbox,
+    falling back to the Gmail API when it is unavailable.
 
     Args:
         max_results: Maximum number of emails to retrieve
+        include_body: Whether to fetch the email bodies, or only the headers (faster, e.g. to scan senders and subjects)
+        sender: Only emails whose sender contains this text
+        subject: Only emails whose subject contains this text
+        after: Only emails received on or after this date (YYYY-MM-DD)
+        before: Only emails received before this date (YYYY-MM-DD)
+        max_body_chars: Most characters of each email body to return, longer bodies are truncated
 
     Returns:
         List of dictionaries containing email details
     """
+    if __use_mailbox_by_default():
+        try:
+            # Imported lazily so the client works without the database dependencies
+            from org_tools.gmail.mailbox import get_mailbox
+
+            return get_mailbox().search(
+                max_results,
+                include_body,
+                sender=sender,
+                subject=subject,
+                after=after,
+                before=before,
+                max_body_chars=max_body_chars,
+            )
+        except Exception as e:
+            print(f"Gmail mailbox unavailable, reading from Gmail: {e!s}")
+
     service = __authenticate()
     try:
+        # Gmail search syntax; dates are inclusive for after: and exclusive for before:
+        terms: list[str] = []
+        if sender:
+            terms.append(f'from:"{sender}"')
+        if subject:
+            terms.append(f'subject:"{subject}"')
+        if after:
+            terms.append(f"after:{after.replace('-', '/')}")
+        if before:
+            terms.append(f"before:{before.replace('-', '/')}")
+
         # Get a list of emails from recent inbox
         results = (
-            service.users().messages().list(userId="me", maxResults=max_results).execute()
+            service.users()
+            .messages()
+            .list(userId="me", maxResults=max_results, q=" ".join(terms))
+            .execute()
         )
-        messages = results.get("messages", [])
-        emails : list[email_dict_type] = []
+        message_ids = [message["id"] for message in results.get("messages", [])]
 
-        # Get the email details
-        for message in messages:
-            msg = service.users().messages().get(userId="me", id=message["id"]).execute()
-
-            processed_email : email_dict_type = __process_email(msg)
-            emails.append(processed_email)
+        # Get the email details in batched requests
+        messages = __batch_get_messages(
+            service, message_ids, "full" if include_body else "metadata"
+        )
+        emails : list[email_dict_type] = [
+            __process_email(msg, include_body, max_body_chars) for msg in messages
+        ]
 
         return emails
     
@@ -114,40 +255,191 @@ def read_emails(max_results: int = 10) -> list[email_dict_type]:
         return []
 
 
-def __process_email(email: email_dict_type) -> email_dict_type:
+# The helpers below are used from inside GmailMessage, where double-underscore names
+# would be mangled, so they take a single underscore
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Collect the visible text of an HTML document, one line per block element."""
+
+    SKIPPED_TAGS = {"script", "style", "head", "title"}
+    BLOCK_TAGS = {"br", "p", "div", "tr", "li", "h1", "h2", "h3", "h4", "h5", "h6", "table", "blockquote"}
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.chunks: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if tag in self.SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.chunks.append("\n")
+        elif tag in ("td", "th"):
+            self.chunks.append(" ")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self.SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.chunks.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.chunks.append(data)
+
+
+def _html_to_text(html: str) -> str:
+    """Convert HTML to plain text, dropping markup, scripts and styles."""
+    extractor = _HTMLTextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    text = "".join(extractor.chunks)
+    # Collapse the indentation and blank-line runs templated mail is full of
+    lines = (re.sub(r"[ \t\r\f\v\xa0]+", " ", line).strip() for line in text.split("\n"))
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def _truncate_text(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + TRUNCATED_MARKER
+
+
+def _part_header(part: email_dict_type, name: str) -> Optional[str]:
+    return next(
+        (
+            header["value"]
+            for header in part.get("headers", [])
+            if header["name"].lower() == name
+        ),
+        None,
+    )
+
+
+def _decode_part(part: email_dict_type, max_bytes: int) -> tuple[str, bool]:
     """
-    Process an email and extract relevant information.
+    Decode at most max_bytes of a MIME part's body.
 
     Args:
-        email: raw dictionary containing email details sent from gmail api
+        part: MIME part from the Gmail API payload, whose body data is base64url encoded
+        max_bytes: Most bytes to decode; base64 is decoded in whole 4-character groups
 
     Returns:
-        Dictionary containing processed email information
+        The decoded text, in the part's charset, and whether the part was cut short
     """
+    data: str = part.get("body", {}).get("data", "")
+    if not data:
+        return "", False
+    data = data[: -(-max_bytes // 3) * 4]
+    raw = base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+    content_type = Message()
+    content_type["Content-Type"] = _part_header(part, "content-type") or "text/plain"
+    charset = content_type.get_content_charset() or "utf-8"
+    try:
+        codecs.lookup(charset)
+    except LookupError:
+        charset = "utf-8"
+    # A cut can land inside a multi-byte character, replace it rather than fail
+    return raw[:max_bytes].decode(charset, errors="replace"), len(raw) > max_bytes
 
-    processed_email : email_dict_type = {}
 
-    # Get the id
-    processed_email["id"] = email["id"]
+def _iter_text_parts(part: email_dict_type) -> Iterator[email_dict_type]:
+    """Walk the MIME tree depth first, yielding inline text/plain and text/html parts."""
+    mime_type: str = part.get("mimeType", "")
+    if mime_type.startswith("multipart/"):
+        for child in part.get("parts", []):
+            yield from _iter_text_parts(child)
+    elif mime_type in ("text/plain", "text/html") and not part.get("filename"):
+        yield part
 
-    # Get the main headers
-    processed_email["headers"] = []
-    for header in email["payload"]["headers"]:
-        if not header["name"].startswith("X-"):
 
-            processed_email["headers"].append(header)
+class GmailMessage:
+    """
+    A Gmail API message whose body is only decoded when asked for.
 
-    # Get message body
-    if "parts" in email["payload"]:
-        body = email["payload"]["parts"][0]["body"].get("data", "")
-    else:
-        body = email["payload"]["body"].get("data", "")
-    # Decode the body
-    if body:
-        body = base64.urlsafe_b64decode(body.encode("ASCII")).decode("utf-8")
+    Headers are read up front. body() walks the MIME tree for the first text/plain part,
+    falling back to the first text/html part converted to text, and decodes no more of it
+    than the character budget needs.
+    """
 
-    processed_email["body"] = body
-    return processed_email
+    def __init__(self, message: email_dict_type) -> None:
+        self.id: str = message["id"]
+        self.payload: email_dict_type = message.get("payload", {})
+        self.headers: list[dict[str, str]] = [
+            header
+            for header in self.payload.get("headers", [])
+            if not header["name"].startswith("X-")
+        ]
+        self._bodies: dict[int, str] = {}
+
+    def header(self, name: str) -> Optional[str]:
+        return _part_header({"headers": self.headers}, name.lower())
+
+    def body(self, max_chars: int = MAX_BODY_CHARS) -> str:
+        """
+        Extract the message text, truncated to max_chars.
+
+        Args:
+            max_chars: Most characters of body text to return
+
+        Returns:
+            The body text, ending in TRUNCATED_MARKER if it was cut, or "" for
+            metadata-format messages and messages without a text part
+        """
+        if max_chars in self._bodies:
+            return self._bodies[max_chars]
+
+        html_part: Optional[email_dict_type] = None
+        text, cut = "", False
+        for part in _iter_text_parts(self.payload):
+            if part["mimeType"] == "text/plain":
+                # No charset needs more than 4 bytes per character, so this always covers max_chars
+                text, cut = _decode_part(part, min(MAX_PART_BYTES, max_chars * 4))
+                break
+            if html_part is None:
+                html_part = part
+        else:
+            if html_part is not None:
+                html, cut = _decode_part(html_part, MAX_PART_BYTES)
+                text = _html_to_text(html)
+
+        if cut and len(text) <= max_chars:
+            text += TRUNCATED_MARKER
+        else:
+            text = _truncate_text(text, max_chars)
+        self._bodies[max_chars] = text
+        return text
+
+    def to_dict(
+        self, include_body: bool = True, max_body_chars: int = MAX_BODY_CHARS
+    ) -> email_dict_type:
+        """The id, non X- headers and (optionally) body, as read_emails returns them."""
+        return {
+            "id": self.id,
+            "headers": self.headers,
+            "body": self.body(max_body_chars) if include_body else "",
+        }
+
+
+def __process_email(
+    email: email_dict_type,
+    include_body: bool = True,
+    max_body_chars: int = MAX_BODY_CHARS,
+) -> email_dict_type:
+    """
+    Process an email and extract relevant information.
+
+    Args:
+        email: raw dictionary containing email details sent from gmail api
+        include_body: Whether to extract the body text
+        max_body_chars: Most characters of body text to keep
+
+    Returns:
+        Dictionary containing processed email information
+    """
+    return GmailMessage(email).to_dict(include_body, max_body_chars)
 
 
 def reply_to_email(email_id: str, body: str, is_html: bool = False) -> bool:
@@ -0,0 +1,482 @@
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from googleapiclient.errors import HttpError  # type: ignore
+from sqlalchemy import text
+
+from org_tools.brain.postgres.postgres import DatabaseEngine
+
+# Module-level imports of the client's private helpers aren't name-mangled, unlike
+# references from inside a class body, so alias them here
+from org_tools.gmail.gmail_client import __authenticate as _authenticate
+from org_tools.gmail.gmail_client import __batch_get_messages as _batch_get_messages
+from org_tools.gmail.gmail_client import (
+    MAX_BODY_CHARS,
+    GmailMessage,
+    _truncate_text,
+    email_dict_type,
+)
+
+# Most recent messages stored by a full sync; older mail is only reachable through Gmail
+INITIAL_SYNC_MESSAGES = 500
+# messages.list and history.list both cap pages at 500
+LIST_PAGE_SIZE = 500
+# Kept in the store so label changes can move mail back, but never returned by search
+HIDDEN_LABELS = ["SPAM", "TRASH"]
+# Pause before retrying messages a batch failed to fetch (rate limits, 5xx)
+FETCH_RETRY_SECONDS = 2.0
+
+
+class MailboxSyncError(Exception):
+    """A sync couldn't fetch every message it needs; the stored sync position is not advanced"""
+    pass
+
+
+@dataclass
+class MailboxSyncResult:
+    account: str
+    full: bool
+    history_id: int
+    messages_upserted: int = 0
+    messages_deleted: int = 0
+    labels_updated: int = 0
+    seconds: float = 0.0
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _received_at(message: email_dict_type) -> datetime:
+    return datetime.fromtimestamp(int(message["internalDate"]) / 1000, timezone.utc).replace(
+        tzinfo=None
+    )
+
+
+class GmailMailbox:
+    """
+    Mirrors the Gmail mailbox into bronze.gmail_message.
+
+    A full sync stores the most recent initial_sync_messages messages and records the
+    mailbox historyId. Every later sync replays users.history.list from that historyId,
+    so only added and deleted messages and label changes are fetched. Gmail keeps
+    history for about a week; when the stored historyId has expired the next sync falls
+    back to a full one, which only downloads messages that aren't stored yet. Spam and
+    trash stay in the store with their labels but are left out of search.
+    """
+
+    def __init__(
+        self,
+        initial_sync_messages: int = INITIAL_SYNC_MESSAGES,
+        max_staleness: timedelta = timedelta(seconds=60),
+    ) -> None:
+        self.initial_sync_messages = initial_sync_messages
+        self.max_staleness = max_staleness
+        self._account: Optional[str] = None
+        # Serialises syncs, so concurrent tool calls don't replay the same history twice
+        self._sync_lock = threading.Lock()
+
+    def _get_account(self, service: Any) -> str:
+        if self._account is None:
+            profile = service.users().getProfile(userId="me").execute()
+            self._account = profile["emailAddress"]
+        return self._account
+
+    def _get_state(self, account: str) -> Optional[dict[str, Any]]:
+        query = text("""
+            SELECT history_id, last_sync_at, last_full_sync_at
+            FROM bronze.gmail_sync_state
+            WHERE account = :account
+        """)
+        with DatabaseEngine.connect("gmail_mailbox_get_state") as conn:
+            row = conn.execute(query, {"account": account}).mappings().fetchone()
+        return dict(row) if row else None
+
+    def _get_stored_ids(self, account: str, since: Optional[datetime] = None) -> set[str]:
+        query = text(f"""
+            SELECT message_id FROM bronze.gmail_message
+            WHERE account = :account{" AND received_at >= :since" if since else ""}
+        """)
+        with DatabaseEngine.connect("gmail_mailbox_get_stored_ids") as conn:
+            return set(
+                conn.execute(query, {"account": account, "since": since}).scalars().all()
+            )
+
+    def _upsert_messages(self, account: str, messages: list[email_dict_type]) -> None:
+        if not messages:
+            return
+        query = text("""
+            INSERT INTO bronze.gmail_message
+                (account, message_id, thread_id, label_ids, sender, subject, snippet, headers, body, received_at)
+            VALUES
+                (:account, :message_id, :thread_id, :label_ids, :sender, :subject, :snippet,
+                 CAST(:headers AS JSONB), :body, :received_at)
+            ON CONFLICT (account, message_id) DO UPDATE SET
+                label_ids = EXCLUDED.label_ids,
+                headers = EXCLUDED.headers,
+                body = EXCLUDED.body,
+                ingestion_timestamp = CURRENT_TIMESTAMP
+        """)
+        rows = []
+        for message in messages:
+            email = GmailMessage(message)
+            rows.append(
+                {
+                    "account": account,
+                    "message_id": message["id"],
+                    "thread_id": message.get("threadId"),
+                    "label_ids": message.get("labelIds", []),
+                    "sender": email.header("From"),
+                    "subject": email.header("Subject"),
+                    "snippet": message.get("snippet"),
+                    "headers": json.dumps(email.headers),
+                    "body": email.body(),
+                    "received_at": _received_at(message),
+                }
+            )
+        with DatabaseEngine.begin("gmail_mailbox_upsert_messages") as conn:
+            conn.execute(query, rows)
+
+    def _update_labels(self, account: str, labels: dict[str, list[str]]) -> None:
+        if not labels:
+            return
+        query = text("""
+            UPDATE bronze.gmail_message
+            SET label_ids = :label_ids
+            WHERE account = :account AND message_id = :message_id
+        """)
+        rows = [
+            {"account": account, "message_id": message_id, "label_ids": label_ids}
+            for message_id, label_ids in labels.items()
+        ]
+        with DatabaseEngine.begin("gmail_mailbox_update_labels") as conn:
+            conn.execute(query, rows)
+
+    def _delete_messages(self, account: str, message_ids: set[str]) -> int:
+        if not message_ids:
+            return 0
+        query = text("""
+            DELETE FROM bronze.gmail_message
+            WHERE account = :account AND message_id = ANY(:message_ids)
+        """)
+        with DatabaseEngine.begin("gmail_mailbox_delete_messages") as conn:
+            deleted = conn.execute(
+                query, {"account": account, "message_ids": list(message_ids)}
+            )
+        return deleted.rowcount
+
+    def _save_state(
+        self, account: str, history_id: int, synced_at: datetime, full: bool
+    ) -> None:
+        query = text("""
+            INSERT INTO bronze.gmail_sync_state (account, history_id, last_sync_at, last_full_sync_at)
+            VALUES (:account, :history_id, :synced_at, :full_synced_at)
+            ON CONFLICT (account) DO UPDATE SET
+                history_id = EXCLUDED.history_id,
+                last_sync_at = EXCLUDED.last_sync_at,
+                last_full_sync_at = COALESCE(EXCLUDED.last_full_sync_at, bronze.gmail_sync_state.last_full_sync_at)
+        """)
+        with DatabaseEngine.begin("gmail_mailbox_save_state") as conn:
+            conn.execute(
+                query,
+                {
+                    "account": account,
+                    "history_id": history_id,
+                    "synced_at": synced_at,
+                    "full_synced_at": synced_at if full else None,
+                },
+            )
+
+    def _fetch_messages(
+        self,
+        service: Any,
+        message_ids: list[str],
+        message_format: str,
+        missing: Optional[set[str]] = None,
+    ) -> list[email_dict_type]:
+        """
+        Batch fetch messages, retrying the ones that failed once.
+
+        Raises:
+            MailboxSyncError: If any message still couldn't be fetched. Saving the new
+                historyId anyway would leave it out of the store for good, since later
+                history never mentions it again
+        """
+        missing = missing if missing is not None else set()
+        failed: set[str] = set()
+        messages = _batch_get_messages(service, message_ids, message_format, missing, failed)
+        if failed:
+            time.sleep(FETCH_RETRY_SECONDS)
+            retry_ids = [message_id for message_id in message_ids if message_id in failed]
+            failed = set()
+            messages += _batch_get_messages(service, retry_ids, message_format, missing, failed)
+        if failed:
+            raise MailboxSyncError(f"Failed to fetch {len(failed)} messages: {', '.join(sorted(failed))}")
+        return messages
+
+    def _list_recent_ids(self, service: Any) -> list[str]:
+        message_ids: list[str] = []
+        page_token: Optional[str] = None
+        while len(message_ids) < self.initial_sync_messages:
+            kwargs: dict[str, Any] = {
+                "userId": "me",
+                "maxResults": min(LIST_PAGE_SIZE, self.initial_sync_messages - len(message_ids)),
+            }
+            if page_token:
+                kwargs["pageToken"] = page_token
+            response = service.users().messages().list(**kwargs).execute()
+            message_ids.extend(message["id"] for message in response.get("messages", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+        return message_ids
+
+    def _full_sync(self, service: Any, account: str) -> MailboxSyncResult:
+        started = time.perf_counter()
+        synced_at = _utcnow()
+        # Taken before listing: anything that changes meanwhile is replayed by the next delta
+        history_id = int(service.users().getProfile(userId="me").execute()["historyId"])
+        result = MailboxSyncResult(account=account, full=True, history_id=history_id)
+
+        message_ids = self._list_recent_ids(service)
+        stored = self._get_stored_ids(account)
+        # Messages never change once sent, so stored ones only need their labels refreshed
+        new_ids = [message_id for message_id in message_ids if message_id not in stored]
+        known_ids = [message_id for message_id in message_ids if message_id in stored]
+
+        messages = self._fetch_messages(service, new_ids, "full")
+        self._upsert_messages(account, messages)
+        result.messages_upserted = len(messages)
+
+        known = self._fetch_messages(service, known_ids, "minimal")
+
+        # Stored messages older than the listed window are just older mail. Unlisted ones
+        # inside it were deleted, or moved to spam or trash, which messages.list leaves out
+        window_start = None
+        if len(message_ids) >= self.initial_sync_messages:
+            window_start = min(
+                (_received_at(message) for message in messages + known), default=None
+            )
+        unlisted = self._get_stored_ids(account, since=window_start) - set(message_ids)
+        gone: set[str] = set()
+        known += _batch_get_messages(service, sorted(unlisted), "minimal", missing=gone)
+
+        labels = {message["id"]: message.get("labelIds", []) for message in known}
+        self._update_labels(account, labels)
+        result.labels_updated = len(labels)
+
+        result.messages_deleted = self._delete_messages(account, gone)
+        self._save_state(account, history_id, synced_at, full=True)
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def _delta_sync(
+        self, service: Any, account: str, start_history_id: int
+    ) -> MailboxSyncResult:
+        started = time.perf_counter()
+        synced_at = _utcnow()
+        history_id = start_history_id
+        # Dicts rather than sets keep the mailbox's order for the batch fetch
+        added: dict[str, None] = {}
+        deleted: set[str] = set()
+        labels: dict[str, list[str]] = {}
+
+        page_token: Optional[str] = None
+        while True:
+            kwargs: dict[str, Any] = {
+                "userId": "me",
+                "startHistoryId": str(start_history_id),
+                "maxResults": LIST_PAGE_SIZE,
+            }
+            if page_token:
+                kwargs["pageToken"] = page_token
+            response = service.users().history().list(**kwargs).execute()
+            for record in response.get("history", []):
+                for change in record.get("messagesAdded", []):
+                    added[change["message"]["id"]] = None
+                    deleted.discard(change["message"]["id"])
+                for change in record.get("messagesDeleted", []):
+                    message_id = change["message"]["id"]
+                    deleted.add(message_id)
+                    added.pop(message_id, None)
+                    labels.pop(message_id, None)
+                for change in record.get("labelsAdded", []) + record.get("labelsRemoved", []):
+                    # The message carries its full label set after the change
+                    labels[change["message"]["id"]] = change["message"].get("labelIds", [])
+            history_id = int(response.get("historyId", history_id))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+        result = MailboxSyncResult(account=account, full=False, history_id=history_id)
+        # Added messages deleted again before the fetch 404; they're simply gone
+        messages = self._fetch_messages(service, list(added), "full")
+        self._upsert_messages(account, messages)
+        result.messages_upserted = len(messages)
+
+        # Freshly fetched messages already have their current labels
+        for message_id in added:
+            labels.pop(message_id, None)
+        self._update_labels(account, labels)
+        result.labels_updated = len(labels)
+
+        result.messages_deleted = self._delete_messages(account, deleted)
+        self._save_state(account, history_id, synced_at, full=False)
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def sync(self, full: bool = False) -> MailboxSyncResult:
+        """
+        Bring the stored mailbox up to date.
+
+        Args:
+            full: Re-list the mailbox instead of replaying history since the last sync
+
+        Returns:
+            What the sync changed
+        """
+        with self._sync_lock:
+            service = _authenticate()
+            account = self._get_account(service)
+            state = self._get_state(account)
+            if full or state is None:
+                return self._full_sync(service, account)
+            try:
+                return self._delta_sync(service, account, state["history_id"])
+            except HttpError as e:
+                # 404 means the stored historyId is older than the history Gmail keeps
+                if e.resp.status != 404:
+                    raise
+                print(f"Gmail history for {account} expired, running a full sync")
+                return self._full_sync(service, account)
+
+    def ensure_fresh(self) -> str:
+        """
+        Sync unless the last sync was within max_staleness.
+
+        Returns:
+            The mailbox account
+        """
+        service = _authenticate()
+        account = self._get_account(service)
+        state = self._get_state(account)
+        if state is None or _utcnow() - state["last_sync_at"] > self.max_staleness:
+            self.sync()
+        return account
+
+    def search(
+        self,
+        max_results: int = 10,
+        include_body: bool = True,
+        sender: Optional[str] = None,
+        subject: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        max_body_chars: int = MAX_BODY_CHARS,
+    ) -> list[email_dict_type]:
+        """
+        Read stored emails, most recent first, syncing first if the store is stale.
+
+        Args:
+            max_results: Maximum number of emails to return
+            include_body: Whether to include the email bodies
+            sender: Only emails whose From header contains this text, case-insensitively
+            subject: Only emails whose subject contains this text, case-insensitively
+            after: Only emails received on or after this date (YYYY-MM-DD)
+            before: Only emails received before this date (YYYY-MM-DD)
+            max_body_chars: Most characters of each body to return; bodies are stored
+                truncated to MAX_BODY_CHARS, so larger values don't return more
+
+        Returns:
+            Emails in the same shape as read_emails
+        """
+        account = self.ensure_fresh()
+
+        conditions = ["account = :account", "NOT (label_ids && :hidden_labels)"]
+        params: dict[str, Any] = {
+            "account": account,
+            "hidden_labels": HIDDEN_LABELS,
+            "limit": max_results,
+        }
+        if sender:
+            conditions.append("sender ILIKE :sender")
+            params["sender"] = f"%{sender}%"
+        if subject:
+            conditions.append("subject ILIKE :subject")
+            params["subject"] = f"%{subject}%"
+        if after:
+            conditions.append("received_at >= :after")
+            params["after"] = datetime.fromisoformat(after)
+        if before:
+            conditions.append("received_at < :before")
+            params["before"] = datetime.fromisoformat(before)
+
+        query = text(f"""
+            SELECT message_id, headers, {"body" if include_body else "''"} AS body
+            FROM bronze.gmail_message
+            WHERE {" AND ".join(conditions)}
+            ORDER BY received_at DESC
+            LIMIT :limit
+        """)
+        with DatabaseEngine.connect("gmail_mailbox_search") as conn:
+            rows = conn.execute(query, params).mappings().all()
+        return [
+            {
+                "id": row["message_id"],
+                "headers": row["headers"],
+                "body": _truncate_text(row["body"] or "", max_body_chars),
+            }
+            for row in rows
+        ]
+
+    def run_forever(self, interval: float = 60.0) -> None:
+        """Sync the mailbox every interval seconds"""
+        while True:
+            try:
+                result = self.sync()
+                print(
+                    f"Synced {result.account} ({'full' if result.full else 'delta'}): "
+                    f"{result.messages_upserted} upserted, {result.messages_deleted} deleted, "
+                    f"{result.labels_updated} relabelled in {result.seconds:.1f}s"
+                )
+            except Exception as e:
+                print(f"Failed to sync mailbox: {e}")
+            time.sleep(interval)
+
+
+_mailbox: Optional[GmailMailbox] = None
+
+
+def get_mailbox() -> GmailMailbox:
+    """Get the process-wide mailbox, configured from GMAIL_INITIAL_SYNC_MESSAGES and GMAIL_MAILBOX_MAX_STALENESS_SECONDS"""
+    global _mailbox
+    if _mailbox is None:
+        _mailbox = GmailMailbox(
+            initial_sync_messages=int(
+                os.getenv("GMAIL_INITIAL_SYNC_MESSAGES", str(INITIAL_SYNC_MESSAGES))
+            ),
+            max_staleness=timedelta(
+                seconds=float(os.getenv("GMAIL_MAILBOX_MAX_STALENESS_SECONDS", "60"))
+            ),
+        )
+    return _mailbox
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mirror the Gmail mailbox into bronze.gmail_message")
+    parser.add_argument("--full", action="store_true", help="Re-list the mailbox instead of replaying history")
+    parser.add_argument("--interval", type=float, help="Keep syncing every INTERVAL seconds")
+    args = parser.parse_args()
+
+    mailbox = get_mailbox()
+    if args.interval:
+        mailbox.run_forever(args.interval)
+    else:
+        print(mailbox.sync(full=args.full))
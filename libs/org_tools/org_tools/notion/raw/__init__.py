@@ -3,7 +3,7 @@ from .types import (
     EventProject, Task, Team, Document, Person,
     EventProjectType, EventProjectProgress, EventProjectPriority,
     TaskStatus, TaskPriority, DocumentStatus,
-    NotionDate, RichText
+    NotionDate, RichText, BulkTaskResult
 )
 
 from .events_projects import (
@@ -12,7 +12,7 @@ from .events_projects import (
 )
 
 from .tasks import (
-    create_task, get_task, update_task, delete_task, query_tasks,
+    create_task, get_task, update_task, delete_task, query_tasks, bulk_create_tasks, bulk_update_tasks,
     TaskCRUDError
 )
 
@@ -26,7 +26,11 @@ from .documents import (
     DocumentCRUDError
 )
 
-from .client import get_notion_client
+from .client import get_notion_client, iter_database_pages, iter_database, query_database
+
+from .rate_limit import RateLimitedClient, get_notion_client_stats, reset_notion_client_stats
+
+from .parser import PageParser, get_event_project_parser, get_task_parser, get_team_parser, get_document_parser
 
 __all__ = [
     # Types
@@ -34,16 +38,20 @@ __all__ = [
     "EventProject", "Task", "Team", "Document", "Person",
     "EventProjectType", "EventProjectProgress", "EventProjectPriority",
     "TaskStatus", "TaskPriority", "DocumentStatus",
-    "NotionDate", "RichText",
+    "NotionDate", "RichText", "BulkTaskResult",
     
     # CRUD Functions
     "create_event_project", "get_event_project", "update_event_project", "delete_event_project", "query_event_projects",
-    "create_task", "get_task", "update_task", "delete_task", "query_tasks",
+    "create_task", "get_task", "update_task", "delete_task", "query_tasks", "bulk_create_tasks", "bulk_update_tasks",
     "create_team", "get_team", "update_team", "delete_team", "query_teams",
     "create_document", "get_document", "update_document", "delete_document", "query_documents",
     
     # Client
-    "get_notion_client",
+    "get_notion_client", "iter_database_pages", "iter_database", "query_database",
+    "RateLimitedClient", "get_notion_client_stats", "reset_notion_client_stats",
+    
+    # Parsers
+    "PageParser", "get_event_project_parser", "get_task_parser", "get_team_parser", "get_document_parser",
     
     # Exceptions
     "EventProjectCRUDError", "TaskCRUDError", "TeamCRUDError", "DocumentCRUDError"
@@ -0,0 +1,33 @@
+"""
+Async counterparts of the org_tools.notion.raw CRUD functions, with identical names,
+signatures and return types, running on a shared keep-alive notion_client.AsyncClient.
+"""
+
+from .events_projects import (
+    create_event_project, get_event_project, update_event_project, delete_event_project, query_event_projects
+)
+
+from .tasks import (
+    create_task, get_task, update_task, delete_task, query_tasks, bulk_create_tasks, bulk_update_tasks
+)
+
+from .teams import (
+    create_team, get_team, update_team, delete_team, query_teams
+)
+
+from .documents import (
+    create_document, get_document, update_document, delete_document, query_documents
+)
+
+from .client import get_notion_client, close_notion_client, iter_database_pages, iter_database, query_database
+
+__all__ = [
+    # CRUD Functions
+    "create_event_project", "get_event_project", "update_event_project", "delete_event_project", "query_event_projects",
+    "create_task", "get_task", "update_task", "delete_task", "query_tasks", "bulk_create_tasks", "bulk_update_tasks",
+    "create_team", "get_team", "update_team", "delete_team", "query_teams",
+    "create_document", "get_document", "update_document", "delete_document", "query_documents",
+    
+    # Client
+    "get_notion_client", "close_notion_client", "iter_database_pages", "iter_database", "query_database"
+]
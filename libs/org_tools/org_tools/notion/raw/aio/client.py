@@ -0,0 +1,189 @@
+import asyncio
+import copy
+import json
+import os
+import weakref
+from typing import Optional, Dict, Any, List, Callable, AsyncIterator, Tuple, TypeVar
+from urllib.parse import unquote
+
+import httpx
+from notion_client import AsyncClient
+from notion_client.errors import HTTPResponseError
+
+from ..client import MAX_PAGE_SIZE, _use_mirror_by_default, _iter_mirror_pages
+from ..rate_limit import DEFAULT_MAX_RETRIES, get_rate_limiter, record_stat, retry_delay
+
+T = TypeVar("T")
+
+# Connections kept open between requests; Notion calls are paced to a few per second
+KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+class RateLimitedAsyncClient(AsyncClient):
+    """
+    notion_client.AsyncClient counterpart of RateLimitedClient. Shares the process-wide
+    token bucket and counters with the sync client, retries with the same backoff, and
+    coalesces identical in-flight GETs across tasks.
+    """
+
+    def __init__(self, *args: Any, max_retries: Optional[int] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("NOTION_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+        self._in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    async def request(self, path: str, method: str, query: Optional[Dict[Any, Any]] = None, body: Optional[Dict[Any, Any]] = None, **kwargs: Any) -> Any:
+        if method.upper() != "GET":
+            return await self._request_with_retries(path, method, query, body, **kwargs)
+
+        key = (path, json.dumps(query, sort_keys=True, default=str))
+        future = self._in_flight.get(key)
+        while future is not None:
+            record_stat("coalesced")
+            try:
+                # shield: a cancelled waiter must not cancel the request other callers share
+                return copy.deepcopy(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                # The caller that owned the request was cancelled, not us: issue it again
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            future = self._in_flight.get(key)
+
+        future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await self._request_with_retries(path, method, query, body, **kwargs)
+            future.set_result(copy.deepcopy(result))
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an error nobody else awaited isn't logged as unhandled
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+            # Cancelled mid-request: wake the waiters so they retry instead of hanging
+            if not future.done():
+                future.cancel()
+
+    async def _request_with_retries(self, path: str, method: str, query: Optional[Dict[Any, Any]], body: Optional[Dict[Any, Any]], **kwargs: Any) -> Any:
+        bucket = get_rate_limiter()
+        attempt = 0
+        while True:
+            wait = bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            record_stat("wait_seconds", wait)
+            record_stat("requests")
+            try:
+                return await super().request(path, method, query, body, **kwargs)
+            except Exception as e:
+                throttled = isinstance(e, HTTPResponseError) and e.status == 429
+                if throttled:
+                    record_stat("throttled")
+                delay = retry_delay(e, attempt)
+                if delay is None or attempt >= self.max_retries:
+                    record_stat("failed")
+                    raise
+                record_stat("retried")
+                attempt += 1
+                if throttled:
+                    bucket.pause(delay)
+                else:
+                    await asyncio.sleep(delay)
+
+# httpx.AsyncClient is bound to the event loop it was first used on, so keep one session per loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RateLimitedAsyncClient]" = weakref.WeakKeyDictionary()
+
+def get_notion_client() -> RateLimitedAsyncClient:
+    """Get the shared async Notion client (keep-alive session) for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        notion_token = os.getenv("NOTION_TOKEN")
+        if not notion_token:
+            raise ValueError("NOTION_TOKEN environment variable is not set")
+        session = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+            )
+        )
+        client = _clients[loop] = RateLimitedAsyncClient(auth=notion_token, client=session)
+    return client
+
+async def close_notion_client() -> None:
+    """Close the running loop's shared session, e.g. on shutdown"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+async def iter_database_pages(
+    database_id: str,
+    filter: Optional[Dict[str, Any]] = None,
+    sorts: Optional[List[Dict[str, Any]]] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None,
+    filter_properties: Optional[List[str]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Async counterpart of client.iter_database_pages"""
+    if limit == 0:
+        return
+    if use_mirror is None:
+        use_mirror = _use_mirror_by_default()
+    if use_mirror and not sorts:
+        # The mirror is read through the blocking Postgres engine, keep it off the event loop
+        pages = await asyncio.to_thread(_iter_mirror_pages, database_id, filter, limit)
+        if pages is not None:
+            for page in pages:
+                yield page
+            return
+
+    client = get_notion_client()
+
+    query_params: Dict[str, Any] = {"database_id": database_id}
+    if filter:
+        query_params["filter"] = filter
+    if sorts:
+        query_params["sorts"] = sorts
+    if filter_properties:
+        query_params["filter_properties"] = [unquote(prop) for prop in filter_properties]
+
+    remaining = limit
+    while True:
+        query_params["page_size"] = min(remaining, MAX_PAGE_SIZE) if remaining is not None else MAX_PAGE_SIZE
+        response = await client.databases.query(**query_params)
+
+        for page in response.get("results", []):
+            yield page
+            if remaining is not None:
+                remaining -= 1
+                if remaining <= 0:
+                    return
+
+        if not response.get("has_more") or not response.get("next_cursor"):
+            return
+        query_params["start_cursor"] = response["next_cursor"]
+
+async def iter_database(
+    database_id: str,
+    parse_page: Callable[[Dict[str, Any]], T],
+    filter: Optional[Dict[str, Any]] = None,
+    sorts: Optional[List[Dict[str, Any]]] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None,
+    filter_properties: Optional[List[str]] = None
+) -> AsyncIterator[T]:
+    """Async counterpart of client.iter_database"""
+    async for page in iter_database_pages(database_id, filter=filter, sorts=sorts, limit=limit, use_mirror=use_mirror, filter_properties=filter_properties):
+        yield parse_page(page)
+
+async def query_database(
+    database_id: str,
+    parse_page: Callable[[Dict[str, Any]], T],
+    filter: Optional[Dict[str, Any]] = None,
+    sorts: Optional[List[Dict[str, Any]]] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None,
+    filter_properties: Optional[List[str]] = None
+) -> List[T]:
+    """Async counterpart of client.query_database"""
+    return [row async for row in iter_database(database_id, parse_page, filter=filter, sorts=sorts, limit=limit, use_mirror=use_mirror, filter_properties=filter_properties)]
\ No newline at end of file
@@ -0,0 +1,155 @@
+from typing import Optional, List
+
+from ..types import (
+    DocumentID, EventProjectID, TeamID, Person,
+    Document, DocumentStatus, DOCUMENTS_DB_ID
+)
+from ..documents import (
+    _document_create_properties, _document_update_properties, _document_query_filter, _parse_document_page, DocumentCRUDError
+)
+from .client import get_notion_client, query_database
+
+
+async def create_document(
+    name: str,
+    status: Optional[DocumentStatus] = None,
+    person: Optional[List[Person]] = None,
+    contributors: Optional[List[Person]] = None,
+    owned_by: Optional[List[Person]] = None,
+    in_charge: Optional[List[Person]] = None,
+    team: Optional[List[TeamID]] = None,
+    events_projects: Optional[List[EventProjectID]] = None,
+    parent_item: Optional[List[DocumentID]] = None,
+    sub_item: Optional[List[DocumentID]] = None,
+    google_drive_file: Optional[List[str]] = None,
+    pinned: Optional[bool] = None
+) -> DocumentID:
+    """Create a new document"""
+    try:
+        client = get_notion_client()
+        
+        properties = _document_create_properties(
+            name,
+            status,
+            person,
+            contributors,
+            owned_by,
+            in_charge,
+            team,
+            events_projects,
+            parent_item,
+            sub_item,
+            google_drive_file,
+            pinned
+        )
+        
+        response = await client.pages.create(
+            parent={"database_id": DOCUMENTS_DB_ID},
+            properties=properties
+        )
+        
+        return DocumentID(response["id"])
+    
+    except Exception as e:
+        raise DocumentCRUDError(f"Failed to create document: {str(e)}")
+
+async def get_document(document_id: DocumentID) -> Optional[Document]:
+    """Get a document by ID"""
+    try:
+        client = get_notion_client()
+        response = await client.pages.retrieve(page_id=document_id)
+        
+        if not response:
+            return None
+        
+        return _parse_document_page(response)
+    
+    except Exception as e:
+        raise DocumentCRUDError(f"Failed to get document: {str(e)}")
+
+async def update_document(
+    document_id: DocumentID,
+    name: Optional[str] = None,
+    status: Optional[DocumentStatus] = None,
+    person: Optional[List[Person]] = None,
+    contributors: Optional[List[Person]] = None,
+    owned_by: Optional[List[Person]] = None,
+    in_charge: Optional[List[Person]] = None,
+    team: Optional[List[TeamID]] = None,
+    events_projects: Optional[List[EventProjectID]] = None,
+    parent_item: Optional[List[DocumentID]] = None,
+    sub_item: Optional[List[DocumentID]] = None,
+    google_drive_file: Optional[List[str]] = None,
+    pinned: Optional[bool] = None
+) -> bool:
+    """Update a document"""
+    try:
+        client = get_notion_client()
+        
+        properties = _document_update_properties(
+            name,
+            status,
+            person,
+            contributors,
+            owned_by,
+            in_charge,
+            team,
+            events_projects,
+            parent_item,
+            sub_item,
+            google_drive_file,
+            pinned
+        )
+        
+        await client.pages.update(
+            page_id=document_id,
+            properties=properties
+        )
+        
+        return True
+    
+    except Exception as e:
+        raise DocumentCRUDError(f"Failed to update document: {str(e)}")
+
+async def delete_document(document_id: DocumentID) -> bool:
+    """Delete a document (archive it)"""
+    try:
+        client = get_notion_client()
+        await client.pages.update(
+            page_id=document_id,
+            archived=True
+        )
+        return True
+    
+    except Exception as e:
+        raise DocumentCRUDError(f"Failed to delete document: {str(e)}")
+
+async def query_documents(
+    status: Optional[DocumentStatus] = None,
+    person: Optional[List[Person]] = None,
+    team: Optional[List[TeamID]] = None,
+    events_projects: Optional[List[EventProjectID]] = None,
+    pinned: Optional[bool] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None
+) -> List[Document]:
+    """Query documents with filters, following pagination and parsing rows from the query response"""
+    try:
+        query_filter = _document_query_filter(
+            status,
+            person,
+            team,
+            events_projects,
+            pinned
+        )
+        
+        return await query_database(
+            DOCUMENTS_DB_ID,
+            _parse_document_page,
+            filter=query_filter,
+            limit=limit,
+            use_mirror=use_mirror
+        )
+    
+    except Exception as e:
+        raise DocumentCRUDError(f"Failed to query documents: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,179 @@
+from typing import Optional, List
+
+from ..types import (
+    EventProjectID,
+    TaskID,
+    TeamID,
+    DocumentID,
+    EventProject,
+    Person,
+    EventProjectType,
+    EventProjectProgress,
+    EventProjectPriority,
+    NotionDate,
+    RichText,
+    EVENTS_PROJECTS_DB_ID,
+)
+from ..events_projects import (
+    _event_project_create_properties,
+    _event_project_update_properties,
+    _event_project_query_filter,
+    _parse_event_project_page,
+    EventProjectCRUDError,
+)
+from .client import get_notion_client, query_database
+
+
+
+async def create_event_project(
+    name: str,
+    type: Optional[EventProjectType] = None,
+    progress: Optional[EventProjectProgress] = None,
+    priority: Optional[EventProjectPriority] = None,
+    description: Optional[List[RichText]] = None,
+    text: Optional[List[RichText]] = None,
+    location: Optional[List[RichText]] = None,
+    due_dates: Optional[NotionDate] = None,
+    owner: Optional[List[Person]] = None,
+    allocated: Optional[List[Person]] = None,
+    parent_item: Optional[List[EventProjectID]] = None,
+    sub_item: Optional[List[EventProjectID]] = None,
+    team: Optional[List[TeamID]] = None,
+    documents: Optional[List[DocumentID]] = None,
+    tasks: Optional[List[TaskID]] = None,
+) -> EventProjectID:
+    """Create a new event/project"""
+    try:
+        client = get_notion_client()
+
+        properties = _event_project_create_properties(
+            name,
+            type,
+            progress,
+            priority,
+            description,
+            text,
+            location,
+            due_dates,
+            owner,
+            allocated,
+            parent_item,
+            sub_item,
+            team,
+            documents,
+            tasks,
+        )
+
+        response = await client.pages.create(
+            parent={"database_id": EVENTS_PROJECTS_DB_ID}, properties=properties
+        )
+
+        return EventProjectID(response["id"])
+
+    except Exception as e:
+        raise EventProjectCRUDError(f"Failed to create event/project: {str(e)}")
+
+
+async def get_event_project(event_project_id: EventProjectID) -> Optional[EventProject]:
+    """Get an event/project by ID"""
+    try:
+        client = get_notion_client()
+        response = await client.pages.retrieve(page_id=event_project_id)
+
+        if not response:
+            return None
+
+        return _parse_event_project_page(response)
+
+    except Exception as e:
+        raise EventProjectCRUDError(f"Failed to get event/project: {str(e)}")
+
+
+async def update_event_project(
+    event_project_id: EventProjectID,
+    name: Optional[str] = None,
+    type: Optional[EventProjectType] = None,
+    progress: Optional[EventProjectProgress] = None,
+    priority: Optional[EventProjectPriority] = None,
+    description: Optional[List[RichText]] = None,
+    text: Optional[List[RichText]] = None,
+    location: Optional[List[RichText]] = None,
+    due_dates: Optional[NotionDate] = None,
+    owner: Optional[List[Person]] = None,
+    allocated: Optional[List[Person]] = None,
+    parent_item: Optional[List[EventProjectID]] = None,
+    sub_item: Optional[List[EventProjectID]] = None,
+    team: Optional[List[TeamID]] = None,
+    documents: Optional[List[DocumentID]] = None,
+    tasks: Optional[List[TaskID]] = None,
+) -> bool:
+    """Update an event/project"""
+    try:
+        client = get_notion_client()
+
+        properties = _event_project_update_properties(
+            name,
+            type,
+            progress,
+            priority,
+            description,
+            text,
+            location,
+            due_dates,
+            owner,
+            allocated,
+            parent_item,
+            sub_item,
+            team,
+            documents,
+            tasks,
+        )
+
+        await client.pages.update(page_id=event_project_id, properties=properties)
+
+        return True
+
+    except Exception as e:
+        raise EventProjectCRUDError(f"Failed to update event/project: {str(e)}")
+
+
+async def delete_event_project(event_project_id: EventProjectID) -> bool:
+    """Delete an event/project (archive it)"""
+    try:
+        client = get_notion_client()
+        await client.pages.update(page_id=event_project_id, archived=True)
+        return True
+
+    except Exception as e:
+        raise EventProjectCRUDError(f"Failed to delete event/project: {str(e)}")
+
+
+async def query_event_projects(
+    type: Optional[EventProjectType] = None,
+    progress: Optional[EventProjectProgress] = None,
+    priority: Optional[EventProjectPriority] = None,
+    owner: Optional[List[Person]] = None,
+    team: Optional[List[TeamID]] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None,
+) -> List[EventProject]:
+    """Query event/projects with filters, following pagination and parsing rows from the query response"""
+    try:
+        query_filter = _event_project_query_filter(
+            type,
+            progress,
+            priority,
+            owner,
+            team,
+        )
+
+        return await query_database(
+            EVENTS_PROJECTS_DB_ID,
+            _parse_event_project_page,
+            filter=query_filter,
+            limit=limit,
+            use_mirror=use_mirror,
+        )
+
+    except Exception as e:
+        raise EventProjectCRUDError(f"Failed to query event/projects: {str(e)}")
@@ -0,0 +1,190 @@
+import asyncio
+from typing import Optional, List, Dict, Any, Callable, Awaitable
+
+from ..types import (
+    TaskID, EventProjectID, TeamID, Person,
+    Task, TaskStatus, TaskPriority,
+    NotionDate, RichText, BulkTaskResult, TASKS_DB_ID
+)
+from ..tasks import (
+    _task_create_properties, _task_update_properties, _task_query_filter, _parse_task_page, TaskCRUDError,
+    DEFAULT_BULK_CONCURRENCY
+)
+from .client import get_notion_client, query_database
+
+
+async def create_task(
+    name: str,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    description: Optional[List[RichText]] = None,
+    task_progress: Optional[List[RichText]] = None,
+    due_dates: Optional[NotionDate] = None,
+    in_charge: Optional[List[Person]] = None,
+    event_project: Optional[List[EventProjectID]] = None,
+    team: Optional[List[TeamID]] = None,
+    parent_task: Optional[List[TaskID]] = None,
+    sub_task: Optional[List[TaskID]] = None,
+    blocking: Optional[List[TaskID]] = None,
+    blocked_by: Optional[List[TaskID]] = None
+) -> TaskID:
+    """Create a new task"""
+    try:
+        client = get_notion_client()
+        
+        properties = _task_create_properties(
+            name,
+            status,
+            priority,
+            description,
+            task_progress,
+            due_dates,
+            in_charge,
+            event_project,
+            team,
+            parent_task,
+            sub_task,
+            blocking,
+            blocked_by
+        )
+        
+        response = await client.pages.create(
+            parent={"database_id": TASKS_DB_ID},
+            properties=properties
+        )
+        
+        return TaskID(response["id"])
+    
+    except Exception as e:
+        raise TaskCRUDError(f"Failed to create task: {str(e)}")
+
+async def get_task(task_id: TaskID) -> Optional[Task]:
+    """Get a task by ID"""
+    try:
+        client = get_notion_client()
+        response = await client.pages.retrieve(page_id=task_id)
+        
+        if not response:
+            return None
+        
+        return _parse_task_page(response)
+    
+    except Exception as e:
+        raise TaskCRUDError(f"Failed to get task: {str(e)}")
+
+async def update_task(
+    task_id: TaskID,
+    name: Optional[str] = None,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    description: Optional[List[RichText]] = None,
+    task_progress: Optional[List[RichText]] = None,
+    due_dates: Optional[NotionDate] = None,
+    in_charge: Optional[List[Person]] = None,
+    event_project: Optional[List[EventProjectID]] = None,
+    team: Optional[List[TeamID]] = None,
+    parent_task: Optional[List[TaskID]] = None,
+    sub_task: Optional[List[TaskID]] = None,
+    blocking: Optional[List[TaskID]] = None,
+    blocked_by: Optional[List[TaskID]] = None
+) -> bool:
+    """Update a task"""
+    try:
+        client = get_notion_client()
+        
+        properties = _task_update_properties(
+            name,
+            status,
+            priority,
+            description,
+            task_progress,
+            due_dates,
+            in_charge,
+            event_project,
+            team,
+            parent_task,
+            sub_task,
+            blocking,
+            blocked_by
+        )
+        
+        await client.pages.update(
+            page_id=task_id,
+            properties=properties
+        )
+        
+        return True
+    
+    except Exception as e:
+        raise TaskCRUDError(f"Failed to update task: {str(e)}")
+
+async def delete_task(task_id: TaskID) -> bool:
+    """Delete a task (archive it)"""
+    try:
+        client = get_notion_client()
+        await client.pages.update(
+            page_id=task_id,
+            archived=True
+        )
+        return True
+    
+    except Exception as e:
+        raise TaskCRUDError(f"Failed to delete task: {str(e)}")
+
+async def query_tasks(
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    in_charge: Optional[List[Person]] = None,
+    event_project: Optional[List[EventProjectID]] = None,
+    team: Optional[List[TeamID]] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None
+) -> List[Task]:
+    """Query tasks with filters, following pagination and parsing rows from the query response"""
+    try:
+        query_filter = _task_query_filter(
+            status,
+            priority,
+            in_charge,
+            event_project,
+            team
+        )
+        
+        return await query_database(
+            TASKS_DB_ID,
+            _parse_task_page,
+            filter=query_filter,
+            limit=limit,
+            use_mirror=use_mirror
+        )
+    
+    except Exception as e:
+        raise TaskCRUDError(f"Failed to query tasks: {str(e)}")
+
+async def _run_bulk(operation: Callable[..., Awaitable[Any]], items: List[Dict[str, Any]], max_concurrency: int) -> List[BulkTaskResult]:
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    async def run(index: int, item: Dict[str, Any]) -> BulkTaskResult:
+        async with semaphore:
+            try:
+                result = await operation(**item)
+                task_id = result if isinstance(result, str) else item.get("task_id")
+                return BulkTaskResult(index=index, success=True, task_id=task_id)
+            except Exception as e:
+                return BulkTaskResult(index=index, success=False, task_id=item.get("task_id"), error=str(e))
+    
+    return list(await asyncio.gather(*(run(index, item) for index, item in enumerate(items))))
+
+async def bulk_create_tasks(
+    tasks: List[Dict[str, Any]],
+    max_concurrency: int = DEFAULT_BULK_CONCURRENCY
+) -> List[BulkTaskResult]:
+    """Async counterpart of tasks.bulk_create_tasks"""
+    return await _run_bulk(create_task, tasks, max_concurrency)
+
+async def bulk_update_tasks(
+    updates: List[Dict[str, Any]],
+    max_concurrency: int = DEFAULT_BULK_CONCURRENCY
+) -> List[BulkTaskResult]:
+    """Async counterpart of tasks.bulk_update_tasks"""
+    return await _run_bulk(update_task, updates, max_concurrency)
\ No newline at end of file
@@ -0,0 +1,125 @@
+from typing import Optional, List
+
+from ..types import (
+    TeamID, EventProjectID, DocumentID, Person,
+    Team, TEAMS_DB_ID
+)
+from ..teams import (
+    _team_create_properties, _team_update_properties, _team_query_filter, _parse_team_page, TeamCRUDError
+)
+from .client import get_notion_client, query_database
+
+
+async def create_team(
+    name: str,
+    person: Optional[List[Person]] = None,
+    cover: Optional[List[str]] = None,
+    events_projects: Optional[List[EventProjectID]] = None,
+    committee: Optional[List[str]] = None,
+    document: Optional[List[DocumentID]] = None
+) -> TeamID:
+    """Create a new team"""
+    try:
+        client = get_notion_client()
+        
+        properties = _team_create_properties(
+            name,
+            person,
+            cover,
+            events_projects,
+            committee,
+            document
+        )
+        
+        response = await client.pages.create(
+            parent={"database_id": TEAMS_DB_ID},
+            properties=properties
+        )
+        
+        return TeamID(response["id"])
+    
+    except Exception as e:
+        raise TeamCRUDError(f"Failed to create team: {str(e)}")
+
+async def get_team(team_id: TeamID) -> Optional[Team]:
+    """Get a team by ID"""
+    try:
+        client = get_notion_client()
+        response = await client.pages.retrieve(page_id=team_id)
+        
+        if not response:
+            return None
+        
+        return _parse_team_page(response)
+    
+    except Exception as e:
+        raise TeamCRUDError(f"Failed to get team: {str(e)}")
+
+async def update_team(
+    team_id: TeamID,
+    name: Optional[str] = None,
+    person: Optional[List[Person]] = None,
+    cover: Optional[List[str]] = None,
+    events_projects: Optional[List[EventProjectID]] = None,
+    committee: Optional[List[str]] = None,
+    document: Optional[List[DocumentID]] = None
+) -> bool:
+    """Update a team"""
+    try:
+        client = get_notion_client()
+        
+        properties = _team_update_properties(
+            name,
+            person,
+            cover,
+            events_projects,
+            committee,
+            document
+        )
+        
+        await client.pages.update(
+            page_id=team_id,
+            properties=properties
+        )
+        
+        return True
+    
+    except Exception as e:
+        raise TeamCRUDError(f"Failed to update team: {str(e)}")
+
+async def delete_team(team_id: TeamID) -> bool:
+    """Delete a team (archive it)"""
+    try:
+        client = get_notion_client()
+        await client.pages.update(
+            page_id=team_id,
+            archived=True
+        )
+        return True
+    
+    except Exception as e:
+        raise TeamCRUDError(f"Failed to delete team: {str(e)}")
+
+async def query_teams(
+    person: Optional[List[Person]] = None,
+    events_projects: Optional[List[EventProjectID]] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None
+) -> List[Team]:
+    """Query teams with filters, following pagination and parsing rows from the query response"""
+    try:
+        query_filter = _team_query_filter(
+            person,
+            events_projects
+        )
+        
+        return await query_database(
+            TEAMS_DB_ID,
+            _parse_team_page,
+            filter=query_filter,
+            limit=limit,
+            use_mirror=use_mirror
+        )
+    
+    except Exception as e:
+        raise TeamCRUDError(f"Failed to query teams: {str(e)}")
\ No newline at end of file
@@ -1,9 +1,11 @@
 import os
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Iterator, TypeVar
 from datetime import datetime
+from urllib.parse import unquote
 from notion_client import Client
 from dotenv import load_dotenv
 
+from .rate_limit import RateLimitedClient
 from .types import (
     NotionDate, RichText, Person, PersonID,
     EventProjectType, EventProjectProgress, EventProjectPriority,
@@ -12,22 +14,129 @@ from .types import (
 
 load_dotenv()
 
+T = TypeVar("T")
+
+# Maximum page size accepted by the Notion databases.query endpoint
+MAX_PAGE_SIZE = 100
+
 class NotionClient:
     _instance: Optional[Client] = None
 
     def __new__(cls):
-        """Create or return the singleton instance of the Notion client"""
+        """Create or return the singleton instance of the rate-limited Notion client"""
         if cls._instance is None:
             notion_token = os.getenv("NOTION_TOKEN")
             if not notion_token:
                 raise ValueError("NOTION_TOKEN environment variable is not set")
-            cls._instance = Client(auth=notion_token)
+            cls._instance = RateLimitedClient(auth=notion_token)
         return cls._instance
 
 def get_notion_client() -> Client:
     """Get the singleton Notion client instance"""
     return NotionClient()
 
+def build_filter(filter_conditions: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Combine filter conditions into a single Notion filter object"""
+    if not filter_conditions:
+        return None
+    if len(filter_conditions) == 1:
+        return filter_conditions[0]
+    return {"and": filter_conditions}
+
+def _use_mirror_by_default() -> bool:
+    return os.getenv("NOTION_READ_FROM_MIRROR", "").lower() in ("1", "true", "yes")
+
+def _iter_mirror_pages(
+    database_id: str,
+    filter: Optional[Dict[str, Any]],
+    limit: Optional[int]
+) -> Optional[List[Dict[str, Any]]]:
+    """Read matching pages from the Postgres mirror, or None if it can't answer the query"""
+    try:
+        # Imported lazily so the live client works without the database dependencies
+        from .mirror import get_notion_mirror
+        return list(get_notion_mirror().iter_pages(database_id, filter=filter, limit=limit))
+    except Exception as e:
+        print(f"Notion mirror unavailable for {database_id}, querying Notion: {e}")
+        return None
+
+def iter_database_pages(
+    database_id: str,
+    filter: Optional[Dict[str, Any]] = None,
+    sorts: Optional[List[Dict[str, Any]]] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None,
+    filter_properties: Optional[List[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream raw pages from a database query, following cursors until exhausted or limit is reached.
+    With use_mirror (default: NOTION_READ_FROM_MIRROR), unsorted queries are answered from the
+    Postgres mirror when it is fresh, falling back to the live API otherwise.
+    filter_properties trims each page from the API to the given property IDs; mirrored pages are
+    returned whole.
+    """
+    if limit == 0:
+        return
+    if use_mirror is None:
+        use_mirror = _use_mirror_by_default()
+    if use_mirror and not sorts:
+        pages = _iter_mirror_pages(database_id, filter, limit)
+        if pages is not None:
+            yield from pages
+            return
+    
+    client = get_notion_client()
+    
+    query_params: Dict[str, Any] = {"database_id": database_id}
+    if filter:
+        query_params["filter"] = filter
+    if sorts:
+        query_params["sorts"] = sorts
+    if filter_properties:
+        # Property IDs come URL-encoded (e.g. "%3D%3DBK"); the HTTP client encodes query params again
+        query_params["filter_properties"] = [unquote(prop) for prop in filter_properties]
+    
+    remaining = limit
+    while True:
+        query_params["page_size"] = min(remaining, MAX_PAGE_SIZE) if remaining is not None else MAX_PAGE_SIZE
+        response = client.databases.query(**query_params)
+        
+        for page in response.get("results", []):
+            yield page
+            if remaining is not None:
+                remaining -= 1
+                if remaining <= 0:
+                    return
+        
+        if not response.get("has_more") or not response.get("next_cursor"):
+            return
+        query_params["start_cursor"] = response["next_cursor"]
+
+def iter_database(
+    database_id: str,
+    parse_page: Callable[[Dict[str, Any]], T],
+    filter: Optional[Dict[str, Any]] = None,
+    sorts: Optional[List[Dict[str, Any]]] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None,
+    filter_properties: Optional[List[str]] = None
+) -> Iterator[T]:
+    """Stream parsed rows from a database query without re-fetching each page"""
+    for page in iter_database_pages(database_id, filter=filter, sorts=sorts, limit=limit, use_mirror=use_mirror, filter_properties=filter_properties):
+        yield parse_page(page)
+
+def query_database(
+    database_id: str,
+    parse_page: Callable[[Dict[str, Any]], T],
+    filter: Optional[Dict[str, Any]] = None,
+    sorts: Optional[List[Dict[str, Any]]] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None,
+    filter_properties: Optional[List[str]] = None
+) -> List[T]:
+    """Query a database to completion and return the parsed rows"""
+    return list(iter_database(database_id, parse_page, filter=filter, sorts=sorts, limit=limit, use_mirror=use_mirror, filter_properties=filter_properties))
+
 def format_date_for_notion(date: Optional[NotionDate]) -> Optional[Dict[str, Any]]:
     """Convert NotionDate to Notion API format"""
     if not date:
@@ -133,10 +242,11 @@ def parse_relation_from_notion(relation_data: List[Dict[str, Any]]) -> List[str]
 
 def get_select_enum_value(enum_class, notion_id: str):
     """Get enum value from Notion select ID"""
-    for enum_value in enum_class:
-        if enum_value.value == notion_id:
-            return enum_value
-    return None
+    # Enum's value lookup is a dict hit, not a scan of the members
+    try:
+        return enum_class(notion_id)
+    except ValueError:
+        return None
 
 def get_notion_id_from_enum(enum_value) -> str:
     """Get Notion ID from enum value"""
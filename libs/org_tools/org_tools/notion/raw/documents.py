@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 
 from .types import (
     DocumentID, EventProjectID, TeamID, Person,
@@ -6,16 +6,94 @@ from .types import (
     DocumentProperties, DOCUMENTS_DB_ID
 )
 from .client import (
-    get_notion_client,
+    get_notion_client, build_filter, query_database,
     format_people_for_notion, format_relation_for_notion,
-    parse_people_from_notion, parse_relation_from_notion,
-    get_select_enum_value, get_notion_id_from_enum
+    get_notion_id_from_enum
 )
+from .parser import get_document_parser
 
 class DocumentCRUDError(Exception):
     """Exception for Documents CRUD operations"""
     pass
 
+def _document_create_properties(
+    name: str,
+    status: Optional[DocumentStatus] = None,
+    person: Optional[List[Person]] = None,
+    contributors: Optional[List[Person]] = None,
+    owned_by: Optional[List[Person]] = None,
+    in_charge: Optional[List[Person]] = None,
+    team: Optional[List[TeamID]] = None,
+    events_projects: Optional[List[EventProjectID]] = None,
+    parent_item: Optional[List[DocumentID]] = None,
+    sub_item: Optional[List[DocumentID]] = None,
+    google_drive_file: Optional[List[str]] = None,
+    pinned: Optional[bool] = None
+) -> Dict[str, Any]:
+    """Build the page properties for create_document"""
+    properties = {
+        DocumentProperties.NAME: {
+            "title": [{"text": {"content": name}}]
+        }
+    }
+    
+    if status:
+        properties[DocumentProperties.STATUS] = {
+            "status": {"id": get_notion_id_from_enum(status)}
+        }
+    
+    if person:
+        properties[DocumentProperties.PERSON] = {
+            "people": format_people_for_notion(person)
+        }
+    
+    if contributors:
+        properties[DocumentProperties.CONTRIBUTORS] = {
+            "people": format_people_for_notion(contributors)
+        }
+    
+    if owned_by:
+        properties[DocumentProperties.OWNED_BY] = {
+            "people": format_people_for_notion(owned_by)
+        }
+    
+    if in_charge:
+        properties[DocumentProperties.IN_CHARGE] = {
+            "people": format_people_for_notion(in_charge)
+        }
+    
+    if team:
+        properties[DocumentProperties.TEAM] = {
+            "relation": format_relation_for_notion(team)
+        }
+    
+    if events_projects:
+        properties[DocumentProperties.EVENTS_PROJECTS] = {
+            "relation": format_relation_for_notion(events_projects)
+        }
+    
+    if parent_item:
+        properties[DocumentProperties.PARENT_ITEM] = {
+            "relation": format_relation_for_notion(parent_item)
+        }
+    
+    if sub_item:
+        properties[DocumentProperties.SUB_ITEM] = {
+            "relation": format_relation_for_notion(sub_item)
+        }
+    
+    if google_drive_file:
+        properties[DocumentProperties.GOOGLE_DRIVE_FILE] = {
+            "relation": format_relation_for_notion(google_drive_file)
+        }
+    
+    if pinned is not None:
+        properties[DocumentProperties.PINNED] = {
+            "checkbox": pinned
+        }
+    
+    return properties
+
 def create_document(
     name: str,
     status: Optional[DocumentStatus] = None,
@@ -34,66 +112,20 @@ def create_document(
     try:
         client = get_notion_client()
         
-        properties = {
-            DocumentProperties.NAME: {
-                "title": [{"text": {"content": name}}]
-            }
-        }
-        
-        if status:
-            properties[DocumentProperties.STATUS] = {
-                "status": {"id": get_notion_id_from_enum(status)}
-            }
-        
-        if person:
-            properties[DocumentProperties.PERSON] = {
-                "people": format_people_for_notion(person)
-            }
-        
-        if contributors:
-            properties[DocumentProperties.CONTRIBUTORS] = {
-                "people": format_people_for_notion(contributors)
-            }
-        
-        if owned_by:
-            properties[DocumentProperties.OWNED_BY] = {
-                "people": format_people_for_notion(owned_by)
-            }
-        
-        if in_charge:
-            properties[DocumentProperties.IN_CHARGE] = {
-                "people": format_people_for_notion(in_charge)
-            }
-        
-        if team:
-            properties[DocumentProperties.TEAM] = {
-                "relation": format_relation_for_notion(team)
-            }
-        
-        if events_projects:
-            properties[DocumentProperties.EVENTS_PROJECTS] = {
-                "relation": format_relation_for_notion(events_projects)
-            }
-        
-        if parent_item:
-            properties[DocumentProperties.PARENT_ITEM] = {
-                "relation": format_relation_for_notion(parent_item)
-            }
-        
-        if sub_item:
-            properties[DocumentProperties.SUB_ITEM] = {
-                "relation": format_relation_for_notion(sub_item)
-            }
-        
-        if google_drive_file:
-            properties[DocumentProperties.GOOGLE_DRIVE_FILE] = {
-                "relation": format_relation_for_notion(google_drive_file)
-            }
-        
-        if pinned is not None:
-            properties[DocumentProperties.PINNED] = {
-                "checkbox": pinned
-            }
+        properties = _document_create_properties(
+            name,
+            status,
+            person,
+            contributors,
+            owned_by,
+            in_charge,
+            team,
+            events_projects,
+            parent_item,
+            sub_item,
+            google_drive_file,
+            pinned
+        )
         
         response = client.pages.create(
             parent={"database_id": DOCUMENTS_DB_ID},
@@ -105,6 +137,10 @@ def create_document(
     except Exception as e:
         raise DocumentCRUDError(f"Failed to create document: {str(e)}")
 
+def _parse_document_page(page: Dict[str, Any]) -> Document:
+    """Parse a raw Notion page into a Document"""
+    return get_document_parser()(page)
+
 def get_document(document_id: DocumentID) -> Optional[Document]:
     """Get a document by ID"""
     try:
@@ -114,27 +150,90 @@ def get_document(document_id: DocumentID) -> Optional[Document]:
         if not response:
             return None
         
-        props = response["properties"]
-        
-        return Document(
-            id=DocumentID(response["id"]),
-            name=props.get(DocumentProperties.NAME, {}).get("title", [{}])[0].get("text", {}).get("content", ""),
-            status=get_select_enum_value(DocumentStatus, props.get(DocumentProperties.STATUS, {}).get("status", {}).get("id", "")),
-            person=parse_people_from_notion(props.get(DocumentProperties.PERSON, {}).get("people", [])),
-            contributors=parse_people_from_notion(props.get(DocumentProperties.CONTRIBUTORS, {}).get("people", [])),
-            owned_by=parse_people_from_notion(props.get(DocumentProperties.OWNED_BY, {}).get("people", [])),
-            in_charge=parse_people_from_notion(props.get(DocumentProperties.IN_CHARGE, {}).get("people", [])),
-            team=[TeamID(id_) for id_ in parse_relation_from_notion(props.get(DocumentProperties.TEAM, {}).get("relation", []))],
-            events_projects=[EventProjectID(id_) for id_ in parse_relation_from_notion(props.get(DocumentProperties.EVENTS_PROJECTS, {}).get("relation", []))],
-            parent_item=[DocumentID(id_) for id_ in parse_relation_from_notion(props.get(DocumentProperties.PARENT_ITEM, {}).get("relation", []))],
-            sub_item=[DocumentID(id_) for id_ in parse_relation_from_notion(props.get(DocumentProperties.SUB_ITEM, {}).get("relation", []))],
-            google_drive_file=parse_relation_from_notion(props.get(DocumentProperties.GOOGLE_DRIVE_FILE, {}).get("relation", [])),
-            pinned=props.get(DocumentProperties.PINNED, {}).get("checkbox", False)
-        )
+        return _parse_document_page(response)
     
     except Exception as e:
         raise DocumentCRUDError(f"Failed to get document: {str(e)}")
 
+def _document_update_properties(
+    name: Optional[str] = None,
+    status: Optional[DocumentStatus] = None,
+    person: Optional[List[Person]] = None,
+    contributors: Optional[List[Person]] = None,
+    owned_by: Optional[List[Person]] = None,
+    in_charge: Optional[List[Person]] = None,
+    team: Optional[List[TeamID]] = None,
+    events_projects: Optional[List[EventProjectID]] = None,
+    parent_item: Optional[List[DocumentID]] = None,
+    sub_item: Optional[List[DocumentID]] = None,
+    google_drive_file: Optional[List[str]] = None,
+    pinned: Optional[bool] = None
+) -> Dict[str, Any]:
+    """Build the page properties for update_document"""
+    properties = {}
+    
+    if name is not None:
+        properties[DocumentProperties.NAME] = {
+            "title": [{"text": {"content": name}}]
+        }
+    
+    if status is not None:
+        properties[DocumentProperties.STATUS] = {
+            "status": {"id": get_notion_id_from_enum(status)} if status else None
+        }
+    
+    if person is not None:
+        properties[DocumentProperties.PERSON] = {
+            "people": format_people_for_notion(person)
+        }
+    
+    if contributors is not None:
+        properties[DocumentProperties.CONTRIBUTORS] = {
+            "people": format_people_for_notion(contributors)
+        }
+    
+    if owned_by is not None:
+        properties[DocumentProperties.OWNED_BY] = {
+            "people": format_people_for_notion(owned_by)
+        }
+    
+    if in_charge is not None:
+        properties[DocumentProperties.IN_CHARGE] = {
+            "people": format_people_for_notion(in_charge)
+        }
+    
+    if team is not None:
+        properties[DocumentProperties.TEAM] = {
+            "relation": format_relation_for_notion(team)
+        }
+    
+    if events_projects is not None:
+        properties[DocumentProperties.EVENTS_PROJECTS] = {
+            "relation": format_relation_for_notion(events_projects)
+        }
+    
+    if parent_item is not None:
+        properties[DocumentProperties.PARENT_ITEM] = {
+            "relation": format_relation_for_notion(parent_item)
+        }
+    
+    if sub_item is not None:
+        properties[DocumentProperties.SUB_ITEM] = {
+            "relation": format_relation_for_notion(sub_item)
+        }
+    
+    if google_drive_file is not None:
+        properties[DocumentProperties.GOOGLE_DRIVE_FILE] = {
+            "relation": format_relation_for_notion(google_drive_file)
+        }
+    
+    if pinned is not None:
+        properties[DocumentProperties.PINNED] = {
+            "checkbox": pinned
+        }
+    
+    return properties
+
 def update_document(
     document_id: DocumentID,
     name: Optional[str] = None,
@@ -154,67 +253,20 @@ def update_document(
     try:
         client = get_notion_client()
         
-        properties = {}
-        
-        if name is not None:
-            properties[DocumentProperties.NAME] = {
-                "title": [{"text": {"content": name}}]
-            }
-        
-        if status is not None:
-            properties[DocumentProperties.STATUS] = {
-                "status": {"id": get_notion_id_from_enum(status)} if status else None
-            }
-        
-        if person is not None:
-            properties[DocumentProperties.PERSON] = {
-                "people": format_people_for_notion(person)
-            }
-        
-        if contributors is not None:
-            properties[DocumentProperties.CONTRIBUTORS] = {
-                "people": format_people_for_notion(contributors)
-            }
-        
-        if owned_by is not None:
-            properties[DocumentProperties.OWNED_BY] = {
-                "people": format_people_for_notion(owned_by)
-            }
-        
-        if in_charge is not None:
-            properties[DocumentProperties.IN_CHARGE] = {
-                "people": format_people_for_notion(in_charge)
-            }
-        
-        if team is not None:
-            properties[DocumentProperties.TEAM] = {
-                "relation": format_relation_for_notion(team)
-            }
-        
-        if events_projects is not None:
-            properties[DocumentProperties.EVENTS_PROJECTS] = {
-                "relation": format_relation_for_notion(events_projects)
-            }
-        
-        if parent_item is not None:
-            properties[DocumentProperties.PARENT_ITEM] = {
-                "relation": format_relation_for_notion(parent_item)
-            }
-        
-        if sub_item is not None:
-            properties[DocumentProperties.SUB_ITEM] = {
-                "relation": format_relation_for_notion(sub_item)
-            }
-        
-        if google_drive_file is not None:
-            properties[DocumentProperties.GOOGLE_DRIVE_FILE] = {
-                "relation": format_relation_for_notion(google_drive_file)
-            }
-        
-        if pinned is not None:
-            properties[DocumentProperties.PINNED] = {
-                "checkbox": pinned
-            }
+        properties = _document_update_properties(
+            name,
+            status,
+            person,
+            contributors,
+            owned_by,
+            in_charge,
+            team,
+            events_projects,
+            parent_item,
+            sub_item,
+            google_drive_file,
+            pinned
+        )
         
         client.pages.update(
             page_id=document_id,
@@ -239,79 +291,77 @@ def delete_document(document_id: DocumentID) -> bool:
     except Exception as e:
         raise DocumentCRUDError(f"Failed to delete document: {str(e)}")
 
-def query_documents(
+def _document_query_filter(
     status: Optional[DocumentStatus] = None,
     person: Optional[List[Person]] = None,
     team: Optional[List[TeamID]] = None,
     events_projects: Optional[List[EventProjectID]] = None,
-    pinned: Optional[bool] = None,
-    limit: Optional[int] = None
-) -> List[Document]:
-    """Query documents with filters"""
-    try:
-        client = get_notion_client()
-        
-        filter_conditions = []
-        
-        if status:
+    pinned: Optional[bool] = None
+) -> Optional[Dict[str, Any]]:
+    """Build the database filter for query_documents"""
+    filter_conditions = []
+    
+    if status:
+        filter_conditions.append({
+            "property": DocumentProperties.STATUS,
+            "status": {"equals": get_notion_id_from_enum(status)}
+        })
+    
+    if person:
+        for p in person:
             filter_conditions.append({
-                "property": DocumentProperties.STATUS,
-                "status": {"equals": get_notion_id_from_enum(status)}
+                "property": DocumentProperties.PERSON,
+                "people": {"contains": p.id}
             })
-        
-        if person:
-            for p in person:
-                filter_conditions.append({
-                    "property": DocumentProperties.PERSON,
-                    "people": {"contains": p.id}
-                })
-        
-        if team:
-            for team_id in team:
-                filter_conditions.append({
-                    "property": DocumentProperties.TEAM,
-                    "relation": {"contains": team_id}
-                })
-        
-        if events_projects:
-            for project_id in events_projects:
-                filter_conditions.append({
-                    "property": DocumentProperties.EVENTS_PROJECTS,
-                    "relation": {"contains": project_id}
-                })
-        
-        if pinned is not None:
+    
+    if team:
+        for team_id in team:
             filter_conditions.append({
-                "property": DocumentProperties.PINNED,
-                "checkbox": {"equals": pinned}
+                "property": DocumentProperties.TEAM,
+                "relation": {"contains": team_id}
             })
+    
+    if events_projects:
+        for project_id in events_projects:
+            filter_conditions.append({
+                "property": DocumentProperties.EVENTS_PROJECTS,
+                "relation": {"contains": project_id}
+            })
+    
+    if pinned is not None:
+        filter_conditions.append({
+            "property": DocumentProperties.PINNED,
+            "checkbox": {"equals": pinned}
+        })
+    
+    return build_filter(filter_conditions)
+
+def query_documents(
+    status: Optional[DocumentStatus] = None,
+    person: Optional[List[Person]] = None,
+    team: Optional[List[TeamID]] = None,
+    events_projects: Optional[List[EventProjectID]] = None,
+    pinned: Optional[bool] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None
+) -> List[Document]:
+    """Query documents with filters, following pagination and parsing rows from the query response"""
+    try:
+        query_filter = _document_query_filter(
+            status,
+            person,
+            team,
+            events_projects,
+            pinned
+        )
         
-        filter_obj = None
-        if filter_conditions:
-            if len(filter_conditions) == 1:
-                filter_obj = filter_conditions[0]
-            else:
-                filter_obj = {"and": filter_conditions}
-        
-        query_params = {
-            "database_id": DOCUMENTS_DB_ID
-        }
-        
-        if filter_obj:
-            query_params["filter"] = filter_obj
-        
-        if limit:
-            query_params["page_size"] = limit
-        
-        response = client.databases.query(**query_params)
-        
-        results = []
-        for page in response["results"]:
-            document = get_document(DocumentID(page["id"]))
-            if document:
-                results.append(document)
-        
-        return results
+        return query_database(
+            DOCUMENTS_DB_ID,
+            _parse_document_page,
+            filter=query_filter,
+            limit=limit,
+            use_mirror=use_mirror
+        )
     
     except Exception as e:
         raise DocumentCRUDError(f"Failed to query documents: {str(e)}")
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 from .types import (
@@ -18,17 +18,15 @@ from .types import (
 )
 from .client import (
     get_notion_client,
+    build_filter,
+    query_database,
     format_date_for_notion,
     format_rich_text_for_notion,
     format_people_for_notion,
     format_relation_for_notion,
-    parse_date_from_notion,
-    parse_rich_text_from_notion,
-    parse_people_from_notion,
-    parse_relation_from_notion,
-    get_select_enum_value,
     get_notion_id_from_enum,
 )
+from .parser import get_event_project_parser
 
 
 class EventProjectCRUDError(Exception):
@@ -37,7 +35,7 @@ class EventProjectCRUDError(Exception):
     pass
 
 
-def create_event_project(
+def _event_project_create_properties(
     name: str,
     type: Optional[EventProjectType] = None,
     progress: Optional[EventProjectProgress] = None,
@@ -53,84 +51,123 @@ def create_event_project(
     team: Optional[List[TeamID]] = None,
     documents: Optional[List[DocumentID]] = None,
     tasks: Optional[List[TaskID]] = None,
-) -> EventProjectID:
-    """Create a new event/project"""
-    try:
-        client = get_notion_client()
+) -> Dict[str, Any]:
+    """Build the page properties for create_event_project"""
+    properties = {
+        EventProjectProperties.NAME: {"title": [{"text": {"content": name}}]}
+    }
+
+    if type:
+        properties[EventProjectProperties.TYPE] = {
+            "select": {"id": get_notion_id_from_enum(type)}
+        }
 
-        properties = {
-            EventProjectProperties.NAME: {"title": [{"text": {"content": name}}]}
+    if progress:
+        properties[EventProjectProperties.PROGRESS] = {
+            "select": {"id": get_notion_id_from_enum(progress)}
         }
 
-        if type:
-            properties[EventProjectProperties.TYPE] = {
-                "select": {"id": get_notion_id_from_enum(type)}
-            }
+    if priority:
+        properties[EventProjectProperties.PRIORITY] = {
+            "select": {"id": get_notion_id_from_enum(priority)}
+        }
 
-        if progress:
-            properties[EventProjectProperties.PROGRESS] = {
-                "select": {"id": get_notion_id_from_enum(progress)}
-            }
+    if description:
+        properties[EventProjectProperties.DESCRIPTION] = {
+            "rich_text": format_rich_text_for_notion(description)
+        }
 
-        if priority:
-            properties[EventProjectProperties.PRIORITY] = {
-                "select": {"id": get_notion_id_from_enum(priority)}
-            }
+    if text:
+        properties[EventProjectProperties.TEXT] = {
+            "rich_text": format_rich_text_for_notion(text)
+        }
 
-        if description:
-            properties[EventProjectProperties.DESCRIPTION] = {
-                "rich_text": format_rich_text_for_notion(description)
-            }
+    if location:
+        properties[EventProjectProperties.LOCATION] = {
+            "rich_text": format_rich_text_for_notion(location)
+        }
 
-        if text:
-            properties[EventProjectProperties.TEXT] = {
-                "rich_text": format_rich_text_for_notion(text)
-            }
+    if due_dates:
+        date_obj = format_date_for_notion(due_dates)
+        if date_obj:
+            properties[EventProjectProperties.DUE_DATES] = {"date": date_obj}
 
-        if location:
-            properties[EventProjectProperties.LOCATION] = {
-                "rich_text": format_rich_text_for_notion(location)
-            }
+    if owner:
+        properties[EventProjectProperties.OWNER] = {
+            "people": format_people_for_notion(owner)
+        }
 
-        if due_dates:
-            date_obj = format_date_for_notion(due_dates)
-            if date_obj:
-                properties[EventProjectProperties.DUE_DATES] = {"date": date_obj}
+    if allocated:
+        properties[EventProjectProperties.ALLOCATED] = {
+            "people": format_people_for_notion(allocated)
+        }
 
-        if owner:
-            properties[EventProjectProperties.OWNER] = {
-                "people": format_people_for_notion(owner)
-            }
+    if parent_item:
+        properties[EventProjectProperties.PARENT_ITEM] = {
+            "relation": format_relation_for_notion(parent_item)
+        }
 
-        if allocated:
-            properties[EventProjectProperties.ALLOCATED] = {
-                "people": format_people_for_notion(allocated)
-            }
+    if sub_item:
+        properties[EventProjectProperties.SUB_ITEM] = {
+            "relation": format_relation_for_notion(sub_item)
+        }
 
-        if parent_item:
-            properties[EventProjectProperties.PARENT_ITEM] = {
-                "relation": format_relation_for_notion(parent_item)
-            }
+    if team:
+        properties[EventProjectProperties.TEAM] = {
+            "relation": format_relation_for_notion(team)
+        }
 
-        if sub_item:
-            properties[EventProjectProperties.SUB_ITEM] = {
-                "relation": format_relation_for_notion(sub_item)
-            }
+    if documents:
+        properties[EventProjectProperties.DOCUMENTS] = {
+            "relation": format_relation_for_notion(documents)
+        }
 
-        if team:
-            properties[EventProjectProperties.TEAM] = {
-                "relation": format_relation_for_notion(team)
-            }
+    if tasks:
+        properties[EventProjectProperties.TASKS] = {
+            "relation": format_relation_for_notion(tasks)
+        }
 
-        if documents:
-            properties[EventProjectProperties.DOCUMENTS] = {
-                "relation": format_relation_for_notion(documents)
-            }
+    return properties
 
-        if tasks:
-            properties[EventProjectProperties.TASKS] = {
-                "relation": format_relation_for_notion(tasks)
-            }
+
+def create_event_project(
+    name: str,
+    type: Optional[EventProjectType] = None,
+    progress: Optional[EventProjectProgress] = None,
+    priority: Optional[EventProjectPriority] = None,
+    description: Optional[List[RichText]] = None,
+    text: Optional[List[RichText]] = None,
+    location: Optional[List[RichText]] = None,
+    due_dates: Optional[NotionDate] = None,
+    owner: Optional[List[Person]] = None,
+    allocated: Optional[List[Person]] = None,
+    parent_item: Optional[List[EventProjectID]] = None,
+    sub_item: Optional[List[EventProjectID]] = None,
+    team: Optional[List[TeamID]] = None,
+    documents: Optional[List[DocumentID]] = None,
+    tasks: Optional[List[TaskID]] = None,
+) -> EventProjectID:
+    """Create a new event/project"""
+    try:
+        client = get_notion_client()
+
+        properties = _event_project_create_properties(
+            name,
+            type,
+            progress,
+            priority,
+            description,
+            text,
+            location,
+            due_dates,
+            owner,
+            allocated,
+            parent_item,
+            sub_item,
+            team,
+            documents,
+            tasks,
+        )
 
         response = client.pages.create(
             parent={"database_id": EVENTS_PROJECTS_DB_ID}, properties=properties
@@ -142,6 +179,11 @@ def create_event_project(
         raise EventProjectCRUDError(f"Failed to create event/project: {str(e)}")
 
 
+def _parse_event_project_page(page: Dict[str, Any]) -> EventProject:
+    """Parse a raw Notion page into an EventProject"""
+    return get_event_project_parser()(page)
+
+
 def get_event_project(event_project_id: EventProjectID) -> Optional[EventProject]:
     """Get an event/project by ID"""
     try:
@@ -151,90 +193,13 @@ def get_event_project(event_project_id: EventProjectID) -> Optional[EventProject
         if not response:
             return None
 
-        props = response["properties"]
-
-        return EventProject(
-            id=EventProjectID(response["id"]),
-            name=props.get(EventProjectProperties.NAME, {})
-            .get("title", [{}])[0]
-            .get("text", {})
-            .get("content", ""),
-            type=get_select_enum_value(
-                EventProjectType,
-                props.get(EventProjectProperties.TYPE, {})
-                .get("select", {})
-                .get("id", ""),
-            ),
-            progress=get_select_enum_value(
-                EventProjectProgress,
-                props.get(EventProjectProperties.PROGRESS, {})
-                .get("select", {})
-                .get("id", ""),
-            ),
-            priority=get_select_enum_value(
-                EventProjectPriority,
-                props.get(EventProjectProperties.PRIORITY, {})
-                .get("select", {})
-                .get("id", ""),
-            ),
-            description=parse_rich_text_from_notion(
-                props.get(EventProjectProperties.DESCRIPTION, {}).get("rich_text", [])
-            ),
-            text=parse_rich_text_from_notion(
-                props.get(EventProjectProperties.TEXT, {}).get("rich_text", [])
-            ),
-            location=parse_rich_text_from_notion(
-                props.get(EventProjectProperties.LOCATION, {}).get("rich_text", [])
-            ),
-            due_dates=parse_date_from_notion(
-                props.get(EventProjectProperties.DUE_DATES, {}).get("date")
-            ),
-            owner=parse_people_from_notion(
-                props.get(EventProjectProperties.OWNER, {}).get("people", [])
-            ),
-            allocated=parse_people_from_notion(
-                props.get(EventProjectProperties.ALLOCATED, {}).get("people", [])
-            ),
-            parent_item=[
-                EventProjectID(id_)
-                for id_ in parse_relation_from_notion(
-                    props.get(EventProjectProperties.PARENT_ITEM, {}).get(
-                        "relation", []
-                    )
-                )
-            ],
-            sub_item=[
-                EventProjectID(id_)
-                for id_ in parse_relation_from_notion(
-                    props.get(EventProjectProperties.SUB_ITEM, {}).get("relation", [])
-                )
-            ],
-            team=[
-                TeamID(id_)
-                for id_ in parse_relation_from_notion(
-                    props.get(EventProjectProperties.TEAM, {}).get("relation", [])
-                )
-            ],
-            documents=[
-                DocumentID(id_)
-                for id_ in parse_relation_from_notion(
-                    props.get(EventProjectProperties.DOCUMENTS, {}).get("relation", [])
-                )
-            ],
-            tasks=[
-                TaskID(id_)
-                for id_ in parse_relation_from_notion(
-                    props.get(EventProjectProperties.TASKS, {}).get("relation", [])
-                )
-            ],
-        )
+        return _parse_event_project_page(response)
 
     except Exception as e:
         raise EventProjectCRUDError(f"Failed to get event/project: {str(e)}")
 
 
-def update_event_project(
-    event_project_id: EventProjectID,
+def _event_project_update_properties(
     name: Optional[str] = None,
     type: Optional[EventProjectType] = None,
     progress: Optional[EventProjectProgress] = None,
@@ -250,90 +215,130 @@ def update_event_project(
     team: Optional[List[TeamID]] = None,
     documents: Optional[List[DocumentID]] = None,
     tasks: Optional[List[TaskID]] = None,
-) -> bool:
-    """Update an event/project"""
-    try:
-        client = get_notion_client()
+) -> Dict[str, Any]:
+    """Build the page properties for update_event_project"""
+    properties = {}
 
-        properties = {}
+    if name is not None:
+        properties[EventProjectProperties.NAME] = {
+            "title": [{"text": {"content": name}}]
+        }
 
-        if name is not None:
-            properties[EventProjectProperties.NAME] = {
-                "title": [{"text": {"content": name}}]
-            }
+    if type is not None:
+        properties[EventProjectProperties.TYPE] = {
+            "select": {"id": get_notion_id_from_enum(type)} if type else None
+        }
 
-        if type is not None:
-            properties[EventProjectProperties.TYPE] = {
-                "select": {"id": get_notion_id_from_enum(type)} if type else None
-            }
+    if progress is not None:
+        properties[EventProjectProperties.PROGRESS] = {
+            "select": {"id": get_notion_id_from_enum(progress)}
+            if progress
+            else None
+        }
 
-        if progress is not None:
-            properties[EventProjectProperties.PROGRESS] = {
-                "select": {"id": get_notion_id_from_enum(progress)}
-                if progress
-                else None
-            }
+    if priority is not None:
+        properties[EventProjectProperties.PRIORITY] = {
+            "select": {"id": get_notion_id_from_enum(priority)}
+            if priority
+            else None
+        }
 
-        if priority is not None:
-            properties[EventProjectProperties.PRIORITY] = {
-                "select": {"id": get_notion_id_from_enum(priority)}
-                if priority
-                else None
-            }
+    if description is not None:
+        properties[EventProjectProperties.DESCRIPTION] = {
+            "rich_text": format_rich_text_for_notion(description)
+        }
 
-        if description is not None:
-            properties[EventProjectProperties.DESCRIPTION] = {
-                "rich_text": format_rich_text_for_notion(description)
-            }
+    if text is not None:
+        properties[EventProjectProperties.TEXT] = {
+            "rich_text": format_rich_text_for_notion(text)
+        }
 
-        if text is not None:
-            properties[EventProjectProperties.TEXT] = {
-                "rich_text": format_rich_text_for_notion(text)
-            }
+    if location is not None:
+        properties[EventProjectProperties.LOCATION] = {
+            "rich_text": format_rich_text_for_notion(location)
+        }
 
-        if location is not None:
-            properties[EventProjectProperties.LOCATION] = {
-                "rich_text": format_rich_text_for_notion(location)
-            }
+    if due_dates is not None:
+        date_obj = format_date_for_notion(due_dates)
+        properties[EventProjectProperties.DUE_DATES] = {"date": date_obj}
 
-        if due_dates is not None:
-            date_obj = format_date_for_notion(due_dates)
-            properties[EventProjectProperties.DUE_DATES] = {"date": date_obj}
+    if owner is not None:
+        properties[EventProjectProperties.OWNER] = {
+            "people": format_people_for_notion(owner)
+        }
 
-        if owner is not None:
-            properties[EventProjectProperties.OWNER] = {
-                "people": format_people_for_notion(owner)
-            }
+    if allocated is not None:
+        properties[EventProjectProperties.ALLOCATED] = {
+            "people": format_people_for_notion(allocated)
+        }
 
-        if allocated is not None:
-            properties[EventProjectProperties.ALLOCATED] = {
-                "people": format_people_for_notion(allocated)
-            }
+    if parent_item is not None:
+        properties[EventProjectProperties.PARENT_ITEM] = {
+            "relation": format_relation_for_notion(parent_item)
+        }
 
-        if parent_item is not None:
-            properties[EventProjectProperties.PARENT_ITEM] = {
-                "relation": format_relation_for_notion(parent_item)
-            }
+    if sub_item is not None:
+        properties[EventProjectProperties.SUB_ITEM] = {
+            "relation": format_relation_for_notion(sub_item)
+        }
 
-        if sub_item is not None:
-            properties[EventProjectProperties.SUB_ITEM] = {
-                "relation": format_relation_for_notion(sub_item)
-            }
+    if team is not None:
+        properties[EventProjectProperties.TEAM] = {
+            "relation": format_relation_for_notion(team)
+        }
 
-        if team is not None:
-            properties[EventProjectProperties.TEAM] = {
-                "relation": format_relation_for_notion(team)
-            }
+    if documents is not None:
+        properties[EventProjectProperties.DOCUMENTS] = {
+            "relation": format_relation_for_notion(documents)
+        }
 
-        if documents is not None:
-            properties[EventProjectProperties.DOCUMENTS] = {
-                "relation": format_relation_for_notion(documents)
-            }
+    if tasks is not None:
+        properties[EventProjectProperties.TASKS] = {
+            "relation": format_relation_for_notion(tasks)
+        }
 
-        if tasks is not None:
-            properties[EventProjectProperties.TASKS] = {
-                "relation": format_relation_for_notion(tasks)
-            }
+    return properties
+
+
+def update_event_project(
+    event_project_id: EventProjectID,
+    name: Optional[str] = None,
+    type: Optional[EventProjectType] = None,
+    progress: Optional[EventProjectProgress] = None,
+    priority: Optional[EventProjectPriority] = None,
+    description: Optional[List[RichText]] = None,
+    text: Optional[List[RichText]] = None,
+    location: Optional[List[RichText]] = None,
+    due_dates: Optional[NotionDate] = None,
+    owner: Optional[List[Person]] = None,
+    allocated: Optional[List[Person]] = None,
+    parent_item: Optional[List[EventProjectID]] = None,
+    sub_item: Optional[List[EventProjectID]] = None,
+    team: Optional[List[TeamID]] = None,
+    documents: Optional[List[DocumentID]] = None,
+    tasks: Optional[List[TaskID]] = None,
+) -> bool:
+    """Update an event/project"""
+    try:
+        client = get_notion_client()
+
+        properties = _event_project_update_properties(
+            name,
+            type,
+            progress,
+            priority,
+            description,
+            text,
+            location,
+            due_dates,
+            owner,
+            allocated,
+            parent_item,
+            sub_item,
+            team,
+            documents,
+            tasks,
+        )
 
         client.pages.update(page_id=event_project_id, properties=properties)
 
@@ -354,86 +359,87 @@ def delete_event_project(event_project_id: EventProjectID) -> bool:
         raise EventProjectCRUDError(f"Failed to delete event/project: {str(e)}")
 
 
-def query_event_projects(
+def _event_project_query_filter(
     type: Optional[EventProjectType] = None,
     progress: Optional[EventProjectProgress] = None,
     priority: Optional[EventProjectPriority] = None,
     owner: Optional[List[Person]] = None,
     team: Optional[List[TeamID]] = None,
-    limit: Optional[int] = None,
-) -> List[EventProject]:
-    """Query event/projects with filters"""
-    try:
-        client = get_notion_client()
+) -> Optional[Dict[str, Any]]:
+    """Build the database filter for query_event_projects"""
+    filter_conditions = []
+
+    if type:
+        filter_conditions.append(
+            {
+                "property": EventProjectProperties.TYPE,
+                "select": {"equals": get_notion_id_from_enum(type)},
+            }
+        )
 
-        filter_conditions = []
+    if progress:
+        filter_conditions.append(
+            {
+                "property": EventProjectProperties.PROGRESS,
+                "select": {"equals": get_notion_id_from_enum(progress)},
+            }
+        )
 
-        if type:
-            filter_conditions.append(
-                {
-                    "property": EventProjectProperties.TYPE,
-                    "select": {"equals": get_notion_id_from_enum(type)},
-                }
-            )
+    if priority:
+        filter_conditions.append(
+            {
+                "property": EventProjectProperties.PRIORITY,
+                "select": {"equals": get_notion_id_from_enum(priority)},
+            }
+        )
 
-        if progress:
+    if owner:
+        for person in owner:
             filter_conditions.append(
                 {
-                    "property": EventProjectProperties.PROGRESS,
-                    "select": {"equals": get_notion_id_from_enum(progress)},
+                    "property": EventProjectProperties.OWNER,
+                    "people": {"contains": person.id},
                 }
             )
 
-        if priority:
+    if team:
+        for team_id in team:
             filter_conditions.append(
                 {
-                    "property": EventProjectProperties.PRIORITY,
-                    "select": {"equals": get_notion_id_from_enum(priority)},
+                    "property": EventProjectProperties.TEAM,
+                    "relation": {"contains": team_id},
                 }
             )
 
-        if owner:
-            for person in owner:
-                filter_conditions.append(
-                    {
-                        "property": EventProjectProperties.OWNER,
-                        "people": {"contains": person.id},
-                    }
-                )
-
-        if team:
-            for team_id in team:
-                filter_conditions.append(
-                    {
-                        "property": EventProjectProperties.TEAM,
-                        "relation": {"contains": team_id},
-                    }
-                )
-
-        filter_obj = None
-        if filter_conditions:
-            if len(filter_conditions) == 1:
-                filter_obj = filter_conditions[0]
-            else:
-                filter_obj = {"and": filter_conditions}
-
-        query_params = {"database_id": EVENTS_PROJECTS_DB_ID}
-
-        if filter_obj:
-            query_params["filter"] = filter_obj
-
-        if limit:
-            query_params["page_size"] = limit
-
-        response = client.databases.query(**query_params)
-
-        results = []
-        for page in response["results"]:
-            event_project = get_event_project(EventProjectID(page["id"]))
-            if event_project:
-                results.append(event_project)
-
-        return results
+    return build_filter(filter_conditions)
+
+
+def query_event_projects(
+    type: Optional[EventProjectType] = None,
+    progress: Optional[EventProjectProgress] = None,
+    priority: Optional[EventProjectPriority] = None,
+    owner: Optional[List[Person]] = None,
+    team: Optional[List[TeamID]] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None,
+) -> List[EventProject]:
+    """Query event/projects with filters, following pagination and parsing rows from the query response"""
+    try:
+        query_filter = _event_project_query_filter(
+            type,
+            progress,
+            priority,
+            owner,
+            team,
+        )
+
+        return query_database(
+            EVENTS_PROJECTS_DB_ID,
+            _parse_event_project_page,
+            filter=query_filter,
+            limit=limit,
+            use_mirror=use_mirror,
+        )
 
     except Exception as e:
         raise EventProjectCRUDError(f"Failed to query event/projects: {str(e)}")
@@ -0,0 +1,433 @@
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+
+from sqlalchemy import text
+
+from org_tools.brain.postgres.postgres import DatabaseEngine
+
+from .types import TASKS_DB_ID, EVENTS_PROJECTS_DB_ID, TEAMS_DB_ID, DOCUMENTS_DB_ID
+
+# Databases kept in the bronze.notion_page mirror
+MIRRORED_DATABASES: Dict[str, str] = {
+    TASKS_DB_ID: "tasks",
+    EVENTS_PROJECTS_DB_ID: "events_projects",
+    TEAMS_DB_ID: "teams",
+    DOCUMENTS_DB_ID: "documents",
+}
+
+# Pages upserted per statement during a sync
+UPSERT_BATCH_SIZE = 100
+
+class MirrorUnavailableError(Exception):
+    """The mirror cannot answer a query (not synced, stale, or unsupported filter); use the live API"""
+    pass
+
+@dataclass
+class SyncResult:
+    database_id: str
+    full: bool
+    pages_upserted: int = 0
+    pages_deleted: int = 0
+    seconds: float = 0.0
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a Notion ISO timestamp or date; dates are treated as midnight UTC"""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def _normalize_id(id_: str) -> str:
+    return id_.replace("-", "")
+
+# Filter evaluation ---------------------------------------------------------------------------
+
+def _find_property(page: Dict[str, Any], property_ref: str) -> Optional[Dict[str, Any]]:
+    """Find a page property by name or by property ID (filters may use either)"""
+    properties = page.get("properties", {})
+    if property_ref in properties:
+        return properties[property_ref]
+    for prop in properties.values():
+        if prop.get("id") == property_ref:
+            return prop
+    return None
+
+def _plain_text(items: List[Dict[str, Any]]) -> str:
+    return "".join(item.get("plain_text", "") for item in items or [])
+
+def _match_text(value: str, condition: Dict[str, Any]) -> bool:
+    for op, operand in condition.items():
+        if op == "equals" and value != operand: return False
+        if op == "does_not_equal" and value == operand: return False
+        if op == "contains" and operand not in value: return False
+        if op == "does_not_contain" and operand in value: return False
+        if op == "starts_with" and not value.startswith(operand): return False
+        if op == "ends_with" and not value.endswith(operand): return False
+        if op == "is_empty" and bool(value): return False
+        if op == "is_not_empty" and not value: return False
+    return True
+
+def _match_option(option: Optional[Dict[str, Any]], condition: Dict[str, Any]) -> bool:
+    """Match a select/status option by ID or name"""
+    keys = {option.get("id"), option.get("name")} if option else set()
+    for op, operand in condition.items():
+        if op == "equals" and operand not in keys: return False
+        if op == "does_not_equal" and operand in keys: return False
+        if op == "is_empty" and option: return False
+        if op == "is_not_empty" and not option: return False
+    return True
+
+def _match_list(ids: List[str], condition: Dict[str, Any]) -> bool:
+    """Match people, relation and multi_select values by ID (or option name)"""
+    normalized = {_normalize_id(id_) for id_ in ids if id_}
+    for op, operand in condition.items():
+        if op == "contains" and _normalize_id(operand) not in normalized: return False
+        if op == "does_not_contain" and _normalize_id(operand) in normalized: return False
+        if op == "is_empty" and normalized: return False
+        if op == "is_not_empty" and not normalized: return False
+    return True
+
+def _match_number(value: Optional[float], condition: Dict[str, Any]) -> bool:
+    for op, operand in condition.items():
+        if op == "is_empty":
+            if value is not None: return False
+            continue
+        if op == "is_not_empty":
+            if value is None: return False
+            continue
+        if value is None: return False
+        if op == "equals" and value != operand: return False
+        if op == "does_not_equal" and value == operand: return False
+        if op == "greater_than" and not value > operand: return False
+        if op == "less_than" and not value < operand: return False
+        if op == "greater_than_or_equal_to" and not value >= operand: return False
+        if op == "less_than_or_equal_to" and not value <= operand: return False
+    return True
+
+def _match_date(value: Optional[str], condition: Dict[str, Any]) -> bool:
+    for op, operand in condition.items():
+        if op == "is_empty":
+            if value: return False
+            continue
+        if op == "is_not_empty":
+            if not value: return False
+            continue
+        if op not in ("equals", "before", "after", "on_or_before", "on_or_after"):
+            # Relative operators (past_week, next_month, ...) are left to the live API
+            raise MirrorUnavailableError(f"Unsupported date filter: {op}")
+        if not value: return False
+        left, right = _parse_timestamp(value), _parse_timestamp(operand)
+        if op == "equals" and left != right: return False
+        if op == "before" and not left < right: return False
+        if op == "after" and not left > right: return False
+        if op == "on_or_before" and not left <= right: return False
+        if op == "on_or_after" and not left >= right: return False
+    return True
+
+def _match_property(prop: Optional[Dict[str, Any]], prop_type: str, condition: Dict[str, Any]) -> bool:
+    value = prop.get(prop_type) if prop else None
+    if prop_type in ("title", "rich_text"):
+        return _match_text(_plain_text(value or []), condition)
+    if prop_type in ("select", "status"):
+        return _match_option(value, condition)
+    if prop_type == "multi_select":
+        return _match_list([key for option in value or [] for key in (option.get("id"), option.get("name"))], condition)
+    if prop_type in ("people", "relation"):
+        return _match_list([item.get("id") for item in value or []], condition)
+    if prop_type == "checkbox":
+        if "equals" in condition:
+            return bool(value) == condition["equals"]
+        return bool(value) != condition.get("does_not_equal")
+    if prop_type == "number":
+        return _match_number(value, condition)
+    if prop_type == "date":
+        return _match_date((value or {}).get("start"), condition)
+    if prop_type in ("url", "email", "phone_number"):
+        return _match_text(value or "", condition)
+    raise MirrorUnavailableError(f"Unsupported filter property type: {prop_type}")
+
+def page_matches_filter(page: Dict[str, Any], filter: Optional[Dict[str, Any]]) -> bool:
+    """Evaluate a Notion database filter object against a raw page"""
+    if not filter:
+        return True
+    if "and" in filter:
+        return all(page_matches_filter(page, sub_filter) for sub_filter in filter["and"])
+    if "or" in filter:
+        return any(page_matches_filter(page, sub_filter) for sub_filter in filter["or"])
+    if "timestamp" in filter:
+        timestamp = filter["timestamp"]
+        return _match_date(page.get(timestamp), filter[timestamp])
+    if "property" in filter:
+        prop = _find_property(page, filter["property"])
+        conditions = [(key, value) for key, value in filter.items() if key != "property"]
+        return all(_match_property(prop, prop_type, condition) for prop_type, condition in conditions)
+    raise MirrorUnavailableError(f"Unsupported filter: {filter}")
+
+# Filter pushdown -----------------------------------------------------------------------------
+
+# Matches the property a filter refers to by name or by property ID, like _find_property
+_SQL_FIND_PROPERTY = "SELECT 1 FROM jsonb_each(page->'properties') AS p(name, prop) WHERE (p.name = :{ref} OR p.prop->>'id' = :{ref})"
+
+def _sql_condition(property_ref: str, prop_type: str, op: str, operand: Any, params: Dict[str, Any]) -> Optional[str]:
+    """SQL for a status/select or people/relation condition, or None to leave it to page_matches_filter"""
+    ref, value = f"p{len(params)}", f"p{len(params) + 1}"
+    find_property = _SQL_FIND_PROPERTY.format(ref=ref)
+    if prop_type in ("select", "status") and op in ("equals", "does_not_equal") and isinstance(operand, str):
+        match = f"EXISTS ({find_property} AND :{value} IN (p.prop->'{prop_type}'->>'id', p.prop->'{prop_type}'->>'name'))"
+        params[value] = operand
+    elif prop_type in ("people", "relation") and op in ("contains", "does_not_contain") and isinstance(operand, str):
+        try:
+            # Pages store dashed IDs, filters may not
+            item_id = str(uuid.UUID(operand))
+        except ValueError:
+            return None
+        match = f"EXISTS ({find_property} AND p.prop->'{prop_type}' @> CAST(:{value} AS JSONB))"
+        params[value] = json.dumps([{"id": item_id}])
+    else:
+        return None
+    params[ref] = property_ref
+    return match if op in ("equals", "contains") else f"NOT {match}"
+
+def _sql_filter_conditions(filter: Optional[Dict[str, Any]], params: Dict[str, Any]) -> Tuple[List[str], bool]:
+    """
+    Translate the parts of a Notion filter the mirror can answer in SQL: the "and" of
+    status/select equality and people/relation membership. Returns the conditions, binding their
+    parameters into params, and whether they cover the whole filter.
+    """
+    if not filter:
+        return [], True
+    if "and" in filter:
+        conditions: List[str] = []
+        exact = True
+        for sub_filter in filter["and"]:
+            sub_conditions, sub_exact = _sql_filter_conditions(sub_filter, params)
+            conditions.extend(sub_conditions)
+            exact = exact and sub_exact
+        return conditions, exact
+    if "property" not in filter or "or" in filter or "timestamp" in filter:
+        return [], False
+
+    conditions = []
+    exact = True
+    for prop_type, condition in filter.items():
+        if prop_type == "property":
+            continue
+        for op, operand in (condition.items() if isinstance(condition, dict) else [(None, None)]):
+            sql = _sql_condition(filter["property"], prop_type, op, operand, params)
+            if sql is None:
+                exact = False
+            else:
+                conditions.append(sql)
+    return conditions, exact
+
+# Mirror --------------------------------------------------------------------------------------
+
+class NotionMirror:
+    """
+    Mirrors Notion databases into bronze.notion_page.
+
+    Regular syncs only fetch pages whose last_edited_time is at or after the stored
+    watermark. Deleted and archived pages never show up in those deltas, so every
+    full_sync_interval a full reconciliation re-lists the database and drops pages
+    that were not returned.
+    """
+
+    def __init__(
+        self,
+        database_ids: Optional[List[str]] = None,
+        full_sync_interval: timedelta = timedelta(hours=24),
+        max_staleness: timedelta = timedelta(minutes=15)
+    ):
+        self.database_ids = database_ids or list(MIRRORED_DATABASES)
+        self.full_sync_interval = full_sync_interval
+        self.max_staleness = max_staleness
+
+    def _get_state(self, database_id: str) -> Dict[str, Any]:
+        query = text("""
+            SELECT watermark, last_sync_at, last_full_sync_at
+            FROM bronze.notion_sync_state
+            WHERE database_id = :database_id
+        """)
+        with DatabaseEngine.connect("notion_mirror_get_state") as conn:
+            row = conn.execute(query, {"database_id": database_id}).mappings().fetchone()
+        return dict(row) if row else {"watermark": None, "last_sync_at": None, "last_full_sync_at": None}
+
+    def _upsert_pages(self, database_id: str, pages: List[Dict[str, Any]], seen_at: datetime) -> None:
+        if not pages:
+            return
+        query = text("""
+            INSERT INTO bronze.notion_page
+                (page_id, database_id, page, created_time, last_edited_time, seen_at)
+            VALUES
+                (:page_id, :database_id, CAST(:page AS JSONB), :created_time, :last_edited_time, :seen_at)
+            ON CONFLICT (page_id) DO UPDATE SET
+                page = EXCLUDED.page,
+                last_edited_time = EXCLUDED.last_edited_time,
+                seen_at = EXCLUDED.seen_at,
+                ingestion_timestamp = CURRENT_TIMESTAMP
+        """)
+        rows = [
+            {
+                "page_id": page["id"],
+                "database_id": database_id,
+                "page": json.dumps(page),
+                "created_time": page["created_time"],
+                "last_edited_time": page["last_edited_time"],
+                "seen_at": seen_at,
+            }
+            for page in pages
+        ]
+        with DatabaseEngine.begin("notion_mirror_upsert_pages") as conn:
+            conn.execute(query, rows)
+
+    def sync_database(self, database_id: str, full: Optional[bool] = None) -> SyncResult:
+        """
+        Bring one database's mirror up to date.
+
+        Args:
+            database_id: Notion database to sync
+            full: Force (True) or skip (False) a full reconciliation; by default one runs
+                when the last was more than full_sync_interval ago
+        """
+        # Imported here, client.py imports this module lazily for mirror reads
+        from .client import iter_database_pages
+
+        started = time.perf_counter()
+        seen_at = datetime.now(timezone.utc)
+        state = self._get_state(database_id)
+        if full is None:
+            last_full = state["last_full_sync_at"]
+            full = state["watermark"] is None or last_full is None or seen_at - last_full >= self.full_sync_interval
+
+        filter = None
+        if not full and state["watermark"]:
+            # on_or_after: Notion rounds last_edited_time to the minute, re-reading a few pages is harmless
+            filter = {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": state["watermark"].isoformat()}}
+        sorts = [{"timestamp": "last_edited_time", "direction": "ascending"}]
+
+        result = SyncResult(database_id=database_id, full=full)
+        watermark = state["watermark"]
+        batch: List[Dict[str, Any]] = []
+        for page in iter_database_pages(database_id, filter=filter, sorts=sorts, use_mirror=False):
+            batch.append(page)
+            edited = _parse_timestamp(page["last_edited_time"])
+            watermark = max(watermark, edited) if watermark else edited
+            if len(batch) >= UPSERT_BATCH_SIZE:
+                self._upsert_pages(database_id, batch, seen_at)
+                result.pages_upserted += len(batch)
+                batch = []
+        self._upsert_pages(database_id, batch, seen_at)
+        result.pages_upserted += len(batch)
+
+        with DatabaseEngine.begin("notion_mirror_finish_sync") as conn:
+            if full:
+                # Everything still in the database was just re-listed; the rest was deleted or archived
+                deleted = conn.execute(
+                    text("DELETE FROM bronze.notion_page WHERE database_id = :database_id AND seen_at < :seen_at"),
+                    {"database_id": database_id, "seen_at": seen_at},
+                )
+                result.pages_deleted = deleted.rowcount
+            conn.execute(
+                text("""
+                    INSERT INTO bronze.notion_sync_state (database_id, watermark, last_sync_at, last_full_sync_at)
+                    VALUES (:database_id, :watermark, :synced_at, :full_synced_at)
+                    ON CONFLICT (database_id) DO UPDATE SET
+                        watermark = EXCLUDED.watermark,
+                        last_sync_at = EXCLUDED.last_sync_at,
+                        last_full_sync_at = COALESCE(EXCLUDED.last_full_sync_at, bronze.notion_sync_state.last_full_sync_at)
+                """),
+                {
+                    "database_id": database_id,
+                    "watermark": watermark,
+                    "synced_at": seen_at,
+                    "full_synced_at": seen_at if full else None,
+                },
+            )
+
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def sync_all(self, full: Optional[bool] = None) -> List[SyncResult]:
+        """Sync every mirrored database, continuing past individual failures"""
+        results = []
+        for database_id in self.database_ids:
+            name = MIRRORED_DATABASES.get(database_id, database_id)
+            try:
+                result = self.sync_database(database_id, full=full)
+                results.append(result)
+                print(f"Synced {name} ({'full' if result.full else 'delta'}): {result.pages_upserted} upserted, "
+                      f"{result.pages_deleted} deleted in {result.seconds:.1f}s")
+            except Exception as e:
+                print(f"Failed to sync {name}: {e}")
+        return results
+
+    def run_forever(self, interval: float = 60.0) -> None:
+        """Sync all databases every interval seconds"""
+        while True:
+            self.sync_all()
+            time.sleep(interval)
+
+    def iter_pages(
+        self,
+        database_id: str,
+        filter: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream mirrored pages matching a Notion filter, most recently edited first.
+        The common status and people predicates run in Postgres; anything else is checked
+        against the pages they leave.
+        Raises MirrorUnavailableError if the database is not mirrored or its mirror is stale.
+        """
+        state = self._get_state(database_id)
+        last_sync_at = state["last_sync_at"]
+        if last_sync_at is None or datetime.now(timezone.utc) - last_sync_at > self.max_staleness:
+            raise MirrorUnavailableError(f"Mirror of {database_id} is missing or stale (last sync {last_sync_at})")
+
+        params: Dict[str, Any] = {"database_id": database_id}
+        conditions, exact = _sql_filter_conditions(filter, params)
+        if exact and limit is not None:
+            params["limit"] = limit
+        query = text(f"""
+            SELECT page
+            FROM bronze.notion_page
+            WHERE {" AND ".join(["database_id = :database_id", *conditions])}
+            ORDER BY last_edited_time DESC
+            {"LIMIT :limit" if "limit" in params else ""}
+        """)
+        with DatabaseEngine.connect("notion_mirror_iter_pages") as conn:
+            pages = conn.execute(query, params).scalars().all()
+
+        if exact:
+            yield from pages
+            return
+        # Evaluate the whole filter before yielding, so an unsupported one fails before any rows are used
+        matched = [page for page in pages if page_matches_filter(page, filter)]
+        yield from matched[:limit] if limit is not None else matched
+
+_mirror: Optional[NotionMirror] = None
+
+def get_notion_mirror() -> NotionMirror:
+    """Get the process-wide mirror, configured from NOTION_MIRROR_MAX_STALENESS_SECONDS"""
+    global _mirror
+    if _mirror is None:
+        max_staleness = float(os.getenv("NOTION_MIRROR_MAX_STALENESS_SECONDS", "900"))
+        _mirror = NotionMirror(max_staleness=timedelta(seconds=max_staleness))
+    return _mirror
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mirror Notion databases into bronze.notion_page")
+    parser.add_argument("--full", action="store_true", help="Force a full reconciliation")
+    parser.add_argument("--interval", type=float, help="Keep syncing every INTERVAL seconds")
+    args = parser.parse_args()
+
+    mirror = get_notion_mirror()
+    if args.interval:
+        mirror.run_forever(args.interval)
+    else:
+        mirror.sync_all(full=True if args.full else None)
\ No newline at end of file
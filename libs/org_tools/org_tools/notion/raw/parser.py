@@ -0,0 +1,222 @@
+import json
+import os
+from dataclasses import fields
+from enum import Enum
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Callable, Iterable, Tuple, Type, Generic, TypeVar
+
+from .types import (
+    EventProject, Task, Team, Document, Person, PersonID, RichText,
+    EventProjectType, EventProjectProgress, EventProjectPriority,
+    TaskStatus, TaskPriority, DocumentStatus,
+    EventProjectProperties, TaskProperties, TeamProperties, DocumentProperties,
+    EVENTS_PROJECTS_DB_ID, TASKS_DB_ID, TEAMS_DB_ID, DOCUMENTS_DB_ID
+)
+from .client import parse_date_from_notion
+
+T = TypeVar("T")
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "schema.json")
+
+# dataclass field -> (property ID, enum the option ID maps to)
+EVENT_PROJECT_FIELDS: Dict[str, Tuple[str, Optional[Type[Enum]]]] = {
+    "name": (EventProjectProperties.NAME, None),
+    "type": (EventProjectProperties.TYPE, EventProjectType),
+    "progress": (EventProjectProperties.PROGRESS, EventProjectProgress),
+    "priority": (EventProjectProperties.PRIORITY, EventProjectPriority),
+    "description": (EventProjectProperties.DESCRIPTION, None),
+    "text": (EventProjectProperties.TEXT, None),
+    "location": (EventProjectProperties.LOCATION, None),
+    "due_dates": (EventProjectProperties.DUE_DATES, None),
+    "owner": (EventProjectProperties.OWNER, None),
+    "allocated": (EventProjectProperties.ALLOCATED, None),
+    "parent_item": (EventProjectProperties.PARENT_ITEM, None),
+    "sub_item": (EventProjectProperties.SUB_ITEM, None),
+    "team": (EventProjectProperties.TEAM, None),
+    "documents": (EventProjectProperties.DOCUMENTS, None),
+    "tasks": (EventProjectProperties.TASKS, None)
+}
+
+TASK_FIELDS: Dict[str, Tuple[str, Optional[Type[Enum]]]] = {
+    "name": (TaskProperties.NAME, None),
+    "status": (TaskProperties.STATUS, TaskStatus),
+    "priority": (TaskProperties.PRIORITY, TaskPriority),
+    "description": (TaskProperties.DESCRIPTION, None),
+    "task_progress": (TaskProperties.TASK_PROGRESS, None),
+    "due_dates": (TaskProperties.DUE_DATES, None),
+    "in_charge": (TaskProperties.IN_CHARGE, None),
+    "event_project": (TaskProperties.EVENT_PROJECT, None),
+    "team": (TaskProperties.TEAM, None),
+    "parent_task": (TaskProperties.PARENT_TASK, None),
+    "sub_task": (TaskProperties.SUB_TASK, None),
+    "blocking": (TaskProperties.BLOCKING, None),
+    "blocked_by": (TaskProperties.BLOCKED_BY, None)
+}
+
+TEAM_FIELDS: Dict[str, Tuple[str, Optional[Type[Enum]]]] = {
+    "name": (TeamProperties.NAME, None),
+    "person": (TeamProperties.PERSON, None),
+    "cover": (TeamProperties.COVER, None),
+    "events_projects": (TeamProperties.EVENTS_PROJECTS, None),
+    "committee": (TeamProperties.COMMITTEE, None),
+    "document": (TeamProperties.DOCUMENT, None)
+}
+
+DOCUMENT_FIELDS: Dict[str, Tuple[str, Optional[Type[Enum]]]] = {
+    "name": (DocumentProperties.NAME, None),
+    "status": (DocumentProperties.STATUS, DocumentStatus),
+    "person": (DocumentProperties.PERSON, None),
+    "contributors": (DocumentProperties.CONTRIBUTORS, None),
+    "owned_by": (DocumentProperties.OWNED_BY, None),
+    "in_charge": (DocumentProperties.IN_CHARGE, None),
+    "team": (DocumentProperties.TEAM, None),
+    "events_projects": (DocumentProperties.EVENTS_PROJECTS, None),
+    "parent_item": (DocumentProperties.PARENT_ITEM, None),
+    "sub_item": (DocumentProperties.SUB_ITEM, None),
+    "google_drive_file": (DocumentProperties.GOOGLE_DRIVE_FILE, None),
+    "pinned": (DocumentProperties.PINNED, None)
+}
+
+class ParserSchemaError(Exception):
+    """Exception for field specs that don't match schema.json"""
+    pass
+
+@lru_cache(maxsize=None)
+def load_schema() -> Dict[str, Dict[str, Any]]:
+    """Load schema.json, keyed by dashed database ID"""
+    with open(SCHEMA_PATH, encoding="utf-8") as f:
+        schemas = json.load(f)
+    return {database["id"]: database for database in schemas.values()}
+
+def _extract_title(prop: Dict[str, Any]) -> str:
+    title = prop.get("title")
+    if not title:
+        return ""
+    return (title[0].get("text") or {}).get("content", "")
+
+def _extract_rich_text(prop: Dict[str, Any]) -> List[RichText]:
+    result = []
+    for text_obj in prop.get("rich_text") or ():
+        link = (text_obj.get("text") or {}).get("link")
+        result.append(RichText(content=text_obj.get("plain_text", ""), link=link["url"] if link else None))
+    return result
+
+def _extract_people(prop: Dict[str, Any]) -> List[Person]:
+    return [
+        Person(
+            id=PersonID(person_data["id"]),
+            name=person_data.get("name"),
+            avatar_url=person_data.get("avatar_url"),
+            email=(person_data.get("person") or {}).get("email")
+        )
+        for person_data in prop.get("people") or ()
+    ]
+
+def _extract_relation(prop: Dict[str, Any]) -> List[str]:
+    return [rel["id"] for rel in prop.get("relation") or ()]
+
+def _extract_files(prop: Dict[str, Any]) -> List[str]:
+    return [file_obj.get("name", "") for file_obj in prop.get("files") or ()]
+
+def _extract_date(prop: Dict[str, Any]):
+    return parse_date_from_notion(prop.get("date"))
+
+def _extract_checkbox(prop: Dict[str, Any]) -> bool:
+    return prop.get("checkbox", False)
+
+def _option_extractor(value_key: str, enum_class: Type[Enum]) -> Callable[[Dict[str, Any]], Optional[Enum]]:
+    # Reverse map built once, so each page costs one dict lookup instead of a scan of the enum
+    by_option_id = {member.value: member for member in enum_class}
+
+    def extract(prop: Dict[str, Any]) -> Optional[Enum]:
+        option = prop.get(value_key)
+        return by_option_id.get(option.get("id")) if option else None
+
+    return extract
+
+# Notion property type -> (extractor, value when the property is missing, value is a fresh list)
+_EXTRACTORS: Dict[str, Tuple[Callable[[Dict[str, Any]], Any], Any, bool]] = {
+    "title": (_extract_title, "", False),
+    "rich_text": (_extract_rich_text, None, True),
+    "people": (_extract_people, None, True),
+    "relation": (_extract_relation, None, True),
+    "files": (_extract_files, None, True),
+    "date": (_extract_date, None, False),
+    "checkbox": (_extract_checkbox, False, False)
+}
+
+class PageParser(Generic[T]):
+    """
+    Page -> dataclass parser compiled once from schema.json and a field spec.
+
+    Every property is resolved to an extractor up front, keyed by both its property ID and its
+    schema name, so parsing a page is a single pass over its properties with one dict lookup
+    each, whether the page keys them by name (as the API does) or by ID.
+    """
+
+    def __init__(self, model: Type[T], database_id: str, field_spec: Dict[str, Tuple[str, Optional[Type[Enum]]]]):
+        database = load_schema().get(database_id)
+        if database is None:
+            raise ParserSchemaError(f"Database {database_id} is not in {SCHEMA_PATH}")
+        property_names = {prop["id"]: name for name, prop in database["properties"].items()}
+        property_types = {prop["id"]: prop["type"] for prop in database["properties"].values()}
+        model_fields = {field.name for field in fields(model)}
+
+        self.model = model
+        self._extractors: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Any]]] = {}
+        self._defaults: Dict[str, Any] = {}
+        self._list_fields: List[str] = []
+        for field_name, (property_id, enum_class) in field_spec.items():
+            if field_name not in model_fields:
+                raise ParserSchemaError(f"{model.__name__} has no field {field_name}")
+            property_type = property_types.get(property_id)
+            if property_type is None:
+                raise ParserSchemaError(f"Property {property_id} ({model.__name__}.{field_name}) is not in the schema of {database_id}")
+
+            if property_type in ("select", "status"):
+                if enum_class is None:
+                    raise ParserSchemaError(f"{model.__name__}.{field_name} is a {property_type} property and needs an enum")
+                extract, default, is_list = _option_extractor(property_type, enum_class), None, False
+            elif property_type in _EXTRACTORS:
+                extract, default, is_list = _EXTRACTORS[property_type]
+            else:
+                raise ParserSchemaError(f"Unsupported property type {property_type} for {model.__name__}.{field_name}")
+
+            # Pages from the API key properties by name, ones built from the ID constants by ID
+            self._extractors[property_id] = self._extractors[property_names[property_id]] = (field_name, extract)
+            if is_list:
+                self._list_fields.append(field_name)
+            else:
+                self._defaults[field_name] = default
+
+    def __call__(self, page: Dict[str, Any]) -> T:
+        extractors = self._extractors
+        values = self._defaults.copy()
+        for key, prop in page["properties"].items():
+            entry = extractors.get(key)
+            if entry is not None:
+                values[entry[0]] = entry[1](prop)
+        for field_name in self._list_fields:
+            if field_name not in values:
+                values[field_name] = []
+        return self.model(id=page["id"], **values)
+
+    def parse_many(self, pages: Iterable[Dict[str, Any]]) -> List[T]:
+        """Parse a batch of pages in one pass"""
+        return [self(page) for page in pages]
+
+@lru_cache(maxsize=None)
+def get_event_project_parser() -> PageParser[EventProject]:
+    return PageParser(EventProject, EVENTS_PROJECTS_DB_ID, EVENT_PROJECT_FIELDS)
+
+@lru_cache(maxsize=None)
+def get_task_parser() -> PageParser[Task]:
+    return PageParser(Task, TASKS_DB_ID, TASK_FIELDS)
+
+@lru_cache(maxsize=None)
+def get_team_parser() -> PageParser[Team]:
+    return PageParser(Team, TEAMS_DB_ID, TEAM_FIELDS)
+
+@lru_cache(maxsize=None)
+def get_document_parser() -> PageParser[Document]:
+    return PageParser(Document, DOCUMENTS_DB_ID, DOCUMENT_FIELDS)
\ No newline at end of file
@@ -0,0 +1,182 @@
+import copy
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, Tuple
+
+from notion_client import Client
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+# Notion allows an average of 3 requests per second per integration
+DEFAULT_RATE_PER_SECOND = 3.0
+DEFAULT_BURST = 3
+DEFAULT_MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+
+# HTTP statuses worth retrying besides 429
+RETRYABLE_STATUSES = {500, 502, 503, 504}
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every Notion client in the process.
+
+    reserve() hands out a slot and returns how long the caller must wait for it,
+    so the same bucket can pace both blocking and asyncio callers.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token, returning the seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            # A negative balance is a queue of callers that have already reserved future tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> float:
+        """Block until a token is available, returning the time spent waiting"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for seconds, e.g. after a 429 with Retry-After"""
+        with self._lock:
+            self._refill(time.monotonic())
+            # Leave one token due exactly `seconds` from now
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+@dataclass
+class NotionClientStats:
+    requests: int = 0
+    throttled: int = 0
+    retried: int = 0
+    coalesced: int = 0
+    failed: int = 0
+    wait_seconds: float = 0.0
+
+_bucket = TokenBucket(
+    rate=float(os.getenv("NOTION_RATE_LIMIT_PER_SECOND", DEFAULT_RATE_PER_SECOND)),
+    burst=int(os.getenv("NOTION_RATE_LIMIT_BURST", DEFAULT_BURST))
+)
+_stats = NotionClientStats()
+_stats_lock = threading.Lock()
+
+def get_rate_limiter() -> TokenBucket:
+    """Get the process-wide Notion token bucket"""
+    return _bucket
+
+def record_stat(field: str, amount: float = 1) -> None:
+    """Add amount to one of the process-wide NotionClientStats counters"""
+    with _stats_lock:
+        setattr(_stats, field, getattr(_stats, field) + amount)
+
+def get_notion_client_stats() -> Dict[str, Any]:
+    """Snapshot of the process-wide Notion request counters"""
+    with _stats_lock:
+        return asdict(_stats)
+
+def reset_notion_client_stats() -> None:
+    global _stats
+    with _stats_lock:
+        _stats = NotionClientStats()
+
+def retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying after error, or None if it should not be retried"""
+    if isinstance(error, RequestTimeoutError):
+        pass
+    elif isinstance(error, HTTPResponseError):
+        if error.status != 429 and error.status not in RETRYABLE_STATUSES:
+            return None
+        retry_after = error.headers.get("retry-after") if error.headers else None
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    else:
+        return None
+    # Exponential backoff with jitter so concurrent callers don't retry in lockstep
+    return min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+class RateLimitedClient(Client):
+    """
+    notion_client.Client that paces every request through the process-wide token bucket,
+    retries 429s and transient 5xx/timeouts with Retry-After-aware exponential backoff,
+    and coalesces identical GETs that are already in flight on another thread.
+    """
+
+    def __init__(self, *args: Any, max_retries: Optional[int] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("NOTION_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+        self._in_flight: Dict[Tuple[str, str], Future] = {}
+        self._in_flight_lock = threading.Lock()
+
+    def request(self, path: str, method: str, query: Optional[Dict[Any, Any]] = None, body: Optional[Dict[Any, Any]] = None, **kwargs: Any) -> Any:
+        if method.upper() != "GET":
+            return self._request_with_retries(path, method, query, body, **kwargs)
+
+        key = (path, json.dumps(query, sort_keys=True, default=str))
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+
+        if not owner:
+            record_stat("coalesced")
+            # Callers may mutate the response, so each waiter gets its own copy
+            return copy.deepcopy(future.result())
+
+        try:
+            result = self._request_with_retries(path, method, query, body, **kwargs)
+            # Waiters copy from an untouched snapshot while the owner uses the original
+            future.set_result(copy.deepcopy(result))
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    def _request_with_retries(self, path: str, method: str, query: Optional[Dict[Any, Any]], body: Optional[Dict[Any, Any]], **kwargs: Any) -> Any:
+        attempt = 0
+        while True:
+            record_stat("wait_seconds", _bucket.acquire())
+            record_stat("requests")
+            try:
+                return super().request(path, method, query, body, **kwargs)
+            except Exception as e:
+                throttled = isinstance(e, HTTPResponseError) and e.status == 429
+                if throttled:
+                    record_stat("throttled")
+                delay = retry_delay(e, attempt)
+                if delay is None or attempt >= self.max_retries:
+                    record_stat("failed")
+                    raise
+                record_stat("retried")
+                attempt += 1
+                if throttled:
+                    # Everyone sharing the bucket backs off, not just this caller;
+                    # the next acquire() waits out the pause
+                    _bucket.pause(delay)
+                else:
+                    time.sleep(delay)
\ No newline at end of file
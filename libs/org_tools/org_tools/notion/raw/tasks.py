@@ -1,23 +1,111 @@
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Callable
 from datetime import datetime
 
 from .types import (
     TaskID, EventProjectID, TeamID, Person,
     Task, TaskStatus, TaskPriority,
-    NotionDate, RichText,
+    NotionDate, RichText, BulkTaskResult,
     TaskProperties, TASKS_DB_ID
 )
 from .client import (
-    get_notion_client,
+    get_notion_client, build_filter, query_database,
     format_date_for_notion, format_rich_text_for_notion, format_people_for_notion, format_relation_for_notion,
-    parse_date_from_notion, parse_rich_text_from_notion, parse_people_from_notion, parse_relation_from_notion,
-    get_select_enum_value, get_notion_id_from_enum
+    get_notion_id_from_enum
 )
+from .parser import get_task_parser
+
+# Requests the bulk helpers keep in flight; the shared token bucket still paces them
+DEFAULT_BULK_CONCURRENCY = 4
 
 class TaskCRUDError(Exception):
     """Exception for Tasks CRUD operations"""
     pass
 
+def _task_create_properties(
+    name: str,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    description: Optional[List[RichText]] = None,
+    task_progress: Optional[List[RichText]] = None,
+    due_dates: Optional[NotionDate] = None,
+    in_charge: Optional[List[Person]] = None,
+    event_project: Optional[List[EventProjectID]] = None,
+    team: Optional[List[TeamID]] = None,
+    parent_task: Optional[List[TaskID]] = None,
+    sub_task: Optional[List[TaskID]] = None,
+    blocking: Optional[List[TaskID]] = None,
+    blocked_by: Optional[List[TaskID]] = None
+) -> Dict[str, Any]:
+    """Build the page properties for create_task"""
+    properties = {
+        TaskProperties.NAME: {
+            "title": [{"text": {"content": name}}]
+        }
+    }
+    
+    if status:
+        properties[TaskProperties.STATUS] = {
+            "status": {"id": get_notion_id_from_enum(status)}
+        }
+    
+    if priority:
+        properties[TaskProperties.PRIORITY] = {
+            "select": {"id": get_notion_id_from_enum(priority)}
+        }
+    
+    if description:
+        properties[TaskProperties.DESCRIPTION] = {
+            "rich_text": format_rich_text_for_notion(description)
+        }
+    
+    if task_progress:
+        properties[TaskProperties.TASK_PROGRESS] = {
+            "rich_text": format_rich_text_for_notion(task_progress)
+        }
+    
+    if due_dates:
+        date_obj = format_date_for_notion(due_dates)
+        if date_obj:
+            properties[TaskProperties.DUE_DATES] = {"date": date_obj}
+    
+    if in_charge:
+        properties[TaskProperties.IN_CHARGE] = {
+            "people": format_people_for_notion(in_charge)
+        }
+    
+    if event_project:
+        properties[TaskProperties.EVENT_PROJECT] = {
+            "relation": format_relation_for_notion(event_project)
+        }
+    
+    if team:
+        properties[TaskProperties.TEAM] = {
+            "relation": format_relation_for_notion(team)
+        }
+    
+    if parent_task:
+        properties[TaskProperties.PARENT_TASK] = {
+            "relation": format_relation_for_notion(parent_task)
+        }
+    
+    if sub_task:
+        properties[TaskProperties.SUB_TASK] = {
+            "relation": format_relation_for_notion(sub_task)
+        }
+    
+    if blocking:
+        properties[TaskProperties.BLOCKING] = {
+            "relation": format_relation_for_notion(blocking)
+        }
+    
+    if blocked_by:
+        properties[TaskProperties.BLOCKED_BY] = {
+            "relation": format_relation_for_notion(blocked_by)
+        }
+    
+    return properties
+
 def create_task(
     name: str,
     status: Optional[TaskStatus] = None,
@@ -37,71 +125,21 @@ def create_task(
     try:
         client = get_notion_client()
         
-        properties = {
-            TaskProperties.NAME: {
-                "title": [{"text": {"content": name}}]
-            }
-        }
-        
-        if status:
-            properties[TaskProperties.STATUS] = {
-                "status": {"id": get_notion_id_from_enum(status)}
-            }
-        
-        if priority:
-            properties[TaskProperties.PRIORITY] = {
-                "select": {"id": get_notion_id_from_enum(priority)}
-            }
-        
-        if description:
-            properties[TaskProperties.DESCRIPTION] = {
-                "rich_text": format_rich_text_for_notion(description)
-            }
-        
-        if task_progress:
-            properties[TaskProperties.TASK_PROGRESS] = {
-                "rich_text": format_rich_text_for_notion(task_progress)
-            }
-        
-        if due_dates:
-            date_obj = format_date_for_notion(due_dates)
-            if date_obj:
-                properties[TaskProperties.DUE_DATES] = {"date": date_obj}
-        
-        if in_charge:
-            properties[TaskProperties.IN_CHARGE] = {
-                "people": format_people_for_notion(in_charge)
-            }
-        
-        if event_project:
-            properties[TaskProperties.EVENT_PROJECT] = {
-                "relation": format_relation_for_notion(event_project)
-            }
-        
-        if team:
-            properties[TaskProperties.TEAM] = {
-                "relation": format_relation_for_notion(team)
-            }
-        
-        if parent_task:
-            properties[TaskProperties.PARENT_TASK] = {
-                "relation": format_relation_for_notion(parent_task)
-            }
-        
-        if sub_task:
-            properties[TaskProperties.SUB_TASK] = {
-                "relation": format_relation_for_notion(sub_task)
-            }
-        
-        if blocking:
-            properties[TaskProperties.BLOCKING] = {
-                "relation": format_relation_for_notion(blocking)
-            }
-        
-        if blocked_by:
-            properties[TaskProperties.BLOCKED_BY] = {
-                "relation": format_relation_for_notion(blocked_by)
-            }
+        properties = _task_create_properties(
+            name,
+            status,
+            priority,
+            description,
+            task_progress,
+            due_dates,
+            in_charge,
+            event_project,
+            team,
+            parent_task,
+            sub_task,
+            blocking,
+            blocked_by
+        )
         
         response = client.pages.create(
             parent={"database_id": TASKS_DB_ID},
@@ -113,6 +151,10 @@ def create_task(
     except Exception as e:
         raise TaskCRUDError(f"Failed to create task: {str(e)}")
 
+def _parse_task_page(page: Dict[str, Any]) -> Task:
+    """Parse a raw Notion page into a Task"""
+    return get_task_parser()(page)
+
 def get_task(task_id: TaskID) -> Optional[Task]:
     """Get a task by ID"""
     try:
@@ -122,28 +164,95 @@ def get_task(task_id: TaskID) -> Optional[Task]:
         if not response:
             return None
         
-        props = response["properties"]
-        
-        return Task(
-            id=TaskID(response["id"]),
-            name=props.get(TaskProperties.NAME, {}).get("title", [{}])[0].get("text", {}).get("content", ""),
-            status=get_select_enum_value(TaskStatus, props.get(TaskProperties.STATUS, {}).get("status", {}).get("id", "")),
-            priority=get_select_enum_value(TaskPriority, props.get(TaskProperties.PRIORITY, {}).get("select", {}).get("id", "")),
-            description=parse_rich_text_from_notion(props.get(TaskProperties.DESCRIPTION, {}).get("rich_text", [])),
-            task_progress=parse_rich_text_from_notion(props.get(TaskProperties.TASK_PROGRESS, {}).get("rich_text", [])),
-            due_dates=parse_date_from_notion(props.get(TaskProperties.DUE_DATES, {}).get("date")),
-            in_charge=parse_people_from_notion(props.get(TaskProperties.IN_CHARGE, {}).get("people", [])),
-            event_project=[EventProjectID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.EVENT_PROJECT, {}).get("relation", []))],
-            team=[TeamID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.TEAM, {}).get("relation", []))],
-            parent_task=[TaskID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.PARENT_TASK, {}).get("relation", []))],
-            sub_task=[TaskID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.SUB_TASK, {}).get("relation", []))],
-            blocking=[TaskID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.BLOCKING, {}).get("relation", []))],
-            blocked_by=[TaskID(id_) for id_ in parse_relation_from_notion(props.get(TaskProperties.BLOCKED_BY, {}).get("relation", []))]
-        )
+        return _parse_task_page(response)
     
     except Exception as e:
         raise TaskCRUDError(f"Failed to get task: {str(e)}")
 
+def _task_update_properties(
+    name: Optional[str] = None,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    description: Optional[List[RichText]] = None,
+    task_progress: Optional[List[RichText]] = None,
+    due_dates: Optional[NotionDate] = None,
+    in_charge: Optional[List[Person]] = None,
+    event_project: Optional[List[EventProjectID]] = None,
+    team: Optional[List[TeamID]] = None,
+    parent_task: Optional[List[TaskID]] = None,
+    sub_task: Optional[List[TaskID]] = None,
+    blocking: Optional[List[TaskID]] = None,
+    blocked_by: Optional[List[TaskID]] = None
+) -> Dict[str, Any]:
+    """Build the page properties for update_task"""
+    properties = {}
+    
+    if name is not None:
+        properties[TaskProperties.NAME] = {
+            "title": [{"text": {"content": name}}]
+        }
+    
+    if status is not None:
+        properties[TaskProperties.STATUS] = {
+            "status": {"id": get_notion_id_from_enum(status)} if status else None
+        }
+    
+    if priority is not None:
+        properties[TaskProperties.PRIORITY] = {
+            "select": {"id": get_notion_id_from_enum(priority)} if priority else None
+        }
+    
+    if description is not None:
+        properties[TaskProperties.DESCRIPTION] = {
+            "rich_text": format_rich_text_for_notion(description)
+        }
+    
+    if task_progress is not None:
+        properties[TaskProperties.TASK_PROGRESS] = {
+            "rich_text": format_rich_text_for_notion(task_progress)
+        }
+    
+    if due_dates is not None:
+        date_obj = format_date_for_notion(due_dates)
+        properties[TaskProperties.DUE_DATES] = {"date": date_obj}
+    
+    if in_charge is not None:
+        properties[TaskProperties.IN_CHARGE] = {
+            "people": format_people_for_notion(in_charge)
+        }
+    
+    if event_project is not None:
+        properties[TaskProperties.EVENT_PROJECT] = {
+            "relation": format_relation_for_notion(event_project)
+        }
+    
+    if team is not None:
+        properties[TaskProperties.TEAM] = {
+            "relation": format_relation_for_notion(team)
+        }
+    
+    if parent_task is not None:
+        properties[TaskProperties.PARENT_TASK] = {
+            "relation": format_relation_for_notion(parent_task)
+        }
+    
+    if sub_task is not None:
+        properties[TaskProperties.SUB_TASK] = {
+            "relation": format_relation_for_notion(sub_task)
+        }
+    
+    if blocking is not None:
+        properties[TaskProperties.BLOCKING] = {
+            "relation": format_relation_for_notion(blocking)
+        }
+    
+    if blocked_by is not None:
+        properties[TaskProperties.BLOCKED_BY] = {
+            "relation": format_relation_for_notion(blocked_by)
+        }
+    
+    return properties
+
 def update_task(
     task_id: TaskID,
     name: Optional[str] = None,
@@ -164,71 +273,21 @@ def update_task(
     try:
         client = get_notion_client()
         
-        properties = {}
-        
-        if name is not None:
-            properties[TaskProperties.NAME] = {
-                "title": [{"text": {"content": name}}]
-            }
-        
-        if status is not None:
-            properties[TaskProperties.STATUS] = {
-                "status": {"id": get_notion_id_from_enum(status)} if status else None
-            }
-        
-        if priority is not None:
-            properties[TaskProperties.PRIORITY] = {
-                "select": {"id": get_notion_id_from_enum(priority)} if priority else None
-            }
-        
-        if description is not None:
-            properties[TaskProperties.DESCRIPTION] = {
-                "rich_text": format_rich_text_for_notion(description)
-            }
-        
-        if task_progress is not None:
-            properties[TaskProperties.TASK_PROGRESS] = {
-                "rich_text": format_rich_text_for_notion(task_progress)
-            }
-        
-        if due_dates is not None:
-            date_obj = format_date_for_notion(due_dates)
-            properties[TaskProperties.DUE_DATES] = {"date": date_obj}
-        
-        if in_charge is not None:
-            properties[TaskProperties.IN_CHARGE] = {
-                "people": format_people_for_notion(in_charge)
-            }
-        
-        if event_project is not None:
-            properties[TaskProperties.EVENT_PROJECT] = {
-                "relation": format_relation_for_notion(event_project)
-            }
-        
-        if team is not None:
-            properties[TaskProperties.TEAM] = {
-                "relation": format_relation_for_notion(team)
-            }
-        
-        if parent_task is not None:
-            properties[TaskProperties.PARENT_TASK] = {
-                "relation": format_relation_for_notion(parent_task)
-            }
-        
-        if sub_task is not None:
-            properties[TaskProperties.SUB_TASK] = {
-                "relation": format_relation_for_notion(sub_task)
-            }
-        
-        if blocking is not None:
-            properties[TaskProperties.BLOCKING] = {
-                "relation": format_relation_for_notion(blocking)
-            }
-        
-        if blocked_by is not None:
-            properties[TaskProperties.BLOCKED_BY] = {
-                "relation": format_relation_for_notion(blocked_by)
-            }
+        properties = _task_update_properties(
+            name,
+            status,
+            priority,
+            description,
+            task_progress,
+            due_dates,
+            in_charge,
+            event_project,
+            team,
+            parent_task,
+            sub_task,
+            blocking,
+            blocked_by
+        )
         
         client.pages.update(
             page_id=task_id,
@@ -240,6 +299,41 @@ def update_task(
     except Exception as e:
         raise TaskCRUDError(f"Failed to update task: {str(e)}")
 
+def _bulk_task_result(index: int, operation: Callable[..., Any], item: Dict[str, Any]) -> BulkTaskResult:
+    """Run one bulk item, capturing its failure instead of raising"""
+    try:
+        result = operation(**item)
+        task_id = result if isinstance(result, str) else item.get("task_id")
+        return BulkTaskResult(index=index, success=True, task_id=task_id)
+    except Exception as e:
+        return BulkTaskResult(index=index, success=False, task_id=item.get("task_id"), error=str(e))
+
+def _run_bulk(operation: Callable[..., Any], items: List[Dict[str, Any]], max_concurrency: int) -> List[BulkTaskResult]:
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(items)))) as pool:
+        return list(pool.map(lambda indexed: _bulk_task_result(indexed[0], operation, indexed[1]), enumerate(items)))
+
+def bulk_create_tasks(
+    tasks: List[Dict[str, Any]],
+    max_concurrency: int = DEFAULT_BULK_CONCURRENCY
+) -> List[BulkTaskResult]:
+    """
+    Create several tasks concurrently. Each item holds create_task keyword arguments;
+    results come back in input order, and one failed item doesn't stop the others.
+    """
+    return _run_bulk(create_task, tasks, max_concurrency)
+
+def bulk_update_tasks(
+    updates: List[Dict[str, Any]],
+    max_concurrency: int = DEFAULT_BULK_CONCURRENCY
+) -> List[BulkTaskResult]:
+    """
+    Update several tasks concurrently. Each item holds update_task keyword arguments including
+    task_id; results come back in input order, and one failed item doesn't stop the others.
+    """
+    return _run_bulk(update_task, updates, max_concurrency)
+
 def delete_task(task_id: TaskID) -> bool:
     """Delete a task (archive it)"""
     try:
@@ -253,79 +347,77 @@ def delete_task(task_id: TaskID) -> bool:
     except Exception as e:
         raise TaskCRUDError(f"Failed to delete task: {str(e)}")
 
-def query_tasks(
+def _task_query_filter(
     status: Optional[TaskStatus] = None,
     priority: Optional[TaskPriority] = None,
     in_charge: Optional[List[Person]] = None,
     event_project: Optional[List[EventProjectID]] = None,
-    team: Optional[List[TeamID]] = None,
-    limit: Optional[int] = None
-) -> List[Task]:
-    """Query tasks with filters"""
-    try:
-        client = get_notion_client()
-        
-        filter_conditions = []
-        
-        if status:
+    team: Optional[List[TeamID]] = None
+) -> Optional[Dict[str, Any]]:
+    """Build the database filter for query_tasks"""
+    filter_conditions = []
+    
+    if status:
+        filter_conditions.append({
+            "property": TaskProperties.STATUS,
+            "status": {"equals": get_notion_id_from_enum(status)}
+        })
+    
+    if priority:
+        filter_conditions.append({
+            "property": TaskProperties.PRIORITY,
+            "select": {"equals": get_notion_id_from_enum(priority)}
+        })
+    
+    if in_charge:
+        for person in in_charge:
             filter_conditions.append({
-                "property": TaskProperties.STATUS,
-                "status": {"equals": get_notion_id_from_enum(status)}
+                "property": TaskProperties.IN_CHARGE,
+                "people": {"contains": person.id}
             })
-        
-        if priority:
+    
+    if event_project:
+        for project_id in event_project:
             filter_conditions.append({
-                "property": TaskProperties.PRIORITY,
-                "select": {"equals": get_notion_id_from_enum(priority)}
+                "property": TaskProperties.EVENT_PROJECT,
+                "relation": {"contains": project_id}
             })
+    
+    if team:
+        for team_id in team:
+            filter_conditions.append({
+                "property": TaskProperties.TEAM,
+                "relation": {"contains": team_id}
+            })
+    
+    return build_filter(filter_conditions)
+
+def query_tasks(
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    in_charge: Optional[List[Person]] = None,
+    event_project: Optional[List[EventProjectID]] = None,
+    team: Optional[List[TeamID]] = None,
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None
+) -> List[Task]:
+    """Query tasks with filters, following pagination and parsing rows from the query response"""
+    try:
+        query_filter = _task_query_filter(
+            status,
+            priority,
+            in_charge,
+            event_project,
+            team
+        )
         
-        if in_charge:
-            for person in in_charge:
-                filter_conditions.append({
-                    "property": TaskProperties.IN_CHARGE,
-                    "people": {"contains": person.id}
-                })
-        
-        if event_project:
-            for project_id in event_project:
-                filter_conditions.append({
-                    "property": TaskProperties.EVENT_PROJECT,
-                    "relation": {"contains": project_id}
-                })
-        
-        if team:
-            for team_id in team:
-                filter_conditions.append({
-                    "property": TaskProperties.TEAM,
-                    "relation": {"contains": team_id}
-                })
-        
-        filter_obj = None
-        if filter_conditions:
-            if len(filter_conditions) == 1:
-                filter_obj = filter_conditions[0]
-            else:
-                filter_obj = {"and": filter_conditions}
-        
-        query_params = {
-            "database_id": TASKS_DB_ID
-        }
-        
-        if filter_obj:
-            query_params["filter"] = filter_obj
-        
-        if limit:
-            query_params["page_size"] = limit
-        
-        response = client.databases.query(**query_params)
-        
-        results = []
-        for page in response["results"]:
-            task = get_task(TaskID(page["id"]))
-            if task:
-                results.append(task)
-        
-        return results
+        return query_database(
+            TASKS_DB_ID,
+            _parse_task_page,
+            filter=query_filter,
+            limit=limit,
+            use_mirror=use_mirror
+        )
     
     except Exception as e:
         raise TaskCRUDError(f"Failed to query tasks: {str(e)}")
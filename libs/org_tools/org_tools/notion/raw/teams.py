@@ -1,19 +1,61 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 
 from .types import (
     TeamID, EventProjectID, DocumentID, Person,
     Team, TeamProperties, TEAMS_DB_ID
 )
 from .client import (
-    get_notion_client,
-    format_people_for_notion, format_relation_for_notion,
-    parse_people_from_notion, parse_relation_from_notion
+    get_notion_client, build_filter, query_database,
+    format_people_for_notion, format_relation_for_notion
 )
+from .parser import get_team_parser
 
 class TeamCRUDError(Exception):
     """Exception for Teams CRUD operations"""
     pass
 
+def _team_create_properties(
+    name: str,
+    person: Optional[List[Person]] = None,
+    cover: Optional[List[str]] = None,
+    events_projects: Optional[List[EventProjectID]] = None,
+    committee: Optional[List[str]] = None,
+    document: Optional[List[DocumentID]] = None
+) -> Dict[str, Any]:
+    """Build the page properties for create_team"""
+    properties = {
+        TeamProperties.NAME: {
+            "title": [{"text": {"content": name}}]
+        }
+    }
+    
+    if person:
+        properties[TeamProperties.PERSON] = {
+            "people": format_people_for_notion(person)
+        }
+    
+    if cover:
+        properties[TeamProperties.COVER] = {
+            "files": [{"name": file_name} for file_name in cover]
+        }
+    
+    if events_projects:
+        properties[TeamProperties.EVENTS_PROJECTS] = {
+            "relation": format_relation_for_notion(events_projects)
+        }
+    
+    if committee:
+        properties[TeamProperties.COMMITTEE] = {
+            "relation": format_relation_for_notion(committee)
+        }
+    
+    if document:
+        properties[TeamProperties.DOCUMENT] = {
+            "relation": format_relation_for_notion(document)
+        }
+    
+    return properties
+
 def create_team(
     name: str,
     person: Optional[List[Person]] = None,
@@ -26,36 +68,14 @@ def create_team(
     try:
         client = get_notion_client()
         
-        properties = {
-            TeamProperties.NAME: {
-                "title": [{"text": {"content": name}}]
-            }
-        }
-        
-        if person:
-            properties[TeamProperties.PERSON] = {
-                "people": format_people_for_notion(person)
-            }
-        
-        if cover:
-            properties[TeamProperties.COVER] = {
-                "files": [{"name": file_name} for file_name in cover]
-            }
-        
-        if events_projects:
-            properties[TeamProperties.EVENTS_PROJECTS] = {
-                "relation": format_relation_for_notion(events_projects)
-            }
-        
-        if committee:
-            properties[TeamProperties.COMMITTEE] = {
-                "relation": format_relation_for_notion(committee)
-            }
-        
-        if document:
-            properties[TeamProperties.DOCUMENT] = {
-                "relation": format_relation_for_notion(document)
-            }
+        properties = _team_create_properties(
+            name,
+            person,
+            cover,
+            events_projects,
+            committee,
+            document
+        )
         
         response = client.pages.create(
             parent={"database_id": TEAMS_DB_ID},
@@ -67,6 +87,10 @@ def create_team(
     except Exception as e:
         raise TeamCRUDError(f"Failed to create team: {str(e)}")
 
+def _parse_team_page(page: Dict[str, Any]) -> Team:
+    """Parse a raw Notion page into a Team"""
+    return get_team_parser()(page)
+
 def get_team(team_id: TeamID) -> Optional[Team]:
     """Get a team by ID"""
     try:
@@ -76,21 +100,54 @@ def get_team(team_id: TeamID) -> Optional[Team]:
         if not response:
             return None
         
-        props = response["properties"]
-        
-        return Team(
-            id=TeamID(response["id"]),
-            name=props.get(TeamProperties.NAME, {}).get("title", [{}])[0].get("text", {}).get("content", ""),
-            person=parse_people_from_notion(props.get(TeamProperties.PERSON, {}).get("people", [])),
-            cover=[file_obj.get("name", "") for file_obj in props.get(TeamProperties.COVER, {}).get("files", [])],
-            events_projects=[EventProjectID(id_) for id_ in parse_relation_from_notion(props.get(TeamProperties.EVENTS_PROJECTS, {}).get("relation", []))],
-            committee=parse_relation_from_notion(props.get(TeamProperties.COMMITTEE, {}).get("relation", [])),
-            document=[DocumentID(id_) for id_ in parse_relation_from_notion(props.get(TeamProperties.DOCUMENT, {}).get("relation", []))]
-        )
+        return _parse_team_page(response)
     
     except Exception as e:
         raise TeamCRUDError(f"Failed to get team: {str(e)}")
 
+def _team_update_properties(
+    name: Optional[str] = None,
+    person: Optional[List[Person]] = None,
+    cover: Optional[List[str]] = None,
+    events_projects: Optional[List[EventProjectID]] = None,
+    committee: Optional[List[str]] = None,
+    document: Optional[List[DocumentID]] = None
+) -> Dict[str, Any]:
+    """Build the page properties for update_team"""
+    properties = {}
+    
+    if name is not None:
+        properties[TeamProperties.NAME] = {
+            "title": [{"text": {"content": name}}]
+        }
+    
+    if person is not None:
+        properties[TeamProperties.PERSON] = {
+            "people": format_people_for_notion(person)
+        }
+    
+    if cover is not None:
+        properties[TeamProperties.COVER] = {
+            "files": [{"name": file_name} for file_name in cover]
+        }
+    
+    if events_projects is not None:
+        properties[TeamProperties.EVENTS_PROJECTS] = {
+            "relation": format_relation_for_notion(events_projects)
+        }
+    
+    if committee is not None:
+        properties[TeamProperties.COMMITTEE] = {
+            "relation": format_relation_for_notion(committee)
+        }
+    
+    if document is not None:
+        properties[TeamProperties.DOCUMENT] = {
+            "relation": format_relation_for_notion(document)
+        }
+    
+    return properties
+
 def update_team(
     team_id: TeamID,
     name: Optional[str] = None,
@@ -104,37 +161,14 @@ def update_team(
     try:
         client = get_notion_client()
         
-        properties = {}
-        
-        if name is not None:
-            properties[TeamProperties.NAME] = {
-                "title": [{"text": {"content": name}}]
-            }
-        
-        if person is not None:
-            properties[TeamProperties.PERSON] = {
-                "people": format_people_for_notion(person)
-            }
-        
-        if cover is not None:
-            properties[TeamProperties.COVER] = {
-                "files": [{"name": file_name} for file_name in cover]
-            }
-        
-        if events_projects is not None:
-            properties[TeamProperties.EVENTS_PROJECTS] = {
-                "relation": format_relation_for_notion(events_projects)
-            }
-        
-        if committee is not None:
-            properties[TeamProperties.COMMITTEE] = {
-                "relation": format_relation_for_notion(committee)
-            }
-        
-        if document is not None:
-            properties[TeamProperties.DOCUMENT] = {
-                "relation": format_relation_for_notion(document)
-            }
+        properties = _team_update_properties(
+            name,
+            person,
+            cover,
+            events_projects,
+            committee,
+            document
+        )
         
         client.pages.update(
             page_id=team_id,
@@ -159,57 +193,49 @@ def delete_team(team_id: TeamID) -> bool:
     except Exception as e:
         raise TeamCRUDError(f"Failed to delete team: {str(e)}")
 
+def _team_query_filter(
+    person: Optional[List[Person]] = None,
+    events_projects: Optional[List[EventProjectID]] = None
+) -> Optional[Dict[str, Any]]:
+    """Build the database filter for query_teams"""
+    filter_conditions = []
+    
+    if person:
+        for p in person:
+            filter_conditions.append({
+                "property": TeamProperties.PERSON,
+                "people": {"contains": p.id}
+            })
+    
+    if events_projects:
+        for project_id in events_projects:
+            filter_conditions.append({
+                "property": TeamProperties.EVENTS_PROJECTS,
+                "relation": {"contains": project_id}
+            })
+    
+    return build_filter(filter_conditions)
+
 def query_teams(
     person: Optional[List[Person]] = None,
     events_projects: Optional[List[EventProjectID]] = None,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    use_mirror: Optional[bool] = None
 ) -> List[Team]:
-    """Query teams with filters"""
+    """Query teams with filters, following pagination and parsing rows from the query response"""
     try:
-        client = get_notion_client()
-        
-        filter_conditions = []
-        
-        if person:
-            for p in person:
-                filter_conditions.append({
-                    "property": TeamProperties.PERSON,
-                    "people": {"contains": p.id}
-                })
-        
-        if events_projects:
-            for project_id in events_projects:
-                filter_conditions.append({
-                    "property": TeamProperties.EVENTS_PROJECTS,
-                    "relation": {"contains": project_id}
-                })
-        
-        filter_obj = None
-        if filter_conditions:
-            if len(filter_conditions) == 1:
-                filter_obj = filter_conditions[0]
-            else:
-                filter_obj = {"and": filter_conditions}
-        
-        query_params = {
-            "database_id": TEAMS_DB_ID
-        }
-        
-        if filter_obj:
-            query_params["filter"] = filter_obj
-        
-        if limit:
-            query_params["page_size"] = limit
-        
-        response = client.databases.query(**query_params)
-        
-        results = []
-        for page in response["results"]:
-            team = get_team(TeamID(page["id"]))
-            if team:
-                results.append(team)
+        query_filter = _team_query_filter(
+            person,
+            events_projects
+        )
         
-        return results
+        return query_database(
+            TEAMS_DB_ID,
+            _parse_team_page,
+            filter=query_filter,
+            limit=limit,
+            use_mirror=use_mirror
+        )
     
     except Exception as e:
         raise TeamCRUDError(f"Failed to query teams: {str(e)}")
@@ -214,4 +214,11 @@ class Document:
     parent_item: Optional[List[DocumentID]] = None
     sub_item: Optional[List[DocumentID]] = None
     google_drive_file: Optional[List[str]] = None
-    pinned: Optional[bool] = None
\ No newline at end of file
+    pinned: Optional[bool] = None
+
+@dataclass
+class BulkTaskResult:
+    index: int
+    success: bool
+    task_id: Optional[TaskID] = None
+    error: Optional[str] = None
\ No newline at end of file